@@ -18,8 +18,87 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
 Native = BaseInterface
 OptionalFields = Union[str, Iterable, None]
 
+CLASS_META_CACHE_ATTRIBUTE = '_class_meta_cache'
+
+
+class ClassMeta:
+    """Constructor arguments and meta fields names of one class, calculated once per class.
+
+    Member-to-field mapping is memorized by member names, other properties are calculated on first request.
+    """
+
+    def __init__(self, cls: type):
+        self._cls = cls
+        spec = getfullargspec(cls.__init__)
+        self._init_args = tuple(spec.args or tuple())
+        self._init_args_set = frozenset(self._init_args)
+        defaults = spec.defaults or tuple()
+        no_default_count = len(self._init_args) - len(defaults)
+        self._init_defaults = dict(zip(self._init_args[no_default_count:], defaults))
+        self._init_types = dict(spec.annotations)
+        self._field_names = dict()
+        self._data_fields = None
+        self._dynamic_meta_fields = None
+
+    def get_init_args(self) -> tuple:
+        return self._init_args
+
+    def is_init_arg(self, name: str) -> bool:
+        return name in self._init_args_set
+
+    def get_init_defaults(self) -> dict:
+        return self._init_defaults
+
+    def get_init_types(self) -> dict:
+        return self._init_types
+
+    def get_field_name(self, member_name: str) -> str:
+        field_name = self._field_names.get(member_name)
+        if field_name is None:
+            field_name = self._cls._get_meta_field_by_member_name(member_name)
+            self._field_names[member_name] = field_name
+        return field_name
+
+    def get_data_fields(self) -> tuple:
+        if self._data_fields is None:
+            self._data_fields = tuple(map(self.get_field_name, self._cls._get_data_member_names()))
+        return self._data_fields
+
+    def get_dynamic_meta_fields(self) -> tuple:
+        if self._dynamic_meta_fields is None:
+            if hasattr(self._cls, '_get_dynamic_meta_fields'):
+                self._dynamic_meta_fields = tuple(self._cls._get_dynamic_meta_fields())
+            else:
+                self._dynamic_meta_fields = tuple()
+        return self._dynamic_meta_fields
+
+
+class ClassMetaDescriptor:
+    """Returns ClassMeta of owner class (not inherited from parent class), calculated on first access."""
+
+    def __get__(self, instance, owner: type) -> ClassMeta:
+        class_meta = owner.__dict__.get(CLASS_META_CACHE_ATTRIBUTE)
+        if class_meta is None:
+            class_meta = ClassMeta(owner)
+            setattr(owner, CLASS_META_CACHE_ATTRIBUTE, class_meta)
+        return class_meta
+
 
 class AbstractBaseObject(BaseInterface, ABC):
+    _class_meta = ClassMetaDescriptor()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._reset_class_meta()
+
+    @classmethod
+    def _reset_class_meta(cls) -> None:
+        setattr(cls, CLASS_META_CACHE_ATTRIBUTE, None)
+
+    @classmethod
+    def _get_class_meta(cls) -> ClassMeta:
+        return cls._class_meta
+
     def set_props(self, inplace: bool, **kwargs) -> Native:
         if inplace:
             return self.set_inplace(**kwargs)
@@ -70,7 +149,7 @@ class AbstractBaseObject(BaseInterface, ABC):
 
     @classmethod
     def _get_data_fields_list(cls) -> list:
-        return [cls._get_meta_field_by_member_name(m) for m in cls._get_data_member_names()]
+        return list(cls._get_class_meta().get_data_fields())
 
     def _get_data_member_items(self) -> Iterable:
         for k in self._get_data_member_names():
@@ -103,8 +182,9 @@ class AbstractBaseObject(BaseInterface, ABC):
     def get_props(self, ex: OptionalFields = None, check: bool = True) -> dict:
         props = dict()
         ex_list = get_list(ex)
+        class_meta = self._get_class_meta()
         for k, v in self.__dict__.items():
-            k = self._get_meta_field_by_member_name(k)
+            k = class_meta.get_field_name(k)
             if k in ex_list:
                 ex_list.remove(k)
             else:
@@ -115,7 +195,7 @@ class AbstractBaseObject(BaseInterface, ABC):
 
     def get_meta(self, ex: OptionalFields = None) -> dict:
         ex_list = get_list(ex)
-        ex_list += self._get_data_fields_list()
+        ex_list += self._get_class_meta().get_data_fields()
         meta = self.get_props(ex=ex_list)
         return meta
 
@@ -180,20 +260,18 @@ class AbstractBaseObject(BaseInterface, ABC):
 
     @classmethod
     def _get_safe_meta(cls, **meta) -> dict:
-        return {k: v for k, v in meta.items() if k in cls._get_init_args()}
+        class_meta = cls._get_class_meta()
+        return {k: v for k, v in meta.items() if class_meta.is_init_arg(k)}
 
     @classmethod
     def _get_init_args(cls) -> list:
-        return getfullargspec(cls.__init__).args or list()
+        return list(cls._get_class_meta().get_init_args())
 
     def _get_init_defaults(self) -> dict:
-        args = self._get_init_args()
-        defaults = getfullargspec(self.__init__).defaults or list()
-        no_default_count = len(args) - len(defaults)
-        return dict(zip(args[no_default_count:], defaults))
+        return self._get_class_meta().get_init_defaults().copy()
 
     def _get_init_types(self) -> dict:
-        return getfullargspec(self.__init__).annotations
+        return self._get_class_meta().get_init_types().copy()
 
     @staticmethod
     def _get_covert_props() -> tuple:
@@ -214,20 +292,20 @@ class AbstractBaseObject(BaseInterface, ABC):
 
     def get_meta_defaults(self, ex: OptionalFields = None) -> Generator:
         meta = self.get_meta(ex=ex)
-        args = getfullargspec(self.__init__).args
-        defaults = getfullargspec(self.__init__).defaults
-        for k, v in zip(args, defaults):
+        class_meta = self._get_class_meta()
+        for k, v in class_meta.get_init_defaults().items():
             if k in meta:
                 yield k, v
         for k in meta:
-            if k not in args:
+            if not class_meta.is_init_arg(k):
                 yield None
 
     def get_meta_records(self, ex: OptionalFields = None) -> Generator:
         init_defaults = self._get_init_defaults()
+        init_types = self._get_init_types()
         for key, value in self.get_meta_items(ex=ex):
             actual_type = type(value).__name__
-            expected_type = self._get_init_types().get(key)
+            expected_type = init_types.get(key)
             if hasattr(expected_type, '__name__'):
                 expected_type = expected_type.__name__
             else:
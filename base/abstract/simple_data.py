@@ -87,7 +87,7 @@ class SimpleDataWrapper(AbstractNamed, DataMixin, SimpleDataInterface, ABC):
 
     def get_static_meta(self, ex: OptionalFields = None) -> dict:
         meta = self.get_meta(ex=ex)
-        for f in self._get_dynamic_meta_fields():
+        for f in self._get_class_meta().get_dynamic_meta_fields():
             meta.pop(f, None)
         return meta
 
@@ -161,6 +161,9 @@ class DynamicEnum(EnumItem):
                 msg = f'{cls.__name__}({str_args}): {e}'
                 raise ValueError(msg)
 
+    def __reduce__(self):  # unpickled items are converted to existing instances of prepared enum
+        return self.__class__, (self.get_name(), )
+
     @classmethod
     def is_prepared(cls) -> bool:
         return cls._enum_prepared.get(cls.get_enum_name(), False)
@@ -57,6 +57,10 @@ class ContextInterface(BaseInterface, ABC):
     def get_selection_logger(self, *args, **kwargs) -> SelectionLoggerInterface:
         pass
 
+    @abstractmethod
+    def get_memory_budget(self):
+        pass
+
     @abstractmethod
     def get_new_selection_logger(self, name: Name, **kwargs) -> SelectionLoggerInterface:
         pass
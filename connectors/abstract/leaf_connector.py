@@ -217,6 +217,12 @@ class LeafConnector(
         self._modification_ts = timestamp
         return self
 
+    def get_fingerprint(self, content_hash: bool = False) -> dict:
+        if self.is_existing():
+            return dict(exists=True, modification_ts=self.get_modification_timestamp())
+        else:
+            return dict(exists=False)
+
     def get_expected_count(self) -> Count:
         return self._count
 
@@ -1,11 +1,17 @@
 from datetime import datetime
+import threading
+import os
 
 try:  # Assume we're a submodule in a package.
     from context import SnakeeContext
     from content.struct.flat_struct import FlatStruct, DialectType, AnyField
+    from functions.secondary import all_secondary_functions as fs
+    from connectors.storages import s3_object
 except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
     from ..context import SnakeeContext
     from ..content.struct.flat_struct import FlatStruct, DialectType, AnyField
+    from ..functions.secondary import all_secondary_functions as fs
+    from .storages import s3_object
 
 
 def test_detect_struct_by_title_row():
@@ -32,6 +38,51 @@ def test_local_file():
     assert received == data, f'test case 1: {received} vs {data}'
 
 
+def test_partitioned_local_file():
+    cx = SnakeeContext()
+    job_folder = cx.find_job_folder(required_folders=['test_tmp'])
+    test_folder = job_folder.folder('test_tmp')
+    days = ['2023-01-01', '2023-01-02', '2023-01-03', '2023-01-04']
+    for n, day in enumerate(days):
+        test_folder.file(f'test_part_{day}.tsv', struct=['day', 'n']).write_items(
+            [(day, str(i)) for i in range(n + 1)], item_type=cx.sm.ItemType.Row, verbose=False,
+        )
+    test_folder.file('test_part_2022-12-31.tsv', struct=['a']).write_lines(['broken', 'content'], verbose=False)
+    partitioned = test_folder.partitioned('test_part_{}.tsv')
+    partitioned.set_partition_key(lambda s: datetime.strptime(s, '%Y-%m-%d').date())
+    first_day = datetime(2023, 1, 1).date()
+    expected = [(day, str(i)) for n, day in enumerate(days) for i in range(n + 1)]
+    for workers, ordered in ((None, True), (3, True), (3, False)):
+        received = list(partitioned.get_items(
+            item_type=cx.sm.ItemType.Row, key_filter=lambda d: d >= first_day, workers=workers, ordered=ordered,
+        ))
+        received = [tuple(i) for i in received]
+        if not ordered:
+            received = sorted(received)
+        assert received == expected, f'test case workers={workers}: {received} vs {expected}'
+    budget = cx.get_memory_budget()
+    total_bytes, reserved_bytes = budget.get_total_bytes(), budget.get_reserved_bytes()
+    try:
+        cx.set_memory_budget_bytes(1)  # partitions are read one by one
+        received = partitioned.get_items(
+            item_type=cx.sm.ItemType.Row, key_filter=lambda d: d >= first_day, workers=3, ordered=False,
+        )
+        received = sorted(tuple(i) for i in received)
+        assert received == expected, f'test case budget: {received} vs {expected}'
+        cx.set_memory_budget_bytes(total_bytes)
+        items = partitioned.get_items(item_type=cx.sm.ItemType.Row, key_filter=lambda d: d >= first_day, workers=3)
+        assert tuple(next(items)) == expected[0]
+        assert budget.get_reserved_bytes() > reserved_bytes, 'partitions in flight must be reserved in budget'
+        items.close()
+        assert budget.get_reserved_bytes() == reserved_bytes, 'budget must be released after early stop'
+    finally:
+        cx.set_memory_budget_bytes(total_bytes)
+    assert 'test_part_2022-12-31.tsv' not in partitioned.get_children(), 'pruned partition must not be opened'
+    received = list(partitioned.get_items(item_type=cx.sm.ItemType.Record, key_filter=first_day, workers=2))
+    expected = [dict(day='2023-01-01', n='0')]
+    assert received == expected, f'test case key: {received} vs {expected}'
+
+
 def test_take_credentials_from_file():
     file_name = 'test_creds.txt'
     data = [
@@ -72,6 +123,104 @@ def test_job():
     assert job.get_operation(op_name).is_done()
     dst.remove()
     assert not job.is_done()
+    operation.remove_manifest()
+
+
+def test_job_dag():
+    cx = SnakeeContext()
+    job_folder = cx.find_job_folder(required_folders=['test_tmp'])
+    test_folder = job_folder.folder('test_tmp')
+    data = [{'a': 1}, {'a': 2}]
+    files = [test_folder.file(f'test_dag_{n}_tmp.tsv', struct=['a']).set_types(a=int) for n in range(5)]
+    cx.sm.RegularStream(data, item_type=cx.sm.ItemType.Record).to_file(files[0]).get_list()
+    cx.sm.RegularStream(data, item_type=cx.sm.ItemType.Record).to_file(files[2]).get_list()
+    job = cx.ct.Job('test_dag_job')
+    job.add_operation(cx.ct.TwinSync(name='first', src=files[0], dst=files[1], procedure=lambda s: s))
+    job.add_operation(cx.ct.TwinSync(name='other', src=files[2], dst=files[3], procedure=lambda s: s))
+    job.add_operation(cx.ct.TwinSync(name='second', src=files[1], dst=files[4], procedure=lambda s: s))
+    expected = dict(first=set(), other=set(), second={'first'})
+    received = job.get_dependencies()
+    assert received == expected, f'test case 0: {received} vs {expected}'
+    job.run(workers=2)
+    expected_items = list(files[0].get_items())
+    for n in (1, 3, 4):
+        received = list(files[n].get_items())
+        assert received == expected_items, f'test case 1: {received} vs {expected_items}'
+    assert set(job.get_timings()) == set(expected), 'test case 2'
+    path, duration = job.get_critical_path(timings=dict(first=1, other=1.5, second=1))
+    assert (path, duration) == (['first', 'second'], 2), f'test case 3: {path}, {duration}'
+    for n in (1, 3, 4):
+        files[n].remove()
+    for operation in job.get_operations().values():
+        operation.remove_manifest()
+
+    def fail(stream):
+        raise ValueError('expected error')
+
+    failing_job = cx.ct.Job('test_failing_job')
+    failing_job.add_operation(cx.ct.TwinSync(name='first', src=files[0], dst=files[1], procedure=fail))
+    failing_job.add_operation(cx.ct.TwinSync(name='second', src=files[1], dst=files[4], procedure=lambda s: s))
+    try:
+        failing_job.run(workers=2, verbose=False)
+        raised = False
+    except ValueError:
+        raised = True
+    assert raised, 'test case 4: error of operation must be raised'
+    assert not files[4].is_existing(), 'test case 5: dependent operation must not be run after failure'
+    for n in (0, 1, 2):
+        if files[n].is_existing():
+            files[n].remove()
+
+
+def test_incremental_job():
+    cx = SnakeeContext()
+    job_folder = cx.find_job_folder(required_folders=['test_tmp'])
+    test_folder = job_folder.folder('test_tmp')
+    files = [test_folder.file(f'test_inc_{n}_tmp.tsv', struct=['a']).set_types(a=int) for n in range(3)]
+    cx.sm.RegularStream([{'a': 1}], item_type=cx.sm.ItemType.Record).to_file(files[0]).get_list()
+    job = cx.ct.Job('test_incremental_job')
+    first = cx.ct.TwinSync(name='first', src=files[0], dst=files[1], procedure=lambda s: s, content_hash=True)
+    second = cx.ct.TwinSync(name='second', src=files[1], dst=files[2], procedure=lambda s: s)
+    job.add_operation(first)
+    job.add_operation(second)
+    for sync in first, second:
+        sync.remove_manifest()
+    assert job.get_stale_operations() == ['first', 'second'], 'test case 0'
+    job.run(verbose=False)
+    assert job.get_run_operations() == ['first', 'second'], 'test case 1'
+    assert job.get_stale_operations() == [], 'test case 2: up-to-date operations must not be stale'
+    job.run(workers=2, verbose=False)
+    assert job.get_run_operations() == [], f'test case 3: {job.get_run_operations()}'
+    stat = os.stat(files[0].get_path())
+    os.utime(files[0].get_path(), ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert first.is_up_to_date(), 'test case 4: content of input was not changed'
+    cx.sm.RegularStream([{'a': 2}, {'a': 3}], item_type=cx.sm.ItemType.Record).to_file(files[0]).get_list()
+    assert job.get_stale_operations() == ['first', 'second'], 'test case 5: downstream must be stale'
+    job.run(verbose=False)
+    assert job.get_run_operations() == ['first', 'second'], 'test case 6'
+    received = list(files[2].get_items())
+    expected = list(files[0].get_items())
+    assert received == expected, f'test case 7: {received} vs {expected}'
+    files[2].remove()
+    assert job.get_stale_operations() == ['second'], 'test case 8: removed output must be rebuilt'
+    options = dict(obj=object(), items=[1, 'x'], function=abs, nan=float('nan'), nested=dict(obj=object()))
+    expected = dict(items=[1, 'x'], function='abs', nan='nan')
+    received = second._get_stable_options(options)
+    assert received == expected, f'test case 9: {received} vs {expected}'
+    manifest_path = second.get_manifest_path()
+    second.remove_manifest()
+    os.makedirs(manifest_path)  # manifest can not be written
+    try:
+        job.run(verbose=False)
+        assert files[2].is_existing(), 'test case 10: failed manifest must not fail the run'
+        assert second.get_saved_manifest() is None and second.is_stale(), 'test case 11'
+    finally:
+        os.rmdir(manifest_path)
+    for sync in first, second:
+        sync.remove_manifest()
+    for file in files:
+        if file.is_existing():
+            file.remove()
 
 
 def test_table():
@@ -94,12 +243,208 @@ def test_table():
     assert received_data == expected_data, f'{received_data} vs {expected_data}'
 
 
+def test_sql_pushdown():
+    struct = FlatStruct([AnyField('time', str), AnyField('cat_name', str), AnyField('sum', float)])
+    cx = SnakeeContext()
+    test_db = cx.ct.DatabaseTestStub('test_stub', 'test_host', 5432, 'test_db')
+    table = test_db.table('test_schema.test_table', struct=struct)
+    sql_stream = table.to_stream()
+    expected_query = "SELECT * FROM test_schema.test_table WHERE sum > 100 AND cat_name = 'A' ;"
+    received_query = sql_stream.filter(('sum', fs.more_than(100)), cat_name='A').get_one_line_query()
+    assert received_query == expected_query, f'test case 0: {received_query} vs {expected_query}'
+    test_db.test_stub_response = [('A', 123.0), ('B', 987.0)]
+    expected_data = [dict(cat_name='A', doubled=246.0), dict(cat_name='B', doubled=1974.0)]
+    received_data = sql_stream.select('cat_name', doubled=('sum', lambda v: v * 2)).get_list()
+    assert received_data == expected_data, f'test case 1: {received_data} vs {expected_data}'
+    expected_query = 'SELECT cat_name, sum FROM test_schema.test_table ;'
+    received_query = test_db.test_stub_query
+    assert received_query == expected_query, f'test case 2: {received_query} vs {expected_query}'
+    test_db.test_stub_response = [('t', 'A', 123.0), ('t', 'A', 987.0)]
+    expected_data = [dict(time='t', cat_name='A', sum=987.0)]
+    received_data = sql_stream.filter(cat_name='A', sum=lambda v: v > 500).get_list()
+    assert received_data == expected_data, f'test case 3: {received_data} vs {expected_data}'
+    expected_query = "SELECT * FROM test_schema.test_table WHERE cat_name = 'O''Brien' ;"
+    received_query = sql_stream.filter(cat_name="O'Brien").get_one_line_query()
+    assert received_query == expected_query, f'test case 4: {received_query} vs {expected_query}'
+    test_db.test_stub_response = [('t', '100', 100.0), ('t', 'a\\b', 1.0)]
+    records = [dict(zip(('time', 'cat_name', 'sum'), r)) for r in test_db.test_stub_response]
+    for n, (field, value) in enumerate([('sum', '100'), ('cat_name', 100), ('cat_name', 'a\\b')]):
+        received_data = sql_stream.filter(**{field: value}).get_list()  # compared locally as typed values
+        expected_data = [r for r in records if r[field] == value]
+        assert received_data == expected_data, f'test case 5.{n}: {received_data} vs {expected_data}'
+        expected_query = 'SELECT * FROM test_schema.test_table ;'
+        received_query = test_db.test_stub_query
+        assert received_query == expected_query, f'test case 6.{n}: {received_query} vs {expected_query}'
+
+
+def test_sql_cache():
+    struct = FlatStruct([AnyField('cat_name', str), AnyField('sum', float)])
+    cx = SnakeeContext()
+    test_db = cx.ct.DatabaseTestStub('test_stub', 'test_host', 5432, 'test_db')
+    table = test_db.table('test_schema.test_cached_table', struct=struct)
+    sql_stream = table.to_stream().filter(cat_name='A').cache(token='test_sql_cache')
+    sql_stream.clear_cache()
+    expected = [('A', 123.0)]
+    test_db.test_stub_response = expected
+    received = list(sql_stream.get_rows())
+    assert received == expected, f'test case 0: {received} vs {expected}'
+    assert sql_stream.has_actual_cache()
+    test_db.test_stub_response = [('A', 987.0)]
+    received = list(sql_stream.get_rows())
+    assert received == expected, f'test case 1: {received} vs {expected}'
+    expected = test_db.test_stub_response
+    received = list(sql_stream.cache(token='test_sql_cache_updated').get_rows())
+    assert received == expected, f'test case 2: {received} vs {expected}'
+    assert sql_stream.clear_cache() == 1
+    assert sql_stream.cache(token='test_sql_cache_updated').clear_cache() == 1
+
+
+def test_s3_multipart_upload():
+    cx = SnakeeContext()
+    test_client = cx.ct.S3ClientTestStub(chunk_size=7)
+    test_bucket = cx.ct.S3Storage(access_key='test_key', secret_key='test_secret').bucket('test-bucket')
+    test_bucket.set_client(test_client)
+    test_object = test_bucket.object('test_multipart.txt')
+    lines = [f'line {n}' for n in range(20)]
+    stream = cx.sm.RegularStream(lines, item_type=cx.sm.ItemType.Line)
+    try:
+        test_object.from_stream(stream, part_size=30, verbose=False)
+        raise AssertionError('test case 0: ValueError expected for parts less than MIN_PART_SIZE')
+    except ValueError:
+        assert 'create_multipart_upload' not in test_client.calls, test_client.calls
+    min_part_size = s3_object.MIN_PART_SIZE
+    s3_object.MIN_PART_SIZE = 30  # small parts are allowed by test stub
+    try:
+        test_object.from_stream(stream, part_size=30, max_workers=3, verbose=False)
+        try:
+            test_object.upload_parts([b'short', b'line 0'], verbose=False)
+            raise AssertionError('test case 1: ValueError expected for part less than MIN_PART_SIZE')
+        except ValueError:
+            assert test_client.calls[-1] == 'abort_multipart_upload', test_client.calls
+    finally:
+        s3_object.MIN_PART_SIZE = min_part_size
+    expected = '\n'.join(lines).encode('utf8')
+    received = test_client.objects[('test-bucket', 'test_multipart.txt')]
+    assert received == expected, f'test case 2: {received} vs {expected}'
+    assert test_client.calls.count('upload_part') == 5, test_client.calls
+    assert 'complete_multipart_upload' in test_client.calls and 'put_object' not in test_client.calls
+    received = list(test_object.get_lines(verbose=False))
+    assert received == lines, f'test case 3: {received} vs {lines}'
+    test_object.from_stream(stream, verbose=False)
+    received = test_client.objects[('test-bucket', 'test_multipart.txt')]
+    assert received == expected, f'test case 4: {received} vs {expected}'
+    assert test_client.calls[-1] == 'put_object', test_client.calls
+
+
+def test_s3_ranged_download():
+    cx = SnakeeContext()
+    test_client = cx.ct.S3ClientTestStub()
+    test_bucket = cx.ct.S3Storage(access_key='test_key', secret_key='test_secret').bucket('test-bucket')
+    test_bucket.set_client(test_client)
+    test_object = test_bucket.object('test_ranged.txt', range_size=16, max_ranges_in_flight=3)
+    lines = [f'строка {n}' for n in range(30)]
+    test_object.from_stream(cx.sm.RegularStream(lines, item_type=cx.sm.ItemType.Line), verbose=False)
+    received = list(test_object.get_lines(verbose=False))
+    assert received == lines, f'test case 0: {received} vs {lines}'
+    expected_data = '\n'.join(lines).encode('utf8')
+    expected_ranges_count = (len(expected_data) + 15) // 16
+    assert test_client.calls.count('get_object') == expected_ranges_count, test_client.calls
+    received = list(test_object.get_lines(count=3, verbose=False))
+    assert received == lines[:3], f'test case 1: {received} vs {lines[:3]}'
+    received_data = test_bucket.get_buffer('test_ranged.txt', range_size=10, max_ranges_in_flight=2).read()
+    assert received_data == expected_data, f'test case 2: {received_data} vs {expected_data}'
+
+
+def test_readahead():
+    cx = SnakeeContext()
+    job_folder = cx.find_job_folder(required_folders=['test_tmp'])
+    test_folder = job_folder.folder('test_tmp')
+    lines = [f'строка {n}' for n in range(50)]
+    for file_name, compress in (('test_readahead_tmp.txt', None), ('test_readahead_tmp.txt.gz', 'gzip')):
+        test_file = test_folder.file(file_name, compress=compress).write_lines(lines, verbose=False)
+        assert test_file.is_gzip() == bool(compress), f'test case {file_name}: {test_file.get_content_format()}'
+        test_file.set_readahead(2, block_size=16)
+        received = list(test_file.get_lines(verbose=False))
+        assert received == lines, f'test case {file_name}: {received} vs {lines}'
+        partial = test_file.get_lines(verbose=False)
+        received = [next(partial), next(partial)]
+        assert received == lines[:2], f'test case {file_name} partial: {received} vs {lines[:2]}'
+        partial.close()
+        active_threads = [t for t in threading.enumerate() if t.name.startswith('readahead:')]
+        assert not active_threads, f'test case {file_name}: readahead must be stopped, got {active_threads}'
+        assert not test_file.is_opened(), f'test case {file_name}: readahead must not open regular fileholder'
+    broken_file = test_folder.file('test_readahead_broken_tmp.txt')
+    with open(broken_file.get_path(), 'wb') as f:
+        f.write('строка 0\nстрока 1'.encode('utf8')[:-9] + b'\xff\n')
+    for depth in 0, 2:
+        broken_file.set_readahead(depth, block_size=4)
+        try:
+            list(broken_file.get_lines(verbose=False))
+            raise AssertionError(f'test case broken {depth}: UnicodeDecodeError expected')
+        except UnicodeDecodeError:
+            pass
+        broken_file.close()
+    broken_file.remove()
+    test_client = cx.ct.S3ClientTestStub()
+    test_bucket = cx.ct.S3Storage(access_key='test_key', secret_key='test_secret').bucket('test-bucket')
+    test_bucket.set_client(test_client)
+    test_object = test_bucket.object('test_readahead.txt', range_size=16, readahead_depth=2)
+    test_object.from_stream(cx.sm.RegularStream(lines, item_type=cx.sm.ItemType.Line), verbose=False)
+    received = list(test_object.get_lines(verbose=False))
+    assert received == lines, f'test case s3: {received} vs {lines}'
+    received = list(test_object.get_lines(count=3, verbose=False))
+    assert received == lines[:3], f'test case s3 partial: {received} vs {lines[:3]}'
+
+
+def test_s3_metadata():
+    cx = SnakeeContext()
+    test_client = cx.ct.S3ClientTestStub()
+    test_bucket = cx.ct.S3Storage(access_key='test_key', secret_key='test_secret').bucket('test-bucket')
+    test_bucket.set_client(test_client)
+    test_object = test_bucket.object('test_metadata.txt')
+    assert not test_object.is_existing(), 'test case 0: object must not exist before upload'
+    lines = [f'line {n}' for n in range(7)]
+    test_object.from_stream(cx.sm.RegularStream(lines, item_type=cx.sm.ItemType.Line), verbose=False)
+    assert test_object.is_existing(), 'test case 1: object must exist after upload'
+    received = test_object.get_count()
+    assert received == len(lines), f'test case 2: {received} vs {len(lines)}'
+    assert test_object.get_modification_timestamp() > 0, 'test case 3'
+    assert 'list_objects_v2' not in test_client.calls, test_client.calls
+    assert test_client.calls.count('head_object') == 2, test_client.calls  # not found + after upload, then cached
+    for n in range(3):
+        test_bucket.object(f'test_metadata_{n}.txt').put_object(data=b'')
+    received = test_bucket.list_object_names(prefix='test_metadata_')
+    expected = [f'test_metadata_{n}.txt' for n in range(3)]
+    assert received == expected, f'test case 4: {received} vs {expected}'
+    received = test_bucket.list_object_names(prefix='test_metadata_')
+    assert received == expected, f'test case 5: {received} vs {expected}'
+    assert test_client.calls.count('list_objects_v2') == 1, test_client.calls
+    job_folder = cx.find_job_folder(required_folders=['test_tmp'])
+    test_file = job_folder.folder('test_tmp').file('test_upload_tmp.txt')
+    test_file.write_lines(lines, verbose=False)
+    uploaded_object = test_bucket.object('test_uploaded.txt')
+    assert not uploaded_object.is_existing(), 'test case 6: object must not exist before upload'
+    uploaded_object.upload_file(test_file)
+    assert uploaded_object.is_existing(), 'test case 7: cached metadata must be reset after upload_file()'
+    assert uploaded_object.get_modification_timestamp() > 0, 'test case 8'
+    test_file.remove()
+
+
 def main():
     test_detect_struct_by_title_row()
     test_local_file()
+    test_partitioned_local_file()
     test_take_credentials_from_file()
     test_job()
+    test_job_dag()
+    test_incremental_job()
     test_table()
+    test_sql_pushdown()
+    test_sql_cache()
+    test_s3_multipart_upload()
+    test_s3_ranged_download()
+    test_s3_metadata()
+    test_readahead()
 
 
 if __name__ == '__main__':
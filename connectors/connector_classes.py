@@ -46,6 +46,7 @@ try:  # Assume we're a submodule in a package.
     from connectors.storages.s3_bucket import S3Bucket
     from connectors.storages.s3_folder import S3Folder
     from connectors.storages.s3_object import S3Object
+    from connectors.storages.s3_test_stub import S3ClientTestStub
     from connectors.databases.abstract_database import AbstractDatabase
     from connectors.databases.clickhouse_database import ClickhouseDatabase
     from connectors.databases.postgres_database import PostgresDatabase
@@ -75,6 +76,7 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
     from .storages.s3_bucket import S3Bucket
     from .storages.s3_folder import S3Folder
     from .storages.s3_object import S3Object
+    from .storages.s3_test_stub import S3ClientTestStub
     from .databases.abstract_database import AbstractDatabase
     from .databases.clickhouse_database import ClickhouseDatabase
     from .databases.postgres_database import PostgresDatabase
@@ -1,5 +1,4 @@
 from typing import Optional, Iterable, Union
-import requests
 
 try:  # Assume we're a submodule in a package.
     from interfaces import (
@@ -8,6 +7,7 @@ try:  # Assume we're a submodule in a package.
         Name, Count, Array, ARRAY_TYPES,
     )
     from base.functions.arguments import get_name
+    from utils.external import requests
     from connectors.databases.abstract_database import AbstractDatabase, TEST_QUERY, DEFAULT_STEP
 except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
     from ...interfaces import (
@@ -16,6 +16,7 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
         Name, Count, Array, ARRAY_TYPES,
     )
     from ...base.functions.arguments import get_name
+    from ...utils.external import requests
     from .abstract_database import AbstractDatabase, TEST_QUERY, DEFAULT_STEP
 
 
@@ -15,6 +15,7 @@ class DatabaseTestStub(PostgresDatabase):
             **kwargs
     ):
         self.test_stub_response = None
+        self.test_stub_query = None
         super().__init__(
             name=name, host=host, port=port, db=db,
             user=user, password=password,
@@ -31,6 +32,7 @@ class DatabaseTestStub(PostgresDatabase):
             verbose: Optional[bool] = None,
     ):
         query = self._get_compact_query_view(query)
+        self.test_stub_query = query
         if query.startswith('SELECT'):
             return self.test_stub_response
         else:
@@ -132,6 +132,13 @@ class Table(LeafConnector):
             self.reset_modification_timestamp(timestamp)
         return timestamp
 
+    def get_fingerprint(self, content_hash: bool = False) -> dict:
+        """Returns actual rows count of table (hashing of table content is not supported)."""
+        if self.is_existing():
+            return dict(exists=True, count=self.get_count(force=True))
+        else:
+            return dict(exists=False)
+
     def get_count(self, allow_slow_mode: bool = True, allow_reopen: bool = True, force: bool = False) -> Count:
         if force:
             must_recount = True
@@ -350,7 +357,7 @@ class Table(LeafConnector):
             stream_example = StreamBuilder.empty(item_type=item_type)
             meta = self.get_compatible_meta(stream_example, name=name, ex=ex, **kwargs)
             meta['source'] = self
-            return StreamBuilder.stream(data, **meta)
+            return StreamBuilder.stream(data, item_type=item_type, **meta)
         else:
             return super().to_stream(data=data, name=name, item_type=item_type, ex=ex, step=step, **kwargs)
 
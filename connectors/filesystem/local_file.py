@@ -1,4 +1,5 @@
 from typing import Optional, Iterable, Generator, Union, Any
+from hashlib import sha256
 import os
 import gzip as gz
 
@@ -12,6 +13,7 @@ try:  # Assume we're a submodule in a package.
     from base.constants.chars import EMPTY, PARAGRAPH_CHAR, RETURN_CHAR, OS_PLACEHOLDER, PY_PLACEHOLDER
     from base.functions.errors import get_type_err_msg
     from functions.primary.text import is_formatter
+    from utils.readahead import get_readahead_lines, get_file_blocks, DEFAULT_BLOCK_SIZE
     from content.format.format_classes import (
         AbstractFormat, ParsedFormat, LeanFormat,
         TextFormat, ColumnarFormat, FlatStructFormat,
@@ -29,6 +31,7 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
     from ...base.constants.chars import EMPTY, PARAGRAPH_CHAR, RETURN_CHAR, OS_PLACEHOLDER, PY_PLACEHOLDER
     from ...base.functions.errors import get_type_err_msg
     from ...functions.primary.text import is_formatter
+    from ...utils.readahead import get_readahead_lines, get_file_blocks, DEFAULT_BLOCK_SIZE
     from ...content.format.format_classes import (
         AbstractFormat, ParsedFormat, LeanFormat,
         TextFormat, ColumnarFormat, FlatStructFormat,
@@ -59,10 +62,15 @@ class LocalFile(LeafConnector, ActualizeMixin):
             first_line_is_title: Optional[bool] = None,
             expected_count: Count = None,
             caption: Optional[str] = None,
+            readahead_depth: int = 0,
+            block_size: int = DEFAULT_BLOCK_SIZE,
             verbose: Optional[bool] = None,
             **kwargs
     ):
         parent = kwargs.pop('parent', None)
+        if self.is_folder():  # PartitionedLocalFile: folder-like mask of files, struct is detected by partitions
+            kwargs.setdefault('streams', kwargs.pop('children', None))
+            kwargs.setdefault('detect_struct', False)
         if folder:
             if isinstance(folder, ConnectorInterface) or folder.is_folder():
                 assert parent is None or folder == parent, f'folder must be a parent, got {folder}, {parent}'
@@ -76,6 +84,8 @@ class LocalFile(LeafConnector, ActualizeMixin):
         else:
             folder = self.get_default_folder()
         self._fileholder = None
+        self._readahead_depth = readahead_depth
+        self._block_size = block_size
         if first_line_is_title is None:
             if content_format is not None:
                 is_title = isinstance(content_format, ColumnarFormat) or hasattr(content_format, 'is_first_line_title')
@@ -149,6 +159,39 @@ class LocalFile(LeafConnector, ActualizeMixin):
         if not inplace:
             return self
 
+    def get_readahead_depth(self) -> int:
+        return self._readahead_depth
+
+    def get_block_size(self) -> int:
+        return self._block_size
+
+    def set_readahead(self, depth: int, block_size: Optional[int] = None, inplace: bool = True) -> Native:
+        """Enables reading of blocks (and gzip decompression) by background thread while lines are parsed,
+        depth is max count of blocks read ahead, 0 disables readahead.
+        """
+        if not inplace:
+            return self.make_new(readahead_depth=depth, block_size=block_size or self.get_block_size())
+        self._readahead_depth = depth
+        if block_size:
+            self._block_size = block_size
+        return self
+
+    def is_readahead(self) -> bool:
+        return bool(self.get_readahead_depth())
+
+    def _get_blocks(self) -> Iterable[bytes]:
+        path = self.get_path()
+        fileholder = gz.open(path, 'rb') if self.is_gzip() else open(path, 'rb')
+        return get_file_blocks(fileholder, block_size=self.get_block_size())
+
+    def _get_readahead_lines(self) -> Iterable[str]:
+        return get_readahead_lines(
+            self._get_blocks,
+            queue_depth=self.get_readahead_depth(),
+            encoding=self.get_encoding() or 'utf8',
+            name=f'readahead:{self.get_name()}',
+        )
+
     def add_to_folder(self, folder: Connector) -> Native:
         if isinstance(folder, ConnectorInterface) or hasattr(folder, 'add_child'):
             folder.add_child(self)
@@ -297,6 +340,25 @@ class LocalFile(LeafConnector, ActualizeMixin):
                 self.set_prev_modification_timestamp(timestamp)
             return timestamp
 
+    def get_content_hash(self) -> str:
+        content_hash = sha256()
+        with open(self.get_path(), 'rb') as f:
+            for block in iter(lambda: f.read(self.get_block_size()), b''):
+                content_hash.update(block)
+        return content_hash.hexdigest()
+
+    def get_fingerprint(self, content_hash: bool = False) -> dict:
+        """Returns size and modification time of file (or size and hash of its content if content_hash=True)."""
+        path = self.get_path()
+        if not os.path.exists(path):
+            return dict(exists=False)
+        fingerprint = dict(exists=True, size=os.path.getsize(path))
+        if content_hash:
+            fingerprint['sha256'] = self.get_content_hash()
+        else:
+            fingerprint['mtime_ns'] = os.stat(path).st_mtime_ns
+        return fingerprint
+
     def get_first_line(self, close: bool = True, skip_missing: bool = False, verbose: bool = False) -> str:
         if not skip_missing:
             content_format = self.get_content_format()
@@ -309,23 +371,30 @@ class LocalFile(LeafConnector, ActualizeMixin):
         return super().get_first_line(close=close, skip_missing=skip_missing, verbose=verbose)
 
     def get_next_lines(self, count: Optional[int] = None, skip_first: bool = False, close: bool = False) -> Iterable:
-        is_opened = self.is_opened()
-        if is_opened is not None:
-            assert is_opened, f'For LocalFile.get_next_lines() file must be opened: {self}'
         encoding = self.get_encoding()
         ending = self.get_ending()
-        iter_lines = self.get_fileholder()
-        for n, line in enumerate(iter_lines):
-            if skip_first and n == 0:
-                continue
-            if isinstance(line, bytes):
-                line = line.decode(encoding) if encoding else line.decode()
-            if ending:
-                line = line.rstrip(ending)
-            yield line
-            if count is not None:
-                if count > 0 and (n + 1 == count):
-                    break
+        if self.is_readahead():  # lines are split by consumer, blocks are read by background thread by own handle
+            iter_lines = self._get_readahead_lines()
+        else:
+            is_opened = self.is_opened()
+            if is_opened is not None:
+                assert is_opened, f'For LocalFile.get_next_lines() file must be opened: {self}'
+            iter_lines = self.get_fileholder()
+        try:
+            for n, line in enumerate(iter_lines):
+                if skip_first and n == 0:
+                    continue
+                if isinstance(line, bytes):
+                    line = line.decode(encoding) if encoding else line.decode()
+                if ending:
+                    line = line.rstrip(ending)
+                yield line
+                if count is not None:
+                    if count > 0 and (n + 1 == count):
+                        break
+        finally:  # stops background reading also when consumer stopped early (i.e. after take())
+            if hasattr(iter_lines, 'close') and self.is_readahead():
+                iter_lines.close()
         if close:
             self.close()
 
@@ -341,7 +410,8 @@ class LocalFile(LeafConnector, ActualizeMixin):
     ) -> Generator:
         if not (skip_missing or self.is_gzip()):
             assert not self.is_empty(), f'for get_lines() file must be non-empty: {self}'
-        self.open(allow_reopen=allow_reopen)
+        if not self.is_readahead():  # readahead opens file by own handle in background thread
+            self.open(allow_reopen=allow_reopen)
         lines = self.get_next_lines(count=count, skip_first=skip_first, close=True)
         if verbose is None:
             verbose = self.is_verbose()
@@ -1,4 +1,10 @@
-from typing import Iterable, Union, Optional
+from typing import Optional, Callable, Iterable, Generator, Union, Any
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from collections import deque
+import fnmatch
+import pickle
+import os
+import gzip as gz
 
 try:  # Assume we're a submodule in a package.
     from interfaces import (
@@ -12,6 +18,7 @@ try:  # Assume we're a submodule in a package.
     from connectors.filesystem.local_folder import LocalFolder
     from connectors.filesystem.local_file import LocalFile
     from connectors.filesystem.local_mask import LocalMask
+    from utils.memory import MemoryBudget, get_default_budget, get_item_size
 except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
     from ...interfaces import (
         Connector, Stream, Context,
@@ -24,25 +31,59 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
     from .local_folder import LocalFolder
     from .local_file import LocalFile
     from .local_mask import LocalMask
+    from ...utils.memory import MemoryBudget, get_default_budget, get_item_size
 
 Native = Union[LocalMask, LocalFile]
 Suffix = Union[str, int, None]
 ContentFormat = Union[ContentType, ContentFormatInterface, None]
+KeyFilter = Union[Callable, Iterable, Any, None]
+
+MASK_PLACEHOLDER = '{}'
+MASK_WILDCARD = '*'
+QUEUE_SIZE_PER_WORKER = 2  # partitions read ahead of consumer by every worker (while memory budget allows)
+DEFAULT_PARSED_SIZE_RATIO = 8  # estimated bytes of parsed items per byte of partition file
+
+
+def _read_partition(
+        path: str,
+        content_format: ContentFormatInterface,
+        item_type: ItemType,
+        skip_first: bool = False,
+        is_gzip: bool = False,
+        encoding: Optional[str] = None,
+) -> list:
+    """Reads and parses whole partition file, used by workers of process pool (so must be picklable).
+
+    Items of whole partition are returned at once, so caller accounts them in MemoryBudget.
+    """
+    ending = content_format.get_ending() if hasattr(content_format, 'get_ending') else None
+    if is_gzip:
+        fileholder = gz.open(path, 'rt', encoding=encoding)
+    else:
+        fileholder = open(path, 'r', encoding=encoding) if encoding else open(path, 'r')
+    with fileholder:
+        lines = (line.rstrip(ending) if ending else line for line in fileholder)
+        if skip_first:
+            next(lines, None)
+        return list(content_format.get_items_from_lines(lines, item_type=item_type))
 
 
 class PartitionedLocalFile(LocalMask, LocalFile):
     def __init__(
             self,
             mask: str,
-            suffix: Suffix,
-            parent: HierarchicConnector,
+            suffix: Suffix = None,
+            parent: HierarchicConnector = None,
             context: Context = None,
+            partition_key: Optional[Callable] = None,
             verbose: Optional[bool] = None,
     ):
         self._suffix = None
         self._partition = None
+        self._partition_key = partition_key
         super().__init__(mask, parent, context=context, verbose=verbose)
-        self.set_suffix(suffix, inplace=True)
+        if suffix is not None:
+            self.set_suffix(suffix, inplace=True)
 
     def get_suffix(self) -> Suffix:
         return self._suffix
@@ -58,6 +99,27 @@ class PartitionedLocalFile(LocalMask, LocalFile):
             obj = self.make_new(suffix=suffix)
             return self._assume_native(obj)
 
+    def get_partition_key(self) -> Optional[Callable]:
+        return self._partition_key
+
+    def set_partition_key(self, partition_key: Optional[Callable], inplace: bool = True) -> Native:
+        """Sets function for getting declared key of partition from suffix of its file name,
+        i.e. partition_key=lambda s: date.fromisoformat(s) for masks like 'data_{}.tsv' with date suffixes.
+        """
+        if inplace:
+            self._partition_key = partition_key
+            return self
+        else:
+            obj = self.make_new(partition_key=partition_key)
+            return self._assume_native(obj)
+
+    def get_partition_key_by_suffix(self, suffix: Suffix):
+        partition_key = self.get_partition_key()
+        if partition_key:
+            return partition_key(suffix)
+        else:
+            return suffix
+
     def get_partition(self) -> LocalFile:
         return self._partition
 
@@ -90,14 +152,156 @@ class PartitionedLocalFile(LocalMask, LocalFile):
             acquired_suffix = suffix
         assert acquired_suffix, f'suffix must be defined, got argument {suffix}, default {self.get_suffix()}'
         filename = self.get_mask().format(acquired_suffix)
-        return super().file(filename, content_format=content_format, **kwargs)
+        file = self.get_children().get(filename)
+        if kwargs or content_format or not file:
+            folder = self.get_folder()
+            if 'struct' not in kwargs:
+                kwargs['detect_struct'] = os.path.exists(folder.get_file_path(filename))
+            file = LocalFile(filename, content_format=content_format, folder=folder, **kwargs)
+            self.get_children()[filename] = file  # folder of partition stays real folder, so its path is not masked
+        return file
 
     def get_files(self) -> Iterable[LeafConnector]:
         return self.get_children().values()
 
-    def get_items(self, how: str = 'records', *args, **kwargs) -> Iterable:
-        for file in self.get_files():
-            yield from file.get_items(how=how, *args, **kwargs)
+    def yield_existing_names(self) -> Iterable:
+        mask = self.get_mask().replace(MASK_PLACEHOLDER, MASK_WILDCARD)
+        for name in self.get_folder().list_existing_names():
+            if fnmatch.fnmatch(name, mask):
+                yield name
+
+    def get_existing_suffixes(self) -> list:
+        return sorted(map(self._extract_suffix_from_name, self.yield_existing_names()))
+
+    def is_selected_partition(self, suffix: Suffix, key_filter: KeyFilter = None) -> bool:
+        if key_filter is None:
+            return True
+        key = self.get_partition_key_by_suffix(suffix)
+        if isinstance(key_filter, Callable):
+            return bool(key_filter(key))
+        elif isinstance(key_filter, (list, tuple, set, frozenset)):
+            return key in key_filter
+        else:
+            return key == key_filter
+
+    def get_partitions(self, key_filter: KeyFilter = None) -> Generator:
+        """Yields existing partition files (ordered by suffix) with keys matching key_filter.
+
+        Filter is a function of partition key, collection of keys, or one expected key.
+        Partitions are pruned by names only, skipped files are not opened.
+        """
+        suffixes = set(self.get_existing_suffixes())
+        suffixes.update(map(self._extract_suffix_from_name, self.get_children()))
+        for suffix in sorted(suffixes):
+            if self.is_selected_partition(suffix, key_filter=key_filter):
+                file = self.file(suffix)
+                if file.is_existing():
+                    yield file
+
+    def get_items(
+            self,
+            item_type: ItemType = ItemType.Auto,
+            key_filter: KeyFilter = None,
+            workers: Optional[int] = None,
+            ordered: bool = True,
+            use_processes: bool = False,
+            verbose: Optional[bool] = None,
+    ) -> Generator:
+        """Yields items from partitions selected by key_filter.
+
+        With workers > 1 partitions are read concurrently: by threads (suitable for I/O-bound gz and text files)
+        or by processes (use_processes=True, for parse-heavy formats).
+        Ordered output keeps order of partitions, otherwise items of first finished partition are yielded first.
+        Concurrent workers parse whole partitions in memory, so every partition read ahead of consumer
+        reserves its estimated size in MemoryBudget of context until its items are yielded.
+        New partitions are not submitted while budget is exhausted, but at least one partition is always read.
+        """
+        partitions = self.get_partitions(key_filter=key_filter)
+        if not workers or workers <= 1:
+            for file in partitions:
+                yield from file.get_items_of_type(item_type=item_type, verbose=verbose)
+            return
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        max_in_flight = workers * QUEUE_SIZE_PER_WORKER
+        budget = self.get_memory_budget()
+        size_ratio = [DEFAULT_PARSED_SIZE_RATIO]  # increased by sizes of parsed partitions
+        with executor_class(max_workers=workers) as executor:
+            in_flight, reservations = deque(), dict()
+            try:
+                for file in partitions:
+                    file_size = self._get_file_size(file)
+                    while in_flight:
+                        is_full = len(in_flight) >= max_in_flight
+                        if not is_full and file_size * size_ratio[0] <= budget.get_available_bytes():
+                            break
+                        yield from self._get_next_done(in_flight, reservations, budget, size_ratio, ordered=ordered)
+                    future = self._submit_partition(executor, file, item_type=item_type)
+                    reservation_key, _ = budget.reserve(int(file_size * size_ratio[0]))
+                    reservations[future] = reservation_key, file_size
+                    in_flight.append(future)
+                while in_flight:
+                    yield from self._get_next_done(in_flight, reservations, budget, size_ratio, ordered=ordered)
+            finally:  # consumer can stop early, i.e. after take()
+                for future in in_flight:
+                    future.cancel()
+                for reservation_key, _ in reservations.values():
+                    budget.release(reservation_key)
+
+    def get_memory_budget(self) -> MemoryBudget:
+        context = self.get_context()
+        if hasattr(context, 'get_memory_budget'):
+            return context.get_memory_budget()
+        else:
+            return get_default_budget()
+
+    @staticmethod
+    def _get_file_size(file: LocalFile) -> int:
+        path = file.get_path()
+        return os.path.getsize(path) if os.path.exists(path) else 0
+
+    @staticmethod
+    def _submit_partition(executor, file: LocalFile, item_type: ItemType):
+        if isinstance(executor, ProcessPoolExecutor):
+            if item_type in (ItemType.Auto, None):
+                item_type = file.get_default_item_type()
+            content_format = file.get_content_format()
+            try:
+                pickle.dumps(content_format)
+            except (pickle.PicklingError, TypeError, AttributeError):  # i.e. struct with lambda-functions
+                pass  # this partition will be read in current process
+            else:
+                return executor.submit(
+                    _read_partition, file.get_path(), content_format, item_type,
+                    skip_first=file.is_first_line_title(), is_gzip=file.is_gzip(), encoding=file.get_encoding(),
+                )
+            future = Future()
+            future.set_result(list(file.get_items_of_type(item_type=item_type, verbose=False)))
+            return future
+        else:
+            return executor.submit(lambda: list(file.get_items_of_type(item_type=item_type, verbose=False)))
+
+    @staticmethod
+    def _get_next_done(
+            in_flight: deque,
+            reservations: dict,
+            budget: MemoryBudget,
+            size_ratio: list,
+            ordered: bool = True,
+    ) -> Generator:
+        if ordered:
+            future = in_flight.popleft()
+        else:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            future = done.pop()
+            in_flight.remove(future)
+        items = future.result()
+        reservation_key, file_size = reservations[future]
+        item_size = get_item_size(items)
+        if item_size and file_size:
+            size_ratio[0] = max(size_ratio[0], item_size * len(items) / file_size)
+        yield from items
+        budget.release(reservation_key)
+        reservations.pop(future)
 
     def get_items_count(self, allow_reopen=True, allow_slow_mode=True, force=False) -> Optional[int]:
         partition = self.get_partition()
@@ -111,6 +111,13 @@ class LeafConnectorInterface(ConnectorInterface, StreamInterface, ABC):
         """
         pass
 
+    @abstractmethod
+    def get_fingerprint(self, content_hash: bool = False) -> dict:
+        """Returns properties of stored data changing on every modification (i.e. size and modification time),
+        used for detecting outdated results of operations.
+        """
+        pass
+
     @abstractmethod
     def get_expected_count(self) -> Count:
         pass
@@ -1,19 +1,27 @@
 from abc import ABC, abstractmethod
 from typing import Optional, Iterable, Callable
+from hashlib import sha256
+import json
+import math
+import os
 
 try:  # Assume we're a submodule in a package.
     from interfaces import Name, Stream, ConnectorInterface, Context, Options, ItemType, StreamType
     from base.constants.chars import ITEMS_DELIMITER
-    from base.functions.arguments import get_value
+    from base.functions.arguments import get_name, get_value
     from connectors.operations.operation import Operation
 except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
     from ...interfaces import Name, Stream, ConnectorInterface, Context, Options, ItemType, StreamType
     from ...base.constants.chars import ITEMS_DELIMITER
-    from ...base.functions.arguments import get_value
+    from ...base.functions.arguments import get_name, get_value
     from ...connectors.operations.operation import Operation
 
 SRC_ID = 'src'
 DST_ID = 'dst'
+MANIFEST_FILE_TEMPLATE = 'sync_manifest_{}.json'
+MANIFEST_TMP_SUFFIX = '.partial'
+UNSTABLE_OPTION = object()  # marker of options without stable representation (excluded from manifest)
+DEFAULT_ENCODING = 'utf8'
 
 
 class AbstractSync(Operation, ABC):
@@ -25,6 +33,7 @@ class AbstractSync(Operation, ABC):
             options: Optional[dict] = None,
             apply_to_stream: bool = True,
             item_type: ItemType = ItemType.Auto,
+            content_hash: bool = False,
             context: Context = None,
     ):
         super().__init__(
@@ -39,6 +48,7 @@ class AbstractSync(Operation, ABC):
             item_type = ItemType(get_value(item_type))
         self._item_type = item_type
         self._apply_to_stream = apply_to_stream
+        self._content_hash = content_hash
         self._options = options
 
     def get_item_type(self) -> ItemType:
@@ -84,6 +94,144 @@ class AbstractSync(Operation, ABC):
     def is_done(self) -> bool:
         return self.has_outputs()
 
+    def is_content_hash(self) -> bool:
+        return self._content_hash
+
+    @staticmethod
+    def _get_fingerprints(connectors: dict, content_hash: bool = False) -> dict:
+        fingerprints = dict()
+        for name, conn in connectors.items():
+            if hasattr(conn, 'get_fingerprint'):
+                fingerprints[name] = conn.get_fingerprint(content_hash=content_hash)
+            else:
+                fingerprints[name] = dict(exists=conn.is_existing())
+        return fingerprints
+
+    @classmethod
+    def _get_stable_option(cls, value):
+        """Returns JSON-compatible representation of option value, equal in every process run.
+
+        Returns UNSTABLE_OPTION for objects with default repr (containing memory address), such options are skipped.
+        """
+        if isinstance(value, float) and not math.isfinite(value):  # NaN is not equal to itself
+            return repr(value)
+        elif value is None or isinstance(value, (str, bool, int, float)):
+            return value
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            items = [cls._get_stable_option(i) for i in value]
+            if UNSTABLE_OPTION in items:
+                return UNSTABLE_OPTION
+            return sorted(items, key=repr) if isinstance(value, (set, frozenset)) else items
+        elif isinstance(value, dict):
+            items = {str(k): cls._get_stable_option(v) for k, v in value.items()}
+            if UNSTABLE_OPTION in items.values():
+                return UNSTABLE_OPTION
+            return items
+        elif isinstance(value, Callable) or hasattr(value, 'get_name'):
+            name = get_name(value, or_class=False)
+            return name if isinstance(name, (str, int)) else UNSTABLE_OPTION
+        elif type(value).__repr__ is object.__repr__:
+            return UNSTABLE_OPTION
+        else:
+            return repr(value)
+
+    def _get_stable_options(self, options: dict) -> dict:
+        stable_options = dict()
+        for k, v in options.items():
+            stable_value = self._get_stable_option(v)
+            if stable_value is not UNSTABLE_OPTION:
+                stable_options[k] = stable_value
+        return stable_options
+
+    def get_manifest(self, options: Options = None) -> dict:
+        """Returns fingerprints of inputs and outputs, options and procedure name of this sync.
+
+        Sync is up-to-date while its saved manifest (recorded after last run) equals current manifest.
+        """
+        all_options = dict(self.get_options() or dict())
+        if options:
+            all_options.update(options)
+        content_hash = self.is_content_hash()
+        manifest = dict(
+            inputs=self._get_fingerprints(self.get_inputs(), content_hash=content_hash),
+            outputs=self._get_fingerprints(self.get_outputs(), content_hash=content_hash),
+            options=self._get_stable_options(all_options),
+            procedure=get_name(self.get_procedure()) if self.has_procedure() else None,
+        )
+        return json.loads(json.dumps(manifest, default=str))  # the same types as in saved manifest
+
+    def is_manifest_enabled(self) -> bool:
+        """Manifests are kept in tmp-folder of context, syncs without context check existence of outputs only."""
+        return self.get_context() is not None
+
+    def get_manifest_path(self) -> Optional[str]:
+        if not self.is_manifest_enabled():
+            return None
+        output_paths = [c.get_path() if hasattr(c, 'get_path') else get_name(c) for c in self.get_outputs().values()]
+        key_str = '\n'.join([self.get_name()] + sorted(output_paths))
+        key = sha256(key_str.encode(DEFAULT_ENCODING)).hexdigest()
+        folder_path = self.get_context().get_tmp_folder().get_path()
+        file_name = MANIFEST_FILE_TEMPLATE.format(key)
+        return os.path.join(folder_path, file_name) if folder_path else file_name
+
+    def get_saved_manifest(self) -> Optional[dict]:
+        manifest_path = self.get_manifest_path()
+        if manifest_path and os.path.isfile(manifest_path):
+            with open(manifest_path, 'r', encoding=DEFAULT_ENCODING) as f:
+                try:
+                    return json.load(f)
+                except ValueError:  # broken manifest means outdated results
+                    return None
+
+    def save_manifest(self, options: Options = None) -> Optional[dict]:
+        """Records manifest after run, failure of writing manifest is logged and does not fail the run:
+        results are already written, so next run just recomputes them.
+        """
+        manifest_path = self.get_manifest_path()
+        if not manifest_path:
+            return None
+        manifest = self.get_manifest(options=options)
+        tmp_path = manifest_path + MANIFEST_TMP_SUFFIX
+        try:
+            folder_path = os.path.dirname(manifest_path)
+            if folder_path and not os.path.exists(folder_path):
+                os.makedirs(folder_path, exist_ok=True)
+            with open(tmp_path, 'w', encoding=DEFAULT_ENCODING) as f:
+                json.dump(manifest, f)
+            os.replace(tmp_path, manifest_path)  # half-written manifest is never visible
+        except OSError as e:
+            self.log(f'Manifest of {self.get_name()} was not saved: {e}', level=30)
+            for path in tmp_path, manifest_path:  # previous manifest must not be taken as actual
+                try:
+                    if os.path.isfile(path):
+                        os.remove(path)
+                except OSError:
+                    pass
+            return None
+        return manifest
+
+    def remove_manifest(self) -> int:
+        manifest_path = self.get_manifest_path()
+        if manifest_path and os.path.isfile(manifest_path):
+            os.remove(manifest_path)
+            return 1
+        else:
+            return 0
+
+    def is_stale(self, options: Options = None) -> bool:
+        """Checks that sync must be (re)run: outputs are missing,
+        or inputs, outputs, options or procedure changed after last run (or last run was not recorded).
+        Without context (and manifest) sync is stale only if its outputs are missing.
+        """
+        if not self.is_done():
+            return True
+        if not self.is_manifest_enabled():
+            return False
+        return self.get_saved_manifest() != self.get_manifest(options=options)
+
+    def is_up_to_date(self, options: Options = None) -> bool:
+        return not self.is_stale(options=options)
+
     def is_existing(self) -> bool:
         return self.has_inputs() or self.has_outputs()
 
@@ -119,7 +267,7 @@ class AbstractSync(Operation, ABC):
     ) -> Optional[Stream]:
         if item_type in (ItemType.Auto, None):
             item_type = self.get_item_type()
-        if not self.is_done():
+        if self.is_stale(options=options):
             return self.run_now(return_stream=return_stream, item_type=item_type, options=options, verbose=verbose)
         elif raise_error_if_exists:
             objects_str = ITEMS_DELIMITER.join(self.get_existing_outputs())
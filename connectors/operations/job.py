@@ -1,4 +1,6 @@
 from typing import Optional, Iterable, Union
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import time
 
 try:  # Assume we're a submodule in a package.
     from base.interfaces.context_interface import ContextInterface
@@ -14,6 +16,8 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
 Name = str
 Native = HierarchicConnector
 
+DEFAULT_WORKERS_COUNT = 1  # operations are run sequentially by default
+
 
 class Job(HierarchicConnector):
     def __init__(
@@ -33,6 +37,9 @@ class Job(HierarchicConnector):
         )
         self._queue = queue or list()
         self._options = options or dict()
+        self._timings = dict()
+        self._dependencies = dict()
+        self._run_operations = set()
 
     @staticmethod
     def get_default_child_class():
@@ -128,22 +135,187 @@ class Job(HierarchicConnector):
         for c in self.get_connectors():
             c.check()
 
+    @staticmethod
+    def _get_connector_keys(connectors: dict) -> set:
+        keys = set()
+        for conn in connectors.values():
+            if hasattr(conn, 'get_path'):
+                keys.add(conn.get_path())
+            else:
+                keys.add(id(conn))
+        return keys
+
+    def get_dependencies(self, operations: Optional[list] = None) -> dict:
+        """Returns dict with names of operations required by each operation (graph of operations).
+
+        Operation depends on previous operations (by queue order) writing its inputs, reading or writing its outputs.
+        Operations without get_inputs() and get_outputs() (i.e. procedures over any connectors)
+        are run after all previous and before all next operations.
+        """
+        if operations is None:
+            operations = self.get_queue()
+        operations = [self.get_operation(op) for op in operations]
+        dependencies = dict()
+        previous = list()
+        for operation in operations:
+            name = operation.get_name()
+            if hasattr(operation, 'get_inputs') and hasattr(operation, 'get_outputs'):
+                inputs = self._get_connector_keys(operation.get_inputs())
+                outputs = self._get_connector_keys(operation.get_outputs())
+            else:
+                inputs, outputs = None, None
+            required = set()
+            for prev_name, prev_inputs, prev_outputs in previous:
+                if inputs is None or prev_inputs is None:
+                    required.add(prev_name)
+                elif inputs & prev_outputs or outputs & prev_outputs or outputs & prev_inputs:
+                    required.add(prev_name)
+            dependencies[name] = required
+            previous.append((name, inputs, outputs))
+        return dependencies
+
+    def get_timings(self) -> dict:
+        """Returns durations (in seconds) of operations run by last call of run()."""
+        return self._timings
+
+    def get_critical_path(self, dependencies: Optional[dict] = None, timings: Optional[dict] = None) -> tuple:
+        """Returns names of operations in longest (by duration) chain of dependent operations and its duration.
+
+        Concurrent run can not be faster than this chain.
+        """
+        if dependencies is None:
+            dependencies = self._dependencies
+        if timings is None:
+            timings = self.get_timings()
+        chain_durations, chain_previous = dict(), dict()
+        for name in dependencies:  # dependencies are ordered, so required operations are processed first
+            required = [r for r in dependencies[name] if r in chain_durations]
+            previous = max(required, key=chain_durations.get) if required else None
+            chain_durations[name] = timings.get(name, 0) + (chain_durations[previous] if previous else 0)
+            chain_previous[name] = previous
+        if not chain_durations:
+            return list(), 0
+        name = max(chain_durations, key=chain_durations.get)
+        duration = chain_durations[name]
+        path = list()
+        while name:
+            path.insert(0, name)
+            name = chain_previous[name]
+        return path, duration
+
+    def get_stale_operations(self, operations: Optional[list] = None, options: Optional[dict] = None) -> list:
+        """Returns names of operations which will be run by run(if_not_yet=True):
+        stale operations (see AbstractSync.is_stale()) and all operations depending on them.
+        """
+        dependencies = self.get_dependencies(operations)
+        stale = set()
+        for name, required in dependencies.items():
+            operation = self.get_operation(name)
+            if required & stale or not hasattr(operation, 'is_stale'):
+                stale.add(name)
+            elif operation.is_stale(options=self.get_options(including=operation, upd=options)):
+                stale.add(name)
+        return [name for name in dependencies if name in stale]
+
+    def get_run_operations(self) -> list:
+        """Returns names of operations actually run (not skipped as up-to-date) by last call of run()."""
+        return [name for name in self._dependencies if name in self._run_operations]
+
+    def _run_operation(self, operation: Operation, if_not_yet: bool = True, options: Optional[dict] = None) -> bool:
+        start_time = time.perf_counter()
+        options = self.get_options(including=operation, upd=options)
+        if hasattr(operation, 'is_stale'):  # isinstance(operation, AbstractSync)
+            is_run = not if_not_yet or operation.is_stale(options=options)
+            if is_run:
+                operation.run_now(return_stream=False, options=options)
+        else:
+            is_run = True
+            operation.run_now(options=options)
+        self._timings[operation.get_name()] = time.perf_counter() - start_time
+        return is_run
+
     def run(
             self,
             operations: Optional[list] = None,
             if_not_yet: bool = True,
             options: Optional[dict] = None,
+            workers: int = DEFAULT_WORKERS_COUNT,
+            verbose: bool = True,
     ):
+        """Runs operations (all operations from queue by default).
+
+        With if_not_yet=True up-to-date syncs are skipped (like targets of build system),
+        operations depending on (re)run operations are always run.
+        With workers > 1 independent operations (see get_dependencies()) are run concurrently by threads.
+        After first failure no more operations are started, error is raised when running operations are finished.
+        Durations of operations are available by get_timings(), longest chain by get_critical_path().
+        """
         if operations is None:
             operations = self.get_queue()
-        operations = [self.get_operation(op) for op in operations]
-        names = [op.get_name() for op in operations]
-        for name, operation in zip(names, operations):
-            options = self.get_options(including=operation, upd=options)
-            if if_not_yet and hasattr(operation, 'run_if_not_yet'):
-                operation.run_if_not_yet(options=options)
-            else:
-                operation.run_now(options=options)
+        operations = {op.get_name(): op for op in [self.get_operation(i) for i in operations]}
+        dependencies = self.get_dependencies(list(operations.values()))
+        self._dependencies = dependencies
+        self._timings = dict()
+        self._run_operations = set()
+        start_time = time.perf_counter()
+        if not workers or workers <= 1:
+            for name, operation in operations.items():
+                is_forced = bool(dependencies[name] & self._run_operations)
+                if self._run_operation(operation, if_not_yet=if_not_yet and not is_forced, options=options):
+                    self._run_operations.add(name)
+        else:
+            self._run_concurrently(operations, dependencies, workers, if_not_yet=if_not_yet, options=options)
+        if verbose:
+            total_duration = time.perf_counter() - start_time
+            path, path_duration = self.get_critical_path()
+            path_str = ' -> '.join(path)
+            run_count, skipped_count = len(self._run_operations), len(operations) - len(self._run_operations)
+            self.log(
+                f'Job {self.get_name()} done in {total_duration:.3f}s ({run_count} run, {skipped_count} up-to-date), '
+                f'critical path {path_duration:.3f}s: {path_str}'
+            )
+
+    def _run_concurrently(
+            self,
+            operations: dict,
+            dependencies: dict,
+            workers: int,
+            if_not_yet: bool = True,
+            options: Optional[dict] = None,
+    ) -> None:
+        waiting = {name: set(required) for name, required in dependencies.items()}
+        in_flight = dict()
+        error = None
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while waiting or in_flight:
+                if error is None:
+                    ready = [name for name, required in waiting.items() if not required]
+                    for name in ready:
+                        waiting.pop(name)
+                        is_forced = bool(dependencies[name] & self._run_operations)
+                        future = executor.submit(
+                            self._run_operation, operations[name], if_not_yet and not is_forced, options,
+                        )
+                        in_flight[future] = name
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = in_flight.pop(future)
+                    try:
+                        is_run = future.result()
+                    except Exception as e:
+                        self.log(f'Operation {name} failed: {e}', level=30)
+                        if error is None:
+                            error = e
+                    else:
+                        if is_run:
+                            self._run_operations.add(name)
+                        for required in waiting.values():
+                            required.discard(name)
+        if error is not None:
+            raise error
+        assert not waiting, f'operations were not run: {list(waiting)}'
 
     @staticmethod
     def _assume_native(obj) -> Native:
@@ -19,6 +19,7 @@ class MultiSync(AbstractSync):
             options: Optional[dict] = None,
             apply_to_stream: bool = True,
             item_type: ItemType = ItemType.Auto,
+            content_hash: bool = False,
             context: Context = None,
     ):
         connectors = dict()
@@ -34,6 +35,7 @@ class MultiSync(AbstractSync):
             options=options,
             apply_to_stream=apply_to_stream,
             item_type=item_type,
+            content_hash=content_hash,
             context=context,
         )
 
@@ -63,7 +65,9 @@ class MultiSync(AbstractSync):
                 stream = self.get_procedure()(stream, **self.get_kwargs(ex=SRC_ID, upd=options))
             else:
                 stream = self.get_procedure()(**self.get_kwargs())
-        return stream.write_to(self.get_dst(), return_stream=return_stream)
+        result = stream.write_to(self.get_dst(), return_stream=return_stream)
+        self.save_manifest(options=options)
+        return result
 
     def run_if_not_yet(
             self,
@@ -75,8 +79,8 @@ class MultiSync(AbstractSync):
     ) -> Optional[Stream]:
         if item_type in (ItemType.Auto, None):
             item_type = self.get_item_type()
-        if not self.is_done():
-            return self.run_now(return_stream=return_stream, item_type=item_type, verbose=verbose)
+        if self.is_stale(options=options):
+            return self.run_now(return_stream=return_stream, item_type=item_type, options=options, verbose=verbose)
         elif raise_error_if_exists:
             raise ValueError(f'object {self.get_dst()} already exists')
         elif return_stream:
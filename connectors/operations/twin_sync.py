@@ -20,6 +20,7 @@ class TwinSync(AbstractSync):
             options: Optional[dict] = None,
             apply_to_stream: bool = True,
             item_type: ItemType = ItemType.Auto,
+            content_hash: bool = False,
             context: Context = None,
     ):
         if options is None:
@@ -31,6 +32,7 @@ class TwinSync(AbstractSync):
             options=options,
             apply_to_stream=apply_to_stream,
             item_type=item_type,
+            content_hash=content_hash,
             context=context,
         )
 
@@ -72,7 +74,9 @@ class TwinSync(AbstractSync):
                 stream = self.get_procedure()(stream, **self.get_kwargs(upd=options))
             else:
                 stream = stream.apply_to_data(self.get_procedure(), **self.get_kwargs(upd=options))
-        return stream.write_to(self.get_dst(), return_stream=return_stream)
+        result = stream.write_to(self.get_dst(), return_stream=return_stream)
+        self.save_manifest(options=options)
+        return result
 
     def from_stream(self, stream: Stream, rewrite: bool = False) -> Optional[Connector]:
         if rewrite or not self.has_inputs():
@@ -1,5 +1,8 @@
 from typing import Optional, Iterable, Generator, Union
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 import io
+import time
 
 try:  # Assume we're a submodule in a package.
     from utils.decorators import deprecated_with_alternative
@@ -15,6 +18,10 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
 Response = dict
 
 DEFAULT_KEYS_LIMIT = 1000
+DEFAULT_RANGE_SIZE = 8 * 1024 * 1024
+DEFAULT_RANGES_IN_FLIGHT = 4
+DEFAULT_CACHE_TTL = 60  # seconds
+NOT_FOUND_ERROR_CODES = '404', 'NoSuchKey', 'NotFound'
 COVERT_PROPS = 'access_key', 'secret_key'
 
 
@@ -26,6 +33,7 @@ class S3Bucket(HierarchicFolder):
             verbose: bool = True,
             access_key: Optional[str] = None,
             secret_key: Optional[str] = None,
+            cache_ttl: Optional[float] = DEFAULT_CACHE_TTL,
     ):
         assert '_' not in name, 'Symbol "_" is not allowed for bucket name, use "-" instead'
         self._session = None
@@ -33,6 +41,9 @@ class S3Bucket(HierarchicFolder):
         self._resource = None
         self._access_key = None
         self._secret_key = None
+        self._cache_ttl = cache_ttl
+        self._objects_cache = dict()
+        self._listings_cache = dict()
         storage = self._assume_native(storage)
         super().__init__(name=name, parent=storage, verbose=verbose)
         if access_key is not None:
@@ -109,6 +120,10 @@ class S3Bucket(HierarchicFolder):
             self.reset_client(props)
         return self._client
 
+    def set_client(self, client):
+        self._client = client
+        return self
+
     def reset_client(self, props: Optional[dict] = None, inplace: bool = True):
         if not props:
             props = self.get_storage().get_resource_properties()
@@ -128,11 +143,58 @@ class S3Bucket(HierarchicFolder):
         self._resource = resource
         return resource if inplace else self
 
+    def get_cache_ttl(self) -> Optional[float]:
+        return self._cache_ttl
+
+    def _get_from_cache(self, cache: dict, key: str):
+        ttl = self.get_cache_ttl()
+        if ttl and key in cache:
+            timestamp, value = cache[key]
+            if time.time() - timestamp < ttl:
+                return value
+            else:
+                cache.pop(key)
+
+    def _add_to_cache(self, cache: dict, key: str, value) -> None:
+        if self.get_cache_ttl():
+            cache[key] = time.time(), value
+
+    def reset_cache(self, object_path_in_bucket: Optional[str] = None) -> None:
+        if object_path_in_bucket is None:
+            self._objects_cache.clear()
+            self._listings_cache.clear()
+        else:
+            self._objects_cache.pop(object_path_in_bucket, None)
+            for prefix in list(self._listings_cache):
+                if object_path_in_bucket.startswith(prefix):
+                    self._listings_cache.pop(prefix)
+
+    @staticmethod
+    def _is_not_found_error(e: Exception) -> bool:
+        response = getattr(e, 'response', None) or dict()
+        return str(response.get('Error', dict()).get('Code')) in NOT_FOUND_ERROR_CODES
+
+    def get_object_metadata(self, object_path_in_bucket: str, use_cache: bool = True) -> Optional[Response]:
+        if use_cache:
+            metadata = self._get_from_cache(self._objects_cache, object_path_in_bucket)
+            if metadata is not None:
+                return metadata
+        try:
+            metadata = self.get_client().head_object(Bucket=self.get_bucket_name(), Key=object_path_in_bucket)
+        except Exception as e:  # botocore.exceptions.ClientError
+            if self._is_not_found_error(e):
+                return None
+            else:
+                raise e
+        self._add_to_cache(self._objects_cache, object_path_in_bucket, metadata)
+        return metadata
+
     def list_objects(
             self,
             params: Optional[dict] = None,
             v2: bool = False,
             field: Optional[str] = 'Contents',
+            prefix: Optional[str] = None,
             verbose: Optional[bool] = None,
     ) -> Union[dict, list]:
         if not params:
@@ -141,6 +203,8 @@ class S3Bucket(HierarchicFolder):
             params['Bucket'] = self.get_name()
         if 'Delimiter' not in params:
             params['Delimiter'] = self.get_path_delimiter()
+        if prefix and 'Prefix' not in params:
+            params['Prefix'] = prefix
         client = self.get_client(self.get_storage().get_resource_properties())
         if verbose:
             self.log(f'Getting objects from s3-bucket {self.get_name()}...', verbose=verbose)  # level=LoggingLevel.Debug
@@ -149,12 +213,26 @@ class S3Bucket(HierarchicFolder):
         else:
             objects = client.list_objects(**params)
         if field:
-            return objects[field]
+            return objects.get(field, list())
         else:
             return objects
 
-    def yield_objects(self, params: Optional[dict] = None, verbose: Optional[bool] = None) -> Generator:
+    def yield_objects(
+            self,
+            params: Optional[dict] = None,
+            prefix: Optional[str] = None,
+            use_cache: bool = True,
+            verbose: Optional[bool] = None,
+    ) -> Generator:
+        cache_key = prefix or ''
+        use_cache = use_cache and not params
+        if use_cache:
+            cached_objects = self._get_from_cache(self._listings_cache, cache_key)
+            if cached_objects is not None:
+                yield from cached_objects
+                return None
         continuation_token = None
+        received_objects = list()
         if not params:
             params = dict()
         if 'MaxKeys' not in params:
@@ -162,18 +240,22 @@ class S3Bucket(HierarchicFolder):
         while True:
             if continuation_token:
                 params['ContinuationToken'] = continuation_token
-            response = self.list_objects(params=params, v2=True, field=None, verbose=verbose)
-            yield from response.get('Contents', [])
+            response = self.list_objects(params=params, v2=True, field=None, prefix=prefix, verbose=verbose)
+            page = response.get('Contents', [])
+            received_objects += page
+            yield from page
             if not response.get('IsTruncated'):
                 break
             continuation_token = response.get('NextContinuationToken')
+        if use_cache:  # listing is cached only after it has been received completely
+            self._add_to_cache(self._listings_cache, cache_key, received_objects)
 
-    def yield_object_names(self, verbose: Optional[bool] = None) -> Generator:
-        for obj in self.yield_objects(verbose=verbose):
+    def yield_object_names(self, prefix: Optional[str] = None, verbose: Optional[bool] = None) -> Generator:
+        for obj in self.yield_objects(prefix=prefix, verbose=verbose):
             yield obj['Key']
 
-    def list_object_names(self, verbose: Optional[bool] = None) -> list:
-        return list(self.yield_object_names(verbose=verbose))
+    def list_object_names(self, prefix: Optional[str] = None, verbose: Optional[bool] = None) -> list:
+        return list(self.yield_object_names(prefix=prefix, verbose=verbose))
 
     def list_prefixes(self, verbose: Optional[bool] = None) -> Iterable:
         return self.list_objects(field='CommonPrefixes', verbose=verbose)
@@ -181,11 +263,55 @@ class S3Bucket(HierarchicFolder):
     def get_object(self, object_path_in_bucket: str):
         return self.get_resource().Object(self.get_bucket_name(), object_path_in_bucket)
 
-    def get_buffer(self, object_path_in_bucket: str):
+    def get_buffer(
+            self,
+            object_path_in_bucket: str,
+            range_size: int = DEFAULT_RANGE_SIZE,
+            max_ranges_in_flight: int = DEFAULT_RANGES_IN_FLIGHT,
+    ):
         buffer = io.BytesIO()
-        self.get_object(object_path_in_bucket).download_fileobj(buffer)
+        if max_ranges_in_flight > 1:
+            for block in self.get_object_blocks(object_path_in_bucket, range_size, max_ranges_in_flight):
+                buffer.write(block)
+            buffer.seek(0)
+        else:
+            self.get_object(object_path_in_bucket).download_fileobj(buffer)
         return buffer
 
+    def get_object_size(self, object_path_in_bucket: str) -> int:
+        return self.get_object_metadata(object_path_in_bucket)['ContentLength']
+
+    def get_object_range(self, object_path_in_bucket: str, first_byte: int, last_byte: int) -> bytes:
+        response = self.get_client().get_object(
+            Bucket=self.get_bucket_name(),
+            Key=object_path_in_bucket,
+            Range=f'bytes={first_byte}-{last_byte}',
+        )
+        return response['Body'].read()
+
+    def get_object_blocks(
+            self,
+            object_path_in_bucket: str,
+            range_size: int = DEFAULT_RANGE_SIZE,
+            max_ranges_in_flight: int = DEFAULT_RANGES_IN_FLIGHT,
+            object_size: Optional[int] = None,
+    ) -> Generator:
+        if object_size is None:
+            object_size = self.get_object_size(object_path_in_bucket)
+        ranges = [(first, min(first + range_size, object_size) - 1) for first in range(0, object_size, range_size)]
+        with ThreadPoolExecutor(max_workers=max_ranges_in_flight) as executor:
+            in_flight = deque()  # ordered reassembly buffer, keeps not more than max_ranges_in_flight blocks
+            try:
+                for first_byte, last_byte in ranges:
+                    if len(in_flight) >= max_ranges_in_flight:
+                        yield in_flight.popleft().result()
+                    in_flight.append(executor.submit(self.get_object_range, object_path_in_bucket, first_byte, last_byte))
+                while in_flight:
+                    yield in_flight.popleft().result()
+            finally:  # stream can be closed before the end (i.e. after take())
+                for future in in_flight:
+                    future.cancel()
+
     def create(self, if_not_yet: bool = False, inplace: bool = False) -> Union[ConnectorInterface, Response]:
         if self.is_existing() and not if_not_yet:
             raise ValueError('Bucket {} already existing'.format(self))
@@ -1,4 +1,8 @@
-from typing import Optional, Generator, Iterator, Union
+from typing import Optional, Iterable, Generator, Iterator, Union
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import chain
+import codecs
+import zlib
 
 try:  # Assume we're a submodule in a package.
     from interfaces import (
@@ -7,6 +11,7 @@ try:  # Assume we're a submodule in a package.
         Context, Count, Name,
     )
     from streams.stream_builder import StreamBuilder
+    from utils.readahead import ReadaheadBlocks
     from connectors.abstract.leaf_connector import LeafConnector
 except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
     from ...interfaces import (
@@ -15,12 +20,22 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
         Context, Count, Name,
     )
     from ...streams.stream_builder import StreamBuilder
+    from ...utils.readahead import ReadaheadBlocks
     from ..abstract.leaf_connector import LeafConnector
 
 Response = dict
 
 DEFAULT_STORAGE_CLASS = 'COLD'
 HTTP_OK = 200
+MB = 1024 * 1024
+MIN_PART_SIZE = 5 * MB  # S3 limit for all parts of multipart upload except the last one
+DEFAULT_PART_SIZE = 8 * MB
+MAX_PARTS_COUNT = 10000
+DEFAULT_UPLOAD_WORKERS = 4
+DEFAULT_RANGE_SIZE = DEFAULT_PART_SIZE
+DEFAULT_RANGES_IN_FLIGHT = 4
+COUNT_METADATA_KEY = 'rows-count'
+GZIP_WBITS = zlib.MAX_WBITS | 16
 
 
 class S3Object(LeafConnector):
@@ -32,8 +47,14 @@ class S3Object(LeafConnector):
             folder: ConnectorInterface = None,
             context: Context = None,
             expected_count: Count = None,
+            range_size: int = DEFAULT_RANGE_SIZE,
+            max_ranges_in_flight: int = DEFAULT_RANGES_IN_FLIGHT,
+            readahead_depth: int = 0,
             verbose: Optional[bool] = None,
     ):
+        self._range_size = range_size
+        self._max_ranges_in_flight = max_ranges_in_flight
+        self._readahead_depth = readahead_depth
         super().__init__(
             name=name,
             content_format=content_format, struct=struct,
@@ -78,22 +99,77 @@ class S3Object(LeafConnector):
     def get_body(self):
         return self.get_object_response()['Body']
 
-    def get_next_lines(self, count: Count = None) -> Iterator[str]:
+    def get_range_size(self) -> int:
+        return self._range_size
+
+    def get_max_ranges_in_flight(self) -> int:
+        return self._max_ranges_in_flight
+
+    def get_readahead_depth(self) -> int:
+        return self._readahead_depth
+
+    def set_readahead(self, depth: int, block_size: Optional[int] = None) -> LeafConnector:
+        """Enables downloading (and gzip decompression) of blocks by background thread while lines are parsed,
+        depth is max count of blocks downloaded ahead, block_size is size of ranges, 0 disables readahead.
+        """
+        self._readahead_depth = depth
+        if block_size:
+            self._range_size = block_size
+        return self
+
+    def is_readahead(self) -> bool:
+        return bool(self.get_readahead_depth())
+
+    def get_object_size(self) -> int:
+        return self.get_bucket().get_object_size(self.get_object_path_in_bucket())
+
+    def get_blocks(self) -> Iterable[bytes]:
+        range_size = self.get_range_size()
+        max_ranges_in_flight = self.get_max_ranges_in_flight()
+        if range_size and max_ranges_in_flight > 1:
+            object_size = self.get_object_size()
+            if object_size > range_size:
+                return self.get_bucket().get_object_blocks(
+                    self.get_object_path_in_bucket(),
+                    range_size=range_size,
+                    max_ranges_in_flight=max_ranges_in_flight,
+                    object_size=object_size,
+                )
+        return self.get_body()
+
+    def get_decompressed_blocks(self) -> Iterable[bytes]:
+        blocks = self.get_blocks()
+        if not self.is_gzip():
+            return blocks
+        decompressor = zlib.decompressobj(GZIP_WBITS)
+        return chain((decompressor.decompress(b) for b in blocks), [decompressor.flush()])
+
+    def get_next_lines(self, count: Count = None, encoding: str = 'utf8') -> Iterator[str]:
+        decoder = codecs.getincrementaldecoder(encoding)(errors='ignore')  # multibyte chars can cross blocks
+        if self.is_readahead():  # blocks are downloaded by background thread while lines are parsed
+            blocks = ReadaheadBlocks(self.get_decompressed_blocks, queue_depth=self.get_readahead_depth())
+        else:
+            blocks = self.get_decompressed_blocks()
         prev_line = ''
-        for b, buffer in enumerate(self.get_body()):
-            lines = buffer.decode('utf8', errors='ignore').split('\n')
-            cnt = len(lines)
-            for n, line in enumerate(lines):
-                if n == 0:
-                    line = prev_line + line
-                is_last = n >= cnt - 1
-                if is_last:
-                    prev_line = line
-                else:
-                    yield line
-            if count is not None:
-                if b >= count:
-                    break
+        try:
+            for b, block in enumerate(blocks):
+                lines = decoder.decode(block).split('\n')
+                cnt = len(lines)
+                for n, line in enumerate(lines):
+                    if n == 0:
+                        line = prev_line + line
+                    is_last = n >= cnt - 1
+                    if is_last:
+                        prev_line = line
+                    else:
+                        yield line
+                if count is not None:
+                    if b >= count:
+                        break
+        finally:  # stops background download also when consumer stopped early (i.e. after take())
+            if isinstance(blocks, ReadaheadBlocks):
+                blocks.close()
+        prev_line += decoder.decode(b'', final=True)
         if prev_line:
             yield prev_line
 
@@ -135,13 +211,20 @@ class S3Object(LeafConnector):
     def get_data(self) -> Iterator[str]:
         return self.get_lines()
 
-    def put_object(self, data, storage_class=DEFAULT_STORAGE_CLASS) -> Response:
-        return self.get_client().put_object(
+    def get_object_metadata(self, use_cache: bool = True) -> Optional[Response]:
+        return self.get_bucket().get_object_metadata(self.get_object_path_in_bucket(), use_cache=use_cache)
+
+    def put_object(self, data, storage_class=DEFAULT_STORAGE_CLASS, metadata: Optional[dict] = None) -> Response:
+        props = dict(Metadata=metadata) if metadata else dict()
+        response = self.get_client().put_object(
             Bucket=self.get_bucket_name(),
             Key=self.get_object_path_in_bucket(),
             Body=data,
             StorageClass=storage_class,
+            **props
         )
+        self.get_bucket().reset_cache(self.get_object_path_in_bucket())
+        return response
 
     def upload_file(self, file: Union[LeafConnector, str], extra_args={}) -> Response:
         if isinstance(file, str):
@@ -151,41 +234,146 @@ class S3Object(LeafConnector):
         else:
             message = 'file-argument must be path to local file or File(LeafConnector) object (got {} as {})'
             raise TypeError(message.format(file, type(file)))
-        return self.get_client().upload_file(
+        response = self.get_client().upload_file(
             Filename=filename,
             Bucket=self.get_bucket_name(),
-            Key=self.get_path(),
+            Key=self.get_object_path_in_bucket(),
             ExtraArgs=extra_args,
         )
+        self.get_bucket().reset_cache(self.get_object_path_in_bucket())
+        return response
 
     def is_existing(self, verbose: Optional[bool] = None) -> bool:
         bucket = self.get_bucket()
-        if bucket.is_existing(verbose=verbose):
-            if hasattr(bucket, 'list_object_names'):  # isinstance(bucket, S3Bucket)
-                return self.get_object_path_in_bucket() in bucket.list_object_names(verbose=verbose)
-            else:
-                raise TypeError(f'Expected bucket as S3Bucket, got {bucket}')
+        if hasattr(bucket, 'get_object_metadata'):  # isinstance(bucket, S3Bucket)
+            return self.get_object_metadata() is not None
         else:
-            return False
+            raise TypeError(f'Expected bucket as S3Bucket, got {bucket}')
 
     def _get_lines_from_stream(self, stream: Stream) -> Generator:
         content_format = self.get_content_format()
+        count = 0
         for i in stream.get_items():
             if hasattr(content_format, 'get_formatted_item'):
                 line = content_format.get_formatted_item(i)
             else:
                 line = str(i)
             yield line
+            count += 1
+        self.set_count(count)
 
-    def from_stream(self, stream: Stream, storage_class=DEFAULT_STORAGE_CLASS, encoding='utf8', verbose: bool = True):
+    def from_stream(
+            self,
+            stream: Stream,
+            storage_class: str = DEFAULT_STORAGE_CLASS,
+            encoding: str = 'utf8',
+            part_size: int = DEFAULT_PART_SIZE,
+            max_workers: int = DEFAULT_UPLOAD_WORKERS,
+            verbose: bool = True,
+    ):
+        if part_size < MIN_PART_SIZE:
+            raise ValueError(f'part_size must be at least {MIN_PART_SIZE} bytes (S3 limit), got {part_size}')
+        expected_count = stream.get_count() if hasattr(stream, 'get_count') else None
         lines = self._get_lines_from_stream(stream)
-        data = bytes('\n'.join(lines), encoding=encoding)
-        response = self.put_object(data=data, storage_class=storage_class)
-        is_done = response.get('ResponseMetadata').get('HTTPStatusCode') == HTTP_OK
-        if is_done:
-            return self
-        else:
-            raise ValueError(response)
+        parts = self._get_encoded_parts(lines, part_size=part_size, encoding=encoding)
+        first_part = next(parts)
+        second_part = next(parts, None)
+        if second_part is None:  # data fits into one part, single put_object() is enough
+            metadata = self._get_count_metadata(self.get_expected_count())  # all lines were already received
+            response = self.put_object(data=first_part, storage_class=storage_class, metadata=metadata)
+            is_done = response.get('ResponseMetadata').get('HTTPStatusCode') == HTTP_OK
+            if not is_done:
+                raise ValueError(response)
+        else:  # metadata must be sent before the parts, so the count is known only if the stream knows it
+            metadata = self._get_count_metadata(expected_count)
+            parts = chain([first_part, second_part], parts)
+            self.upload_parts(
+                parts, storage_class=storage_class, metadata=metadata,
+                max_workers=max_workers, verbose=verbose,
+            )
+        return self
+
+    @staticmethod
+    def _get_count_metadata(count: Count) -> Optional[dict]:
+        if isinstance(count, int):
+            return {COUNT_METADATA_KEY: str(count)}
+
+    @staticmethod
+    def _get_encoded_parts(lines: Iterable[str], part_size: int, encoding: str = 'utf8') -> Generator:
+        delimiter = '\n'.encode(encoding)
+        chunks, chunks_size, parts_count = list(), 0, 0
+        for n, line in enumerate(lines):
+            if n > 0:
+                chunks.append(delimiter)
+                chunks_size += len(delimiter)
+            encoded_line = line.encode(encoding)
+            chunks.append(encoded_line)
+            chunks_size += len(encoded_line)
+            if chunks_size >= part_size:
+                yield b''.join(chunks)
+                parts_count += 1
+                chunks, chunks_size = list(), 0
+        if chunks or not parts_count:
+            yield b''.join(chunks)
+
+    @staticmethod
+    def _get_checked_parts(parts: Iterable[bytes]) -> Generator:
+        """Yields parts checking that every part except the last one is not less than MIN_PART_SIZE,
+        so upload is aborted before sending next parts (S3 rejects small parts only on completing upload).
+        """
+        previous = None
+        for part in parts:
+            if previous is not None:
+                if len(previous) < MIN_PART_SIZE:
+                    raise ValueError(f'Expected parts not less than {MIN_PART_SIZE} bytes, got {len(previous)}')
+                yield previous
+            previous = part
+        if previous is not None:
+            yield previous
+
+    def upload_parts(
+            self,
+            parts: Iterable[bytes],
+            storage_class: str = DEFAULT_STORAGE_CLASS,
+            metadata: Optional[dict] = None,
+            max_workers: int = DEFAULT_UPLOAD_WORKERS,
+            verbose: bool = True,
+    ) -> Response:
+        client = self.get_client()
+        object_props = dict(Bucket=self.get_bucket_name(), Key=self.get_object_path_in_bucket())
+        upload_props = dict(Metadata=metadata) if metadata else dict()
+        response = client.create_multipart_upload(**object_props, StorageClass=storage_class, **upload_props)
+        upload_id = response['UploadId']
+        uploaded_parts = list()
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                in_flight = dict()  # bounds memory usage by max_workers parts (plus one being encoded)
+                for part_no, body in enumerate(self._get_checked_parts(parts), start=1):
+                    if part_no > MAX_PARTS_COUNT:
+                        raise ValueError(f'Expected not more than {MAX_PARTS_COUNT} parts, try to increase part_size')
+                    if len(in_flight) >= max_workers:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            uploaded_parts.append(dict(ETag=future.result()['ETag'], PartNumber=in_flight.pop(future)))
+                    future = executor.submit(
+                        client.upload_part,
+                        **object_props, UploadId=upload_id, PartNumber=part_no, Body=body,
+                    )
+                    in_flight[future] = part_no
+                for future in wait(in_flight).done:
+                    uploaded_parts.append(dict(ETag=future.result()['ETag'], PartNumber=in_flight[future]))
+            uploaded_parts.sort(key=lambda p: p['PartNumber'])
+            response = client.complete_multipart_upload(
+                **object_props, UploadId=upload_id,
+                MultipartUpload=dict(Parts=uploaded_parts),
+            )
+        except BaseException:
+            client.abort_multipart_upload(**object_props, UploadId=upload_id)
+            raise
+        finally:
+            self.get_bucket().reset_cache(self.get_object_path_in_bucket())
+        self.log(f'Uploaded {len(uploaded_parts)} parts into {self.get_name()}', verbose=verbose)
+        return response
 
     def to_stream(self, item_type: ItemType = None, **kwargs) -> Stream:
         return StreamBuilder.stream(self.get_data(), item_type=item_type, **kwargs)
@@ -194,7 +382,11 @@ class S3Object(LeafConnector):
         return self._count
 
     def get_count(self, *args, **kwargs) -> Optional[int]:
-        return None  # not available property
+        metadata = self.get_object_metadata()
+        if metadata:
+            count = metadata.get('Metadata', dict()).get(COUNT_METADATA_KEY)
+            if count is not None:
+                return int(count)
 
     def is_empty(self, verbose: Optional[bool] = None) -> Optional[bool]:
         if verbose is None:
@@ -202,13 +394,18 @@ class S3Object(LeafConnector):
         if self.is_accessible():
             return not self.get_first_line(close=True, skip_missing=True, verbose=verbose)
 
-    def get_modification_timestamp(self):
-        path = self.get_object_path_in_bucket()
-        bucket = self.get_bucket()
-        for i in bucket.yield_objects():
-            if i['Key'] == path:
-                modification_datetime = i['LastModified']
-                return modification_datetime.timestamp()
+    def get_modification_timestamp(self) -> Optional[float]:
+        metadata = self.get_object_metadata()
+        if metadata:
+            return metadata['LastModified'].timestamp()
+
+    def get_fingerprint(self, content_hash: bool = False) -> dict:
+        """Returns size and ETag of object, ETag already depends on content, so content_hash is not used."""
+        metadata = self.get_object_metadata(use_cache=False)
+        if metadata:
+            return dict(exists=True, size=metadata.get('ContentLength'), etag=metadata.get('ETag'))
+        else:
+            return dict(exists=False)
 
 
 ConnType.add_classes(S3Object)
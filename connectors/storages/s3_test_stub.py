@@ -0,0 +1,141 @@
+from typing import Optional
+from datetime import datetime, timezone
+
+try:  # Assume we're a submodule in a package.
+    from connectors.storages.s3_object import HTTP_OK
+except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
+    from .s3_object import HTTP_OK
+
+Response = dict
+
+DEFAULT_CHUNK_SIZE = 1024
+DEFAULT_KEYS_LIMIT = 1000
+
+
+class NotFoundTestError(Exception):
+    def __init__(self, key: str):
+        self.response = dict(Error=dict(Code='404', Message=f'Not Found: {key}'))
+        super().__init__(self.response['Error']['Message'])
+
+
+class BodyTestStub:
+    def __init__(self, data: bytes, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.data = data
+        self.chunk_size = chunk_size
+
+    def read(self) -> bytes:
+        return self.data
+
+    def __iter__(self):
+        data, chunk_size = self.data, self.chunk_size
+        for i in range(0, len(data), chunk_size):
+            yield data[i: i + chunk_size]
+
+
+class S3ClientTestStub:
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.objects = dict()
+        self.metadata = dict()
+        self.modified = dict()
+        self.uploads = dict()
+        self.calls = list()
+
+    @staticmethod
+    def _get_ok_response(**kwargs) -> Response:
+        return dict(ResponseMetadata=dict(HTTPStatusCode=HTTP_OK), **kwargs)
+
+    def _set_object(self, bucket: str, key: str, data: bytes, metadata: Optional[dict] = None) -> None:
+        self.objects[(bucket, key)] = data
+        self.metadata[(bucket, key)] = metadata or dict()
+        self.modified[(bucket, key)] = datetime.now(timezone.utc)
+
+    def put_object(
+            self,
+            Bucket: str,
+            Key: str,
+            Body: bytes,
+            StorageClass: Optional[str] = None,
+            Metadata: Optional[dict] = None,
+    ) -> Response:
+        self.calls.append('put_object')
+        self._set_object(Bucket, Key, bytes(Body), metadata=Metadata)
+        return self._get_ok_response()
+
+    def upload_file(self, Filename: str, Bucket: str, Key: str, ExtraArgs: Optional[dict] = None) -> None:
+        self.calls.append('upload_file')
+        with open(Filename, 'rb') as fileholder:
+            self._set_object(Bucket, Key, fileholder.read(), metadata=(ExtraArgs or dict()).get('Metadata'))
+
+    def create_multipart_upload(
+            self,
+            Bucket: str,
+            Key: str,
+            StorageClass: Optional[str] = None,
+            Metadata: Optional[dict] = None,
+    ) -> Response:
+        self.calls.append('create_multipart_upload')
+        upload_id = str(len(self.uploads) + 1)
+        self.uploads[upload_id] = dict(metadata=Metadata, parts=dict())
+        return self._get_ok_response(UploadId=upload_id)
+
+    def upload_part(self, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body: bytes) -> Response:
+        self.calls.append('upload_part')
+        self.uploads[UploadId]['parts'][PartNumber] = bytes(Body)
+        return self._get_ok_response(ETag=f'"{UploadId}-{PartNumber}"')
+
+    def complete_multipart_upload(self, Bucket: str, Key: str, UploadId: str, MultipartUpload: dict) -> Response:
+        self.calls.append('complete_multipart_upload')
+        upload = self.uploads.pop(UploadId)
+        uploaded_parts = upload['parts']
+        part_numbers = [p['PartNumber'] for p in MultipartUpload['Parts']]
+        assert part_numbers == sorted(uploaded_parts), f'{part_numbers} vs {sorted(uploaded_parts)}'
+        data = b''.join([uploaded_parts[n] for n in part_numbers])
+        self._set_object(Bucket, Key, data, metadata=upload['metadata'])
+        return self._get_ok_response()
+
+    def abort_multipart_upload(self, Bucket: str, Key: str, UploadId: str) -> Response:
+        self.calls.append('abort_multipart_upload')
+        self.uploads.pop(UploadId, None)
+        return self._get_ok_response()
+
+    def get_object(self, Bucket: str, Key: str, Range: Optional[str] = None) -> Response:
+        self.calls.append('get_object')
+        if (Bucket, Key) not in self.objects:
+            raise NotFoundTestError(Key)
+        data = self.objects[(Bucket, Key)]
+        if Range:
+            first_byte, last_byte = Range.split('=')[-1].split('-')
+            data = data[int(first_byte): int(last_byte) + 1]
+        body = BodyTestStub(data, chunk_size=self.chunk_size)
+        return self._get_ok_response(Body=body, ContentLength=len(data))
+
+    def head_object(self, Bucket: str, Key: str) -> Response:
+        self.calls.append('head_object')
+        if (Bucket, Key) not in self.objects:
+            raise NotFoundTestError(Key)
+        return self._get_ok_response(
+            ContentLength=len(self.objects[(Bucket, Key)]),
+            LastModified=self.modified[(Bucket, Key)],
+            Metadata=self.metadata[(Bucket, Key)],
+        )
+
+    def list_objects_v2(
+            self,
+            Bucket: str,
+            Delimiter: Optional[str] = None,
+            Prefix: str = '',
+            MaxKeys: int = DEFAULT_KEYS_LIMIT,
+            ContinuationToken: Optional[str] = None,
+    ) -> Response:
+        self.calls.append('list_objects_v2')
+        keys = sorted(k for b, k in self.objects if b == Bucket and k.startswith(Prefix))
+        first = int(ContinuationToken or 0)
+        page = keys[first: first + MaxKeys]
+        contents = [
+            dict(Key=k, Size=len(self.objects[(Bucket, k)]), LastModified=self.modified[(Bucket, k)])
+            for k in page
+        ]
+        is_truncated = first + MaxKeys < len(keys)
+        props = dict(NextContinuationToken=str(first + MaxKeys)) if is_truncated else dict()
+        return self._get_ok_response(Contents=contents, IsTruncated=is_truncated, KeyCount=len(page), **props)
@@ -1,15 +1,17 @@
-from typing import Optional
-import json
+from typing import Optional, Iterable, Generator
+from itertools import islice
 
 try:  # Assume we're a submodule in a package.
     from interfaces import Item, ItemType, StreamType, ContentType, ARRAY_TYPES
     from base.constants.chars import PARAGRAPH_CHAR
     from base.constants.text import DEFAULT_ENCODING
+    from utils.json_codecs import get_json_codec, DEFAULT_BATCH_SIZE
     from content.format.abstract_format import AbstractFormat, ParsedFormat, Compress
 except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
     from ...interfaces import Item, ItemType, StreamType, ContentType, ARRAY_TYPES
     from ...base.constants.chars import PARAGRAPH_CHAR
     from ...base.constants.text import DEFAULT_ENCODING
+    from ...utils.json_codecs import get_json_codec, DEFAULT_BATCH_SIZE
     from .abstract_format import AbstractFormat, ParsedFormat, Compress
 
 
@@ -100,31 +102,52 @@ class JsonFormat(TextFormat):
         return ItemType.Record
 
     def get_formatted_item(self, item: Item, item_type: Optional[ItemType] = None) -> str:
-        return json.dumps(item)
+        return get_json_codec().dumps(item)
 
     @staticmethod
     def _parse_json_line(line: str, default_value=None):
-        try:
-            return json.loads(line)
-        except json.JSONDecodeError as err:
-            if default_value is not None:
-                return default_value
-            else:
-                raise json.JSONDecodeError(err.msg, err.doc, err.pos)
+        return get_json_codec().loads(line, default=default_value)
+
+    @staticmethod
+    def _get_typed_item(parsed: Item, item_type: ItemType) -> Item:
+        if isinstance(parsed, ARRAY_TYPES) and item_type == ItemType.Record:
+            return dict(item=parsed)
+        elif isinstance(parsed, dict) and item_type == ItemType.Row:
+            return [parsed]
+        else:
+            return parsed
 
     def get_parsed_line(self, line: str, item_type: ItemType = ItemType.Auto, default_value=None) -> Item:
         if item_type in (ItemType.Auto, None):
             item_type = self.get_default_item_type()
         if item_type in (ItemType.Record, ItemType.Row, ItemType.Any, ItemType.Auto):
             parsed = self._parse_json_line(line, default_value=default_value)
-            if isinstance(parsed, ARRAY_TYPES) and item_type == ItemType.Record:
-                return dict(item=parsed)
-            elif isinstance(parsed, dict) and item_type == ItemType.Row:
-                return [parsed]
-            else:
-                return parsed
+            return self._get_typed_item(parsed, item_type)
         elif item_type == ItemType.Line:
             return line
         else:
             class_name = self.__class__.__name__
             raise ValueError(f'item_type {item_type} is not supported for {class_name}.get_parsed_line()')
+
+    def get_items_from_lines(
+            self,
+            lines: Iterable,
+            item_type: ItemType = ItemType.Auto,
+            batch_size: int = DEFAULT_BATCH_SIZE,
+            **kwargs,
+    ) -> Generator:
+        """Parses lines by batches, every line is parsed separately, errors are the same as in per-line mode."""
+        assert not kwargs
+        if item_type in (ItemType.Auto, None):
+            item_type = self.get_default_item_type()
+        if item_type not in (ItemType.Record, ItemType.Row, ItemType.Any) or batch_size <= 1:
+            yield from super().get_items_from_lines(lines, item_type=item_type)
+            return
+        codec = get_json_codec()
+        iterator = iter(lines)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                break
+            for parsed in codec.loads_batch(batch):
+                yield self._get_typed_item(parsed, item_type)
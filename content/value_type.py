@@ -19,6 +19,8 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
     from ..functions.primary import numeric as nm
 
 SEQUENCE_TYPE_NAMES = 'list', 'tuple', 'range', 'set', 'sequence'
+NUMPY_DIALECT = 'np'
+DEFAULT_NUMPY_DTYPE = 'object'
 
 
 class ValueType(DynamicEnum):
@@ -57,6 +59,10 @@ class ValueType(DynamicEnum):
     def get_py_type(self):
         return self.get_type_in(dialect=DialectType.Python)
 
+    def get_numpy_dtype(self) -> str:
+        type_props = self.get_dialect_types().get(self.get_value(), {})
+        return type_props.get(NUMPY_DIALECT, DEFAULT_NUMPY_DTYPE)
+
     def isinstance(self, value) -> bool:
         if self == ValueType.Any:
             return True
@@ -175,10 +181,13 @@ ValueType._dict_dialect_types = {
     ValueType.Str16: dict(py=str, pg='varchar(16)', ch='FixedString(16)', str_to_py=str),
     ValueType.Str64: dict(py=str, pg='varchar(64)', ch='FixedString(64)', str_to_py=str),
     ValueType.Str256: dict(py=str, pg='varchar(256)', ch='FixedString(256)', str_to_py=str),
-    ValueType.Int: dict(py=int, pg='int', ch='Int32', str_to_py=ValueType.safe_converter(int)),
-    ValueType.Float: dict(py=float, pg='numeric', ch='Float32', str_to_py=ValueType.safe_converter(float)),
+    ValueType.Int: dict(py=int, pg='int', ch='Int32', np='int64', str_to_py=ValueType.safe_converter(int)),
+    ValueType.Float: dict(py=float, pg='numeric', ch='Float32', np='float64', str_to_py=ValueType.safe_converter(float)),
     ValueType.IsoDate: dict(py=str, pg='date', ch='Date', str_to_py=str),
-    ValueType.Bool: dict(py=bool, pg='bool', ch='UInt8', str_to_py=any_to_bool, py_to_ch=ValueType.safe_converter(int)),
+    ValueType.Bool: dict(
+        py=bool, pg='bool', ch='UInt8', np='bool',
+        str_to_py=any_to_bool, py_to_ch=ValueType.safe_converter(int),
+    ),
     ValueType.Sequence: dict(py=tuple, pg='text', str_to_py=ValueType.safe_converter(eval, tuple())),
     ValueType.Dict: dict(py=dict, pg='text', str_to_py=ValueType.safe_converter(eval, dict())),
 }
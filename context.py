@@ -3,6 +3,7 @@ import gc
 
 try:  # Assume we're a submodule in a package.
     from utils.decorators import singleton
+    from utils.memory import MemoryBudget
     from interfaces import (
         Context, ContextInterface, Connector, ConnType, Stream, ItemType,
         TemporaryLocationInterface, LoggerInterface, ExtendedLoggerInterface, SelectionLoggerInterface, LoggingLevel,
@@ -18,6 +19,7 @@ try:  # Assume we're a submodule in a package.
     from content.documents import document_classes as dc
 except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
     from .utils.decorators import singleton
+    from .utils.memory import MemoryBudget
     from .interfaces import (
         Context, ContextInterface, Connector, ConnType, Stream, ItemType,
         TemporaryLocationInterface, LoggerInterface, ExtendedLoggerInterface, SelectionLoggerInterface, LoggingLevel,
@@ -54,6 +56,7 @@ class SnakeeContext(bs.AbstractNamed, ContextInterface):
             conn_config: Optional[dict] = None,
             logger: Optional[Logger] = None,
             clear_tmp: bool = False,
+            memory_budget_bytes: Optional[int] = None,
     ):
         if name is None:
             name = NAME
@@ -64,6 +67,7 @@ class SnakeeContext(bs.AbstractNamed, ContextInterface):
         self.logger = logger
         self.stream_config = stream_config
         self.conn_config = conn_config
+        self.memory_budget = MemoryBudget(memory_budget_bytes)
         self.stream_instances = dict()
         self.conn_instances = dict()
 
@@ -115,6 +119,18 @@ class SnakeeContext(bs.AbstractNamed, ContextInterface):
                 logger.set_selection_logger(selection_logger)
         return selection_logger
 
+    def get_profiler(self, create_if_not_yet: bool = True):
+        logger = self.get_logger(create_if_not_yet=create_if_not_yet)
+        if hasattr(logger, 'get_profiler'):
+            return logger.get_profiler(create_if_not_yet=create_if_not_yet)
+
+    def get_memory_budget(self) -> MemoryBudget:
+        return self.memory_budget
+
+    def set_memory_budget_bytes(self, total_bytes: int) -> Context:
+        self.memory_budget.set_total_bytes(total_bytes)
+        return self
+
     def log(
             self,
             msg: str,
@@ -0,0 +1,235 @@
+from typing import Optional, Callable, Iterable, Generator, Sequence, Union, Any
+from itertools import islice, compress
+import math
+
+try:  # Assume we're a submodule in a package.
+    from utils.external import np
+except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
+    from ...utils.external import np
+
+Batch = dict  # column name -> list or numpy array of values
+Column = Union[list, Sequence]
+
+DEFAULT_BATCH_SIZE = 10000
+AGGREGATE_FUNCTIONS = 'count', 'sum', 'mean', 'avg', 'min', 'max'
+
+NUMERIC_KINDS = 'iuf'  # dtype kinds of int, unsigned int and float NumPy arrays
+MAX_INT64_FLOAT = 2.0 ** 63  # floats out of this range can not be converted to int64 without overflow
+
+
+def _get_int_array(values) -> Optional[Column]:
+    """Converts array as int() does for every value, returns None if int() fails (NaN, inf) or int64 overflows."""
+    if values.dtype.kind in 'iu':
+        return values
+    if np.isfinite(values).all() and (np.abs(values) < MAX_INT64_FLOAT).all():
+        return values.astype(int)
+
+
+def _get_sqrt_array(values) -> Optional[Column]:
+    """Returns None for negative values, so math.sqrt() raises ValueError for them in per-value mode."""
+    if not (values < 0).any():
+        return np.sqrt(values)
+
+
+if np:  # only functions with results equal to per-value results, None means fallback to per-value mode
+    VECTORIZED_FUNCTIONS = {
+        abs: np.abs,
+        float: lambda a: a.astype(float),
+        int: _get_int_array,
+        round: lambda a: _get_int_array(np.round(a)),
+        math.floor: lambda a: _get_int_array(np.floor(a)),
+        math.ceil: lambda a: _get_int_array(np.ceil(a)),
+        math.sqrt: _get_sqrt_array,
+    }
+else:
+    VECTORIZED_FUNCTIONS = dict()
+
+
+def _is_array(values) -> bool:
+    return bool(np) and isinstance(values, np.ndarray)
+
+
+def _is_defined(value) -> bool:
+    return value is not None and value == value  # NaN is not equal to itself
+
+
+def get_column(values: list, as_array: bool = True) -> Column:
+    """Converts list of values to NumPy array when all values are ints fitting int64 or all values are floats,
+    so array.tolist() returns the same values. Columns of mixed types stay lists.
+    """
+    if as_array and np and values:
+        if all(isinstance(v, int) and not isinstance(v, bool) for v in values):
+            try:
+                return np.array(values, dtype=np.int64)
+            except OverflowError:  # Python int out of int64 range
+                return values
+        elif all(isinstance(v, float) for v in values):
+            return np.array(values, dtype=np.float64)
+    return values
+
+
+def get_batch_len(batch: Batch) -> int:
+    for values in batch.values():
+        return len(values)
+    return 0
+
+
+def get_batches_from_rows(
+        rows: Iterable,
+        columns: Sequence,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        as_arrays: bool = True,
+) -> Generator:
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, batch_size))
+        if not chunk:
+            break
+        yield {c: get_column(list(values), as_array=as_arrays) for c, values in zip(columns, zip(*chunk))}
+
+
+def get_batches_from_records(
+        records: Iterable,
+        columns: Sequence,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        as_arrays: bool = True,
+) -> Generator:
+    rows = ([r.get(c) for c in columns] for r in records)
+    return get_batches_from_rows(rows, columns, batch_size=batch_size, as_arrays=as_arrays)
+
+
+def _get_list(values: Column) -> list:
+    return values.tolist() if _is_array(values) else list(values)
+
+
+def get_rows_from_batch(batch: Batch, columns: Optional[Sequence] = None) -> Iterable:
+    if columns is None:
+        columns = list(batch)
+    return zip(*[_get_list(batch[c]) for c in columns])
+
+
+def get_records_from_batch(batch: Batch, columns: Optional[Sequence] = None) -> Generator:
+    if columns is None:
+        columns = list(batch)
+    for row in get_rows_from_batch(batch, columns):
+        yield dict(zip(columns, row))
+
+
+def select_columns(batch: Batch, columns: Sequence, renames: Optional[dict] = None) -> Batch:
+    """Selects columns of batch without copying values, renames is dict of target -> source column names."""
+    selected = {c: batch[c] for c in columns}
+    if renames:
+        for target, source in renames.items():
+            selected[target] = batch[source]
+    return selected
+
+
+def get_vectorized_column(values: Column, function: Callable) -> Optional[Column]:
+    """Applies function to whole numeric NumPy array if result is equal to per-value result, otherwise returns None.
+
+    NumPy ufuncs are always applied to whole array (with NumPy semantics of errors).
+    """
+    if not _is_array(values):
+        return None
+    if isinstance(function, np.ufunc):
+        return function(values)
+    vectorized_function = VECTORIZED_FUNCTIONS.get(function)
+    if vectorized_function and values.dtype.kind in NUMERIC_KINDS:
+        return vectorized_function(values)
+
+
+def get_mapped_column(values: Column, function: Callable) -> Column:
+    is_array = _is_array(values)
+    if is_array:
+        mapped = get_vectorized_column(values, function)
+        if mapped is not None:
+            return mapped
+        values = values.tolist()
+    return get_column([function(v) for v in values], as_array=is_array)
+
+
+def map_column(batch: Batch, column: str, function: Callable, target: Optional[str] = None) -> Batch:
+    mapped = batch.copy()
+    mapped[target or column] = get_mapped_column(batch[column], function)
+    return mapped
+
+
+def get_mask(batch: Batch, column: str, condition: Union[Callable, Any]) -> Column:
+    """Returns mask of rows, condition is a function of value or the value expected in column."""
+    values = batch[column]
+    if isinstance(condition, Callable):
+        return [bool(condition(v)) for v in _get_list(values)]
+    elif _is_array(values):
+        return values == condition
+    else:
+        return [v == condition for v in values]
+
+
+def filter_batch(batch: Batch, mask: Column) -> Batch:
+    if _is_array(mask) or any(_is_array(v) for v in batch.values()):
+        mask = np.asarray(mask, dtype=bool)
+    filtered = dict()
+    for c, values in batch.items():
+        if _is_array(values):
+            filtered[c] = values[mask]
+        else:
+            filtered[c] = list(compress(values, mask))
+    return filtered
+
+
+def get_filtered_batch(batch: Batch, **conditions) -> Batch:
+    mask = None
+    for column, condition in conditions.items():
+        column_mask = get_mask(batch, column, condition)
+        if mask is None:
+            mask = column_mask
+        elif _is_array(mask) and _is_array(column_mask):
+            mask = mask & column_mask
+        else:
+            mask = [a and b for a, b in zip(mask, column_mask)]
+    if mask is None:
+        return batch
+    return filter_batch(batch, mask)
+
+
+def _get_defined_values(values: Column) -> Column:
+    if _is_array(values):
+        if values.dtype.kind == 'f':
+            return values[~np.isnan(values)]
+        else:
+            return values
+    else:
+        return [v for v in values if _is_defined(v)]
+
+
+def _get_scalar(value):
+    return value.item() if hasattr(value, 'item') else value
+
+
+def aggregate_batches(batches: Iterable, column: str, function: str):
+    """Aggregates values of column over all batches, undefined values (None and NaN) are skipped."""
+    if function not in AGGREGATE_FUNCTIONS:
+        raise ValueError(f'aggregate_batches(): expected one of {AGGREGATE_FUNCTIONS} as function, got {function}')
+    total, count, extreme = 0, 0, None
+    for batch in batches:
+        values = _get_defined_values(batch[column])
+        if not len(values):
+            continue
+        count += len(values)
+        if function in ('sum', 'mean', 'avg'):
+            total += _get_scalar(values.sum()) if _is_array(values) else sum(values)
+        elif function in ('min', 'max'):
+            if _is_array(values):
+                value = _get_scalar(values.min() if function == 'min' else values.max())
+            else:
+                value = min(values) if function == 'min' else max(values)
+            if extreme is None or (value < extreme if function == 'min' else value > extreme):
+                extreme = value
+    if function == 'count':
+        return count
+    elif function == 'sum':
+        return total if count else None
+    elif function in ('mean', 'avg'):
+        return total / count if count else None
+    else:
+        return extreme
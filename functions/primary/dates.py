@@ -1,14 +1,17 @@
-from typing import Optional, Tuple, Union, NoReturn
+from typing import Optional, Iterable, Tuple, Union, NoReturn
 from datetime import date, timedelta, datetime
+from functools import lru_cache
 
 try:  # Assume we're a submodule in a package.
     from base.classes.enum import DynamicEnum
     from base.constants.chars import DOT, MINUS, SPACE
     from base.functions.arguments import get_str_from_args_kwargs
+    from utils.external import np, raise_import_error
 except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
     from ...base.classes.enum import DynamicEnum
     from ...base.constants.chars import DOT, MINUS, SPACE
     from ...base.functions.arguments import get_str_from_args_kwargs
+    from ...utils.external import np, raise_import_error
 
 PyDate = date
 IntDate = int
@@ -31,6 +34,11 @@ WEEKS_IN_YEAR = 52
 SECONDS_IN_MINUTE = 60
 MINUTES_IN_HOUR = 60
 
+DATE_CACHE_SIZE = 4096  # enough for all days of 10 years
+NUMPY_DATE_TYPE = 'datetime64[D]'
+NUMPY_EPOCH_YEAR = 1970
+NUMPY_EPOCH_WEEKDAY = 3  # 1970-01-01 is Thursday
+
 
 class DateScale(DynamicEnum):
     Day = 'day'
@@ -128,10 +136,9 @@ def raise_date_type_error(d) -> NoReturn:
     raise TypeError(msg)
 
 
-def get_py_date(d: Date) -> PyDate:
-    if isinstance(d, date):
-        return d
-    elif is_iso_date(d):
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _get_py_date_from_str(d: str) -> PyDate:
+    if is_iso_date(d):
         return date.fromisoformat(d[:10])
     elif is_gost_date(d):
         return from_gost_format(d)
@@ -139,15 +146,30 @@ def get_py_date(d: Date) -> PyDate:
         raise_date_type_error(d)
 
 
-def get_iso_date(d: Date) -> IsoDate:
-    if is_py_date(d):
-        return d.isoformat()[:10]
-    elif is_iso_date(d):
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _get_iso_date_from_str(d: str) -> Optional[IsoDate]:
+    if is_iso_date(d):
         return d[:10]
     elif is_gost_date(d):
         return from_gost_format(d, as_iso_date=True)
 
 
+def get_py_date(d: Date) -> PyDate:
+    if isinstance(d, date):
+        return d
+    elif isinstance(d, str):
+        return _get_py_date_from_str(d)
+    else:
+        raise_date_type_error(d)
+
+
+def get_iso_date(d: Date) -> IsoDate:
+    if is_py_date(d):
+        return d.isoformat()[:10]
+    elif isinstance(d, str):
+        return _get_iso_date_from_str(d)
+
+
 def get_date(d: Date, as_iso_date: bool = False) -> Date:
     if as_iso_date:
         return get_iso_date(d)
@@ -471,9 +493,15 @@ def get_year_and_week_from_date(d: Date) -> Tuple[int, int]:
     return year, week
 
 
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _get_day_abs_from_date(d: Date, min_year: int) -> int:
+    min_date = get_year_start_monday(min_year, as_iso_date=False)
+    return (get_py_date(d) - min_date).days
+
+
 def get_day_abs_from_date(d: Date, min_date: Optional[Date] = None) -> int:
     if min_date is None:
-        min_date = get_year_start_monday(get_min_year())
+        return _get_day_abs_from_date(d, get_min_year())  # min year is a part of cache key
     return get_days_between(min_date, d)
 
 
@@ -496,7 +524,8 @@ def get_week_abs_from_year_and_week(year: int, week: int, min_year: Optional[int
     return week_abs
 
 
-def get_week_abs_from_date(d: Date, min_year: Optional[int] = None, decimal: bool = False) -> int:
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _get_week_abs_from_date(d: Date, min_year: int, decimal: bool) -> int:
     year, week = get_year_and_week_from_date(d)
     week_abs = get_week_abs_from_year_and_week(year, week, min_year=min_year)
     if decimal:
@@ -504,6 +533,12 @@ def get_week_abs_from_date(d: Date, min_year: Optional[int] = None, decimal: boo
     return week_abs
 
 
+def get_week_abs_from_date(d: Date, min_year: Optional[int] = None, decimal: bool = False) -> int:
+    if min_year is None:
+        min_year = get_min_year()
+    return _get_week_abs_from_date(d, min_year, decimal)
+
+
 def get_week_no_from_date(d: Date) -> int:
     _, week_no = get_year_and_week_from_date(d)
     return week_no
@@ -544,6 +579,55 @@ def get_int_from_date(d: Date, scale: Union[DateScale, str]) -> int:
         raise ValueError(DateScale.get_err_msg(scale))
 
 
+def get_dates_array(dates: Iterable):
+    if not np:
+        raise_import_error('numpy')
+    return np.array([get_iso_date(d) for d in dates], dtype=NUMPY_DATE_TYPE)
+
+
+def get_day_abs_array(dates: Iterable, min_date: Optional[Date] = None):
+    if min_date is None:
+        min_date = get_year_start_monday(get_min_year())
+    days = get_dates_array(dates) - np.datetime64(get_iso_date(min_date), 'D')
+    return days.astype(int)
+
+
+def get_week_abs_array(dates: Iterable, min_year: Optional[int] = None):
+    if min_year is None:
+        min_year = get_min_year()
+    days = get_dates_array(dates)
+    years = days.astype('datetime64[Y]')
+    year_first_dates = years.astype(NUMPY_DATE_TYPE)
+    weekdays = (year_first_dates.astype(int) + NUMPY_EPOCH_WEEKDAY) % DAYS_IN_WEEK
+    year_start_mondays = year_first_dates - weekdays
+    weeks = (days - year_start_mondays).astype(int) // DAYS_IN_WEEK
+    year_nos = years.astype(int) + NUMPY_EPOCH_YEAR
+    is_next_year = weeks >= WEEKS_IN_YEAR  # same as in get_year_and_week_from_date()
+    year_nos = np.where(is_next_year, year_nos + 1, year_nos)
+    weeks = np.where(is_next_year, 0, weeks)
+    return (year_nos - min_year) * WEEKS_IN_YEAR + weeks
+
+
+def get_int_array_from_dates(dates: Iterable, scale: Union[DateScale, str]):
+    scale = DateScale.convert(scale)
+    if scale == DateScale.Day:
+        return get_day_abs_array(dates)
+    elif scale == DateScale.Week:
+        return get_week_abs_array(dates)
+    elif not np:
+        raise_import_error('numpy')
+    else:
+        return np.array([get_int_from_date(d, scale=scale) for d in dates], dtype=int)
+
+
+def clear_date_cache() -> None:
+    for cached_function in (
+            _get_py_date_from_str, _get_iso_date_from_str,
+            _get_day_abs_from_date, _get_week_abs_from_date,
+    ):
+        cached_function.cache_clear()
+
+
 def get_date_from_int(d: int, scale: Union[DateScale, str], as_iso_date: bool = True) -> Date:
     scale = DateScale.convert(scale)
     if scale == DateScale.Day:
@@ -0,0 +1,238 @@
+from typing import Optional, Callable, Iterable, Generator, Union
+from collections import deque
+import warnings
+
+try:  # Assume we're a submodule in a package.
+    from utils.external import np, raise_import_error
+    from functions.primary import numeric as nm
+except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
+    from ...utils.external import np, raise_import_error
+    from . import numeric as nm
+
+Window = Union[list, tuple]
+Values = Union[list, nm.Mutable]
+
+
+def get_window_borders(window: Window) -> Optional[tuple]:
+    if window:
+        first, last = min(window), max(window)
+        is_contiguous = sorted(window) == list(range(first, last + 1))
+        if is_contiguous and first <= 0 <= last:
+            return first, last
+
+
+def _is_defined(value) -> bool:
+    return value is not None and value == value  # NaN is not equal to itself
+
+
+def _get_padded_values(values: Values, window: Window, extend: bool = True) -> tuple:
+    first, last = get_window_borders(window)
+    window_len = last - first + 1
+    values = list(values)
+    if extend:  # windows near edges are filled by undefined values
+        values = [None] * -first + values + [None] * last
+    return values, window_len
+
+
+def _get_padded_array(values: Values, window: Window, extend: bool = True) -> tuple:
+    if not np:
+        raise_import_error('numpy')
+    first, last = get_window_borders(window)
+    window_len = last - first + 1
+    array = np.array([v if _is_defined(v) else np.nan for v in values], dtype=float)
+    if extend:
+        array = np.concatenate([np.full(-first, np.nan), array, np.full(last, np.nan)])
+    return array, window_len
+
+
+def _get_output(array, like: Values) -> Values:
+    if np and isinstance(like, np.ndarray):
+        return array
+    else:
+        return [v if _is_defined(v) else None for v in array.tolist()]
+
+
+def _get_windows(array, window_len: int):
+    return np.lib.stride_tricks.sliding_window_view(array, window_len)  # view, without copying values
+
+
+def _apply_to_windows(function: Callable, array, window_len: int):
+    """Applies NaN-aware numpy aggregate to every window directly (without running sums losing precision)."""
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)  # Mean of empty slice, All-NaN slice encountered
+        return function(_get_windows(array, window_len), axis=1)
+
+
+def get_window_means(array, window_len: int, skip_position: Optional[int] = None):
+    """Returns NaN-aware means of all full windows of array, value at skip_position of every window is excluded."""
+    windows = _get_windows(array, window_len)
+    if skip_position is not None:
+        windows = np.delete(windows, skip_position, axis=1)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)  # Mean of empty slice
+        return np.nanmean(windows, axis=1)
+
+
+def _get_window_counts(array, window_len: int):
+    return np.count_nonzero(~np.isnan(_get_windows(array, window_len)), axis=1)
+
+
+def _is_int_list(values: Values) -> bool:
+    if np and isinstance(values, np.ndarray):
+        return False
+    return all(isinstance(v, int) and not isinstance(v, bool) for v in values if v is not None)
+
+
+def rolling_sum(values: Values, window: Window, extend: bool = True) -> Values:
+    if _is_int_list(values):  # integer sums are exact and stay integer as in generic per-window path
+        padded, window_len = _get_padded_values(values, window, extend=extend)
+        spans = [(n, n + window_len) for n in range(len(padded) - window_len + 1)]
+        return rolling_by_spans(padded, spans, 'sum')
+    array, window_len = _get_padded_array(values, window, extend=extend)
+    if array.size < window_len:
+        return _get_output(np.array([]), like=values)
+    sums = _apply_to_windows(np.nansum, array, window_len)
+    counts = _get_window_counts(array, window_len)
+    return _get_output(np.where(counts > 0, sums, np.nan), like=values)
+
+
+def rolling_mean(values: Values, window: Window, extend: bool = True) -> Values:
+    array, window_len = _get_padded_array(values, window, extend=extend)
+    if array.size < window_len:
+        return _get_output(np.array([]), like=values)
+    return _get_output(get_window_means(array, window_len), like=values)
+
+
+def rolling_std(values: Values, window: Window, extend: bool = True) -> Values:
+    array, window_len = _get_padded_array(values, window, extend=extend)
+    if array.size < window_len:
+        return _get_output(np.array([]), like=values)
+    return _get_output(_apply_to_windows(np.nanstd, array, window_len), like=values)
+
+
+def rolling_median(values: Values, window: Window, extend: bool = True) -> Values:
+    array, window_len = _get_padded_array(values, window, extend=extend)
+    if array.size < window_len:
+        return _get_output(np.array([]), like=values)
+    return _get_output(_apply_to_windows(np.nanmedian, array, window_len), like=values)
+
+
+def _rolling_extreme(values: Values, window: Window, extend: bool = True, take_max: bool = True) -> Values:
+    padded, window_len = _get_padded_values(values, window, extend=extend)
+    candidates = deque()  # indexes of monotonic values, the first one is extreme for current window
+    result = list()
+    for n, value in enumerate(padded):
+        if _is_defined(value):
+            while candidates and (padded[candidates[-1]] <= value if take_max else padded[candidates[-1]] >= value):
+                candidates.pop()
+            candidates.append(n)
+        window_start = n - window_len + 1
+        if window_start >= 0:
+            while candidates and candidates[0] < window_start:
+                candidates.popleft()
+            result.append(padded[candidates[0]] if candidates else None)
+    if np and isinstance(values, np.ndarray):
+        return np.array([np.nan if v is None else v for v in result], dtype=float)
+    else:
+        return result
+
+
+def rolling_min(values: Values, window: Window, extend: bool = True) -> Values:
+    return _rolling_extreme(values, window, extend=extend, take_max=False)
+
+
+def rolling_max(values: Values, window: Window, extend: bool = True) -> Values:
+    return _rolling_extreme(values, window, extend=extend, take_max=True)
+
+
+ROLLING_FUNCTIONS = dict(
+    sum=rolling_sum,
+    mean=rolling_mean,
+    avg=rolling_mean,
+    std=rolling_std,
+    median=rolling_median,
+    min=rolling_min,
+    max=rolling_max,
+)
+AGGREGATE_NAMES = {
+    nm.sum: 'sum',
+    nm.mean: 'mean',
+    nm.avg: 'mean',
+    nm.median: 'median',
+    nm.min: 'min',
+    nm.max: 'max',
+}
+NUMPY_FREE_FUNCTIONS = 'min', 'max'
+SPAN_FUNCTIONS = 'sum', 'mean', 'avg', 'count', 'min', 'max'
+
+
+def get_rolling_function(function: Union[Callable, str]) -> Optional[Callable]:
+    if isinstance(function, Callable):
+        function = AGGREGATE_NAMES.get(function)
+    if function in ROLLING_FUNCTIONS:
+        if np or function in NUMPY_FREE_FUNCTIONS:
+            return ROLLING_FUNCTIONS[function]
+
+
+def rolling(values: Iterable, function: Union[Callable, str], window: Window, extend: bool = True) -> Values:
+    rolling_function = get_rolling_function(function)
+    if rolling_function is None:
+        raise ValueError(f'rolling(): expected one of {list(ROLLING_FUNCTIONS)} as function, got {function}')
+    if not get_window_borders(window):
+        raise ValueError(f'rolling(): expected contiguous window around center, got {window}')
+    return rolling_function(values, window, extend=extend)
+
+
+def _get_extremes_by_spans(values: Values, spans: Iterable, take_max: bool = True) -> Generator:
+    candidates = deque()  # indexes of monotonic values, the first one is extreme for current span
+    added = 0
+    for first, last in spans:
+        while added < last:
+            value = values[added]
+            if _is_defined(value):
+                while candidates and (values[candidates[-1]] <= value if take_max else values[candidates[-1]] >= value):
+                    candidates.pop()
+                candidates.append(added)
+            added += 1
+        while candidates and candidates[0] < first:
+            candidates.popleft()
+        yield values[candidates[0]] if candidates else None
+
+
+def _get_totals_by_spans(values: Values, spans: Iterable) -> Generator:
+    total, count, added, removed = 0, 0, 0, 0
+    for first, last in spans:
+        while added < last:
+            value = values[added]
+            if _is_defined(value):
+                total += value
+                count += 1
+            added += 1
+        while removed < first:
+            value = values[removed]
+            if _is_defined(value):
+                total -= value
+                count -= 1
+            removed += 1
+        if not count:
+            total = 0  # drop accumulated rounding errors
+        yield total, count
+
+
+def rolling_by_spans(values: Values, spans: Iterable, function: str) -> list:
+    """Aggregates values inside (first, last) spans of positions, last position is not included.
+
+    Both borders of spans must be non-decreasing, so every value is added and removed only once.
+    """
+    if function == 'min':
+        return list(_get_extremes_by_spans(values, spans, take_max=False))
+    elif function == 'max':
+        return list(_get_extremes_by_spans(values, spans, take_max=True))
+    elif function == 'sum':
+        return [total if count else None for total, count in _get_totals_by_spans(values, spans)]
+    elif function in ('mean', 'avg'):
+        return [total / count if count else None for total, count in _get_totals_by_spans(values, spans)]
+    elif function == 'count':
+        return [count for _, count in _get_totals_by_spans(values, spans)]
+    else:
+        raise ValueError(f'rolling_by_spans(): expected one of {SPAN_FUNCTIONS} as function, got {function}')
@@ -12,7 +12,7 @@ try:  # Assume we're a submodule in a package.
     )
     from functions.secondary.date_functions import (
         date, next_date, date_range,
-        date_to_int, int_to_date, int_between, round_date,
+        date_to_int, dates_to_int, int_to_date, int_between, round_date,
     )
     from functions.secondary.text_functions import startswith, endswith, contains
     from functions.secondary.array_functions import (
@@ -45,7 +45,7 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
     )
     from .date_functions import (
         date, next_date, date_range,
-        date_to_int, int_to_date, int_between, round_date,
+        date_to_int, dates_to_int, int_to_date, int_between, round_date,
     )
     from .text_functions import startswith, endswith, contains
     from .array_functions import (
@@ -118,13 +118,13 @@ def equal(*args, _as_sql: bool = False) -> Callable:
 
 @sql_compatible
 def not_equal(*args, _as_sql: bool = False) -> Callable:
-    _func = equal(*args, _as_sql=_as_sql)
+    _func = equal(*args)
 
     def _not_equal(*a) -> bool:
         return not _func(*a)
 
     def get_sql_repr(*fields) -> str:
-        return _func(*fields, _sign='!=')
+        return _func.get_sql_expr(*fields, _sign='!=')
 
     return get_sql_repr if _as_sql else _not_equal
 
@@ -138,11 +138,11 @@ def less_than(other: Any, including: bool = False, _as_sql: bool = False) -> Cal
             return value < other
 
     def get_sql_repr(*fields) -> str:
-        _func = equal(other, _as_sql=True)
+        _func = equal(other)
         if including:
-            return _func(*fields, _sign='<=')
+            return _func.get_sql_expr(*fields, _sign='<=')
         else:
-            return _func(*fields, _sign='<')
+            return _func.get_sql_expr(*fields, _sign='<')
 
     return get_sql_repr if _as_sql else _less_than
 
@@ -156,11 +156,11 @@ def more_than(other: Any, including: bool = False, _as_sql: bool = False) -> Cal
             return value > other
 
     def get_sql_repr(*fields) -> str:
-        _func = equal(other, _as_sql=True)
+        _func = equal(other)
         if including:
-            return _func(*fields, _sign='>=')
+            return _func.get_sql_expr(*fields, _sign='>=')
         else:
-            return _func(*fields, _sign='>')
+            return _func.get_sql_expr(*fields, _sign='>')
 
     return get_sql_repr if _as_sql else _more_than
 
@@ -1,8 +1,10 @@
-from typing import Optional, Callable, Union
+from typing import Optional, Callable, Iterable, Union
 
 try:  # Assume we're a submodule in a package.
+    from utils.external import np
     from functions.primary import dates as dt
 except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
+    from ...utils.external import np
     from ..primary import dates as dt
 
 Scale = Union[dt.DateScale, str]
@@ -18,6 +20,15 @@ def date_to_int(scale: Scale) -> Callable:
     return lambda d: dt.get_int_from_date(d, scale=scale)
 
 
+def dates_to_int(scale: Scale) -> Callable:
+    def _dates_to_int(dates: Iterable) -> list:
+        if np:
+            return dt.get_int_array_from_dates(dates, scale=scale).tolist()
+        else:
+            return [dt.get_int_from_date(d, scale=scale) for d in dates]
+    return _dates_to_int
+
+
 def int_to_date(scale: Scale, as_iso_date: bool = True) -> Callable:
     return lambda d: dt.get_date_from_int(d, scale=scale, as_iso_date=as_iso_date)
 
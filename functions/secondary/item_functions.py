@@ -1,6 +1,5 @@
 from typing import Optional, Callable, Iterable, Union, Any
 import sys
-import json
 import csv
 
 try:  # Assume we're a submodule in a package.
@@ -10,6 +9,7 @@ try:  # Assume we're a submodule in a package.
     from content.items.item_getters import get_composite_key
     from content.selection import selection_functions as sf
     from functions.primary import items as it
+    from utils.json_codecs import get_json_codec
 except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
     from ...base.functions.arguments import update
     from ...base.constants.chars import TAB_CHAR
@@ -17,6 +17,7 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
     from ...content.items.item_getters import get_composite_key
     from ...content.selection import selection_functions as sf
     from ..primary import items as it
+    from ...utils.json_codecs import get_json_codec
 
 max_int = sys.maxsize
 while True:  # To prevent _csv.Error: field larger than field limit (131072)
@@ -94,21 +95,19 @@ def items_to_dict(
     return _items_to_dict
 
 
-def json_dumps(*args, **kwargs) -> Callable:
+def json_dumps(*args, codec: Optional[str] = None, **kwargs) -> Callable:
+    json_codec = get_json_codec(codec)
+
     def _json_dumps(a: Any) -> str:
-        return json.dumps(a, *args, **kwargs)
+        return json_codec.dumps(a, *args, **kwargs)
     return _json_dumps
 
 
-def json_loads(default=None, skip_errors: bool = False) -> Callable:
+def json_loads(default=None, skip_errors: bool = False, codec: Optional[str] = None) -> Callable:
+    json_codec = get_json_codec(codec)
+
     def _json_loads(line: str) -> Any:
-        try:
-            return json.loads(line)
-        except json.JSONDecodeError as err:
-            if default is not None:
-                return default
-            elif not skip_errors:
-                raise json.JSONDecodeError(err.msg, err.doc, err.pos)
+        return json_codec.loads(line, default=default, skip_errors=skip_errors)
     return _json_loads
 
 
@@ -26,10 +26,24 @@ def test_get_yearly_dates():
     assert received == expected
 
 
+def test_get_int_array_from_dates():
+    dates = [
+        '2009-12-28', '2010-01-03', '2010-01-04', '2019-12-29', '2019-12-30',
+        '2020-02-29', '2020-12-27', '2020-12-28', '2020-12-31', '2021-01-04',
+    ]
+    for scale in dt.DateScale.get_enum_items():
+        expected = [dt.get_int_from_date(d, scale=scale) for d in dates]
+        received = dt.get_int_array_from_dates(dates, scale=scale).tolist()
+        assert received == expected, f'{scale}: {received} vs {expected}'
+    assert dt.get_day_abs_from_date('01.01.2020') == dt.get_day_abs_from_date(dt.get_py_date('2020-01-01'))
+    dt.clear_date_cache()
+
+
 def main():
     test_get_days_between()
     test_get_next_year_date()
     test_get_yearly_dates()
+    test_get_int_array_from_dates()
 
 
 if __name__ == '__main__':
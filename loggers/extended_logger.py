@@ -16,6 +16,7 @@ try:  # Assume we're a submodule in a package.
     from loggers.selection_logger_interface import SelectionLoggerInterface, SELECTION_LOGGER_NAME
     from loggers.progress_interface import ProgressInterface
     from loggers.progress import Progress
+    from loggers.profiler import Profiler
 except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
     from ..base.classes.typing import Count, Name
     from ..base.constants.chars import EMPTY, ELLIPSIS, SPACE, RETURN_CHAR, PARAGRAPH_CHAR, SLASH, BACKSLASH
@@ -30,6 +31,7 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
     from .selection_logger_interface import SelectionLoggerInterface, SELECTION_LOGGER_NAME
     from .progress_interface import ProgressInterface
     from .progress import Progress
+    from .profiler import Profiler
 
 Native = Union[TreeItem, LoggerInterface]
 Level = Union[LoggingLevel, int, None]
@@ -169,6 +171,7 @@ class ExtendedLogger(BaseLoggerWrapper, ExtendedLoggerInterface):
         if max_line_len is None:
             max_line_len = DEFAULT_LINE_LEN
         self.max_line_len = max_line_len
+        self.profiler = None
         progress_trackers = dict()
         self.LoggingLevel = LoggingLevel
         super().__init__(
@@ -209,6 +212,15 @@ class ExtendedLogger(BaseLoggerWrapper, ExtendedLoggerInterface):
     ) -> Generator:
         return self.get_new_progress(name, count=count, context=context).iterate(items, step=step)
 
+    def get_profiler(self, create_if_not_yet: bool = True) -> Optional[Profiler]:
+        if self.profiler is None and create_if_not_yet:
+            self.profiler = Profiler(name=f'{self.get_name()}:profiler')
+        return self.profiler
+
+    def set_profiler(self, profiler: Profiler) -> Native:
+        self.profiler = profiler
+        return self
+
     def get_selection_logger(self, name: Optional[Name] = None, **kwargs) -> Optional[SelectionLoggerInterface]:
         if name is None:
             name = SELECTION_LOGGER_NAME
@@ -7,6 +7,7 @@ try:  # Assume we're a submodule in a package.
     from loggers.extended_logger import ExtendedLogger, SingletonLogger, DEFAULT_LOGGER_NAME, DEFAULT_FORMATTER
     from loggers.progress_interface import ProgressInterface, OperationStatus
     from loggers.progress import Progress
+    from loggers.profiler import Profiler, OperatorProfile
     from loggers.detailed_message import DetailedMessage, SelectionError
     from loggers.message_collector import MessageCollector, SelectionMessageCollector, CommonMessageCollector
     from loggers.logging_context_stub import LoggingContextStub
@@ -18,6 +19,7 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
     from .extended_logger import ExtendedLogger, SingletonLogger, DEFAULT_LOGGER_NAME, DEFAULT_FORMATTER
     from .progress_interface import ProgressInterface, OperationStatus
     from .progress import Progress
+    from .profiler import Profiler, OperatorProfile
     from .detailed_message import DetailedMessage, SelectionError
     from .message_collector import MessageCollector, SelectionMessageCollector, CommonMessageCollector
     from .logging_context_stub import LoggingContextStub
@@ -2,12 +2,14 @@ from typing import Optional, Union
 
 try:  # Assume we're a submodule in a package.
     from utils.decorators import singleton
+    from utils.memory import MemoryBudget, get_default_budget
     from interfaces import ContextInterface, LoggerInterface, ExtendedLoggerInterface, Name
     from base.abstract.tree_item import TreeItem
     from loggers.extended_logger import SingletonLogger
     from loggers.message_collector import SelectionMessageCollector
 except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
     from ..utils.decorators import singleton
+    from ..utils.memory import MemoryBudget, get_default_budget
     from ..interfaces import ContextInterface, LoggerInterface, ExtendedLoggerInterface, Name
     from ..base.abstract.tree_item import TreeItem
     from .extended_logger import SingletonLogger
@@ -74,6 +76,10 @@ class LoggingContextStub(TreeItem, ContextInterface):
                 logger.set_selection_logger(selection_logger)
         return selection_logger
 
+    @staticmethod
+    def get_memory_budget() -> MemoryBudget:
+        return get_default_budget()
+
     def log(self, msg: str, level=None, end: Optional[str] = None, truncate: bool = True, verbose: bool = True) -> None:
         logger = self.get_logger()
         if isinstance(logger, ExtendedLoggerInterface):
@@ -0,0 +1,267 @@
+from typing import Optional, Callable, Iterable, Union
+from functools import wraps
+from itertools import chain, islice
+from collections import deque
+from time import perf_counter
+import tracemalloc
+
+try:  # Assume we're a submodule in a package.
+    from base.classes.typing import Name
+except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
+    from ..base.classes.typing import Name
+
+DEFAULT_PROFILER_NAME = 'profiler'
+SOURCE_OPERATOR_NAME = 'source'
+TIME_DIGITS = 6
+BYTES_IN_KB = 1024
+MAX_STAGES_COUNT = 1000  # oldest stages are dropped from profiler, but stay available via lineage of streams
+
+_enabled_profilers_count = 0  # operators skip profiling without any lookups while no profilers are enabled
+
+
+class OperatorProfile:
+    def __init__(
+            self,
+            number: int,
+            operator: Name,
+            stream_name: Optional[Name] = None,
+            parent=None,
+            profiler=None,
+    ):
+        self._number = number
+        self._operator = operator
+        self._stream_name = stream_name
+        self._parent = parent
+        self._profiler = profiler
+        self.items_out = 0
+        self.call_time = 0.0  # spent while operator builds its output (eager operators do all their work here)
+        self.iter_time = 0.0  # spent inside next() of lazy output, including upstream stages
+        self.peak_memory = 0
+        self.memory_baseline = profiler.get_traced_memory() if profiler else 0
+
+    def get_number(self) -> int:
+        return self._number
+
+    def get_operator(self) -> Name:
+        return self._operator
+
+    def get_stream_name(self) -> Optional[Name]:
+        return self._stream_name
+
+    def get_parent(self):
+        return self._parent
+
+    def get_profiler(self):
+        return self._profiler
+
+    def get_lineage(self) -> list:
+        stages = list()
+        stage = self
+        while stage is not None and stage not in stages:
+            stages.append(stage)
+            stage = stage.get_parent()
+        return list(reversed(stages))
+
+    def get_time(self) -> float:
+        return self.call_time + self.iter_time
+
+    def get_self_time(self) -> float:
+        parent = self.get_parent()
+        upstream_time = parent.iter_time if parent else 0.0
+        return max(self.get_time() - upstream_time, 0.0)
+
+    def update_memory(self, traced_memory: int) -> None:
+        delta = traced_memory - self.memory_baseline
+        if delta > self.peak_memory:
+            self.peak_memory = delta
+
+    def get_record(self, trace_memory: bool = True) -> dict:
+        parent = self.get_parent()
+        return dict(
+            stage=self.get_number(),
+            operator=self.get_operator(),
+            stream=self.get_stream_name(),
+            items_in=parent.items_out if parent else None,
+            items_out=self.items_out,
+            time_sec=round(self.get_time(), TIME_DIGITS),
+            self_time_sec=round(self.get_self_time(), TIME_DIGITS),
+            peak_memory_kb=round(self.peak_memory / BYTES_IN_KB, 1) if trace_memory else None,
+        )
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.get_number()}, {repr(self.get_operator())})'
+
+
+class ProfiledIterator:
+    def __init__(self, items: Iterable, stage: OperatorProfile, trace_memory: bool = False):
+        self._iterator = iter(items)
+        self._stage = stage
+        self._trace_memory = trace_memory
+
+    def get_stage(self) -> OperatorProfile:
+        return self._stage
+
+    def get_sample(self, count: int) -> list:
+        """Returns first items without consuming them, so they are accounted when iterated."""
+        sample = list(islice(self._iterator, count))
+        self._iterator = chain(sample, self._iterator)
+        return sample
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        stage = self._stage
+        start_time = perf_counter()
+        try:
+            item = next(self._iterator)
+        finally:
+            stage.iter_time += perf_counter() - start_time
+        stage.items_out += 1
+        if self._trace_memory:
+            stage.update_memory(tracemalloc.get_traced_memory()[0])
+        return item
+
+
+class ProfiledList(list):
+    def __init__(self, items: Iterable, stage: OperatorProfile):
+        super().__init__(items)
+        self._stage = stage
+        stage.items_out = len(self)
+
+    def get_stage(self) -> OperatorProfile:
+        return self._stage
+
+
+def get_stage(data) -> Optional[OperatorProfile]:
+    if isinstance(data, (ProfiledIterator, ProfiledList)):
+        return data.get_stage()
+
+
+def get_list(data: Iterable) -> list:
+    stage = get_stage(data)
+    if stage:  # collected items keep link to operator which produced them
+        return ProfiledList(data, stage)
+    else:
+        return list(data)
+
+
+class Profiler:
+    def __init__(self, name: Name = DEFAULT_PROFILER_NAME, enabled: bool = False, trace_memory: bool = False):
+        self._name = name
+        self._enabled = False
+        self._trace_memory = False
+        self._started_tracemalloc = False
+        self._active_calls = 0
+        self._stages = deque(maxlen=MAX_STAGES_COUNT)
+        self._stages_count = 0
+        if enabled:
+            self.enable(trace_memory=trace_memory)
+
+    def get_name(self) -> Name:
+        return self._name
+
+    def is_enabled(self) -> bool:
+        return self._enabled
+
+    def is_tracing_memory(self) -> bool:
+        return self._trace_memory
+
+    def enable(self, trace_memory: bool = False):
+        global _enabled_profilers_count
+        if not self._enabled:
+            _enabled_profilers_count += 1
+        self._enabled = True
+        if trace_memory and not self._trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            self._trace_memory = True
+        return self
+
+    def disable(self):
+        global _enabled_profilers_count
+        if self._enabled:
+            _enabled_profilers_count -= 1
+        self._enabled = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self._trace_memory = False
+        return self
+
+    def reset(self):
+        self._stages.clear()
+        self._stages_count = 0
+        return self
+
+    def get_traced_memory(self) -> int:
+        if self.is_tracing_memory():
+            return tracemalloc.get_traced_memory()[0]
+        else:
+            return 0
+
+    def get_stages(self) -> list:
+        return list(self._stages)
+
+    def add_stage(self, operator: Name, stream_name: Optional[Name] = None, parent=None) -> OperatorProfile:
+        stage = OperatorProfile(self._stages_count, operator, stream_name=stream_name, parent=parent, profiler=self)
+        self._stages.append(stage)
+        self._stages_count += 1
+        return stage
+
+    def wrap(self, data: Iterable, stage: OperatorProfile) -> Union[ProfiledIterator, ProfiledList]:
+        if isinstance(data, (list, tuple)):  # in-memory data stays in memory
+            return ProfiledList(data, stage)
+        else:
+            return ProfiledIterator(data, stage, trace_memory=self.is_tracing_memory())
+
+    def call(self, function: Callable, stage: OperatorProfile, *args, **kwargs):
+        trace_memory = self.is_tracing_memory() and not self._active_calls
+        if trace_memory:
+            tracemalloc.reset_peak()
+        self._active_calls += 1
+        start_time = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stage.call_time += perf_counter() - start_time
+            self._active_calls -= 1
+            if trace_memory:
+                stage.update_memory(tracemalloc.get_traced_memory()[1])
+
+    def is_inside_call(self) -> bool:
+        return self._active_calls > 0
+
+    def get_records(self, last_stage: Optional[OperatorProfile] = None) -> list:
+        if last_stage is None:
+            stages = self.get_stages()
+        else:
+            stages = last_stage.get_lineage()
+        return [s.get_record(trace_memory=self.is_tracing_memory()) for s in stages]
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({repr(self.get_name())})'
+
+
+def profiled(operator: Name) -> Callable:
+    """Decorator for stream operators: records items, wall time and memory of operator output,
+    while profiler of stream is enabled. Nested operator calls are accounted for in the outer one.
+    """
+    def decorator(method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(stream, *args, **kwargs):
+            if not _enabled_profilers_count:
+                return method(stream, *args, **kwargs)
+            profiler = stream.get_profiler() if hasattr(stream, 'get_profiler') else None
+            if not profiler or not profiler.is_enabled() or profiler.is_inside_call():
+                return method(stream, *args, **kwargs)
+            parent = get_stage(stream.get_data())
+            stage = profiler.add_stage(operator, stream_name=stream.get_name(), parent=parent)
+            result = profiler.call(method, stage, stream, *args, **kwargs)
+            target = stream if result is None else result
+            if hasattr(target, 'get_data') and hasattr(target, 'set_data'):
+                target.set_data(profiler.wrap(target.get_data(), stage), inplace=True, reset_dynamic_meta=False)
+            return result
+        return wrapper
+    return decorator
@@ -1,5 +1,7 @@
 from typing import Optional, Iterable, Generator
 from datetime import timedelta, datetime
+from itertools import islice
+from time import monotonic
 
 try:  # Assume we're a submodule in a package.
     from base.interfaces.context_interface import ContextInterface
@@ -19,6 +21,7 @@ Logger = Optional[ExtendedLoggerInterface]
 Context = Optional[ContextInterface]
 
 DEFAULT_STEP = 10000
+DEFAULT_INTERVAL = 1.0  # seconds between progress lines while iterating
 SMALL_SHARE = 0.001
 
 
@@ -39,6 +42,8 @@ class Progress(TreeItem, ProgressInterface):
         self._timing = timing
         self._start_time = None
         self._past_time = timedelta(0)
+        self._line_template = None
+        self._line_template_key = None
         if logger is None and context is not None:
             if isinstance(context, ContextInterface) or hasattr(context, 'get_logger'):
                 logger = context.get_logger()
@@ -213,20 +218,26 @@ class Progress(TreeItem, ProgressInterface):
             past_time_str = f"{past_total_minutes:02}'{past_seconds:02}"
             return f'{start_time_str}+{past_time_str}'
 
+    def _get_line_template(self) -> str:
+        name, count = self.get_name(), self.get_expected_count()
+        if self._line_template_key != (name, count):  # template is rebuilt only after renaming or changing count
+            escaped_name = str(name).replace('{', '{{').replace('}', '}}')
+            if count:
+                self._line_template = escaped_name + ': {percent} ({pos}/' + str(count) + ')'
+            else:
+                self._line_template = escaped_name + ': {pos} items processed'
+            self._line_template_key = name, count
+        return self._line_template
+
     def update_now(self, cur: Optional[int]):
         if cur is not None:
             self.set_position(cur)
         if self.state != OperationStatus.InProgress:
             self.start(cur)
         if self.expected_count:
-            line = '{name}: {percent} ({pos}/{count})'.format(
-                name=self.get_name(),
-                percent=self.get_percent(),
-                pos=self.position + 1,
-                count=self.expected_count,
-            )
+            line = self._get_line_template().format(percent=self.get_percent(), pos=self.position + 1)
         else:
-            line = '{}: {} items processed'.format(self.get_name(), self.position + 1)
+            line = self._get_line_template().format(pos=self.position + 1)
         selection_logger = self.get_selection_logger()
         if selection_logger:
             line = '{}, {} err'.format(line, selection_logger.get_err_count())
@@ -286,18 +297,33 @@ class Progress(TreeItem, ProgressInterface):
             expected_count: Optional[int] = None,
             step: Optional[int] = None,
             log_selection_batch: bool = True,
+            interval: Optional[float] = None,
     ) -> Generator:
         if isinstance(name, (str, int)):
             self.set_name(name, inplace=True)
-        if not isinstance(step, int):
+        if not isinstance(step, int) or step < 1:
             step = DEFAULT_STEP
+        if not isinstance(interval, (int, float)):
+            interval = DEFAULT_INTERVAL
         if isinstance(items, (set, list, tuple)):
             self.expected_count = len(items)
         elif expected_count:
             self.expected_count = expected_count
-        n = 0
+        n, processed_count = 0, 0
         self.start()
-        for n, item in enumerate(items):
-            self.update(n, step)
-            yield item
+        iterator = iter(items)
+        next_update_time = monotonic() + interval
+        while True:  # items are passed through without any bookkeeping between checkpoints
+            batch_len = 0
+            for batch_len, item in enumerate(islice(iterator, step), start=1):
+                yield item
+            processed_count += batch_len
+            n = max(processed_count - 1, 0)  # position of last item
+            if batch_len < step:
+                break
+            self.position = n
+            cur_time = monotonic()
+            if cur_time >= next_update_time:  # lines are rendered by wall-clock, not by items count
+                self.update_now(n)
+                next_update_time = cur_time + interval
         self.finish(n, log_selection_batch=log_selection_batch)
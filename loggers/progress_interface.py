@@ -130,6 +130,7 @@ class ProgressInterface(TreeInterface, ABC):
             name: Optional[str] = None,
             expected_count: Optional[int] = None,
             step: Optional[int] = None,
-            log_selection_batch: bool = True
+            log_selection_batch: bool = True,
+            interval: Optional[float] = None,
     ) -> Generator:
         pass
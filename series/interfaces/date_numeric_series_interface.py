@@ -84,7 +84,7 @@ class DateNumericSeriesInterface(SortedNumericKeyValueSeriesInterface, DateSerie
     def apply_window_series_function(
             self,
             window_days_count: int,
-            function: Callable,
+            function: Union[Callable, str],
             input_as_dict: bool = False,
             for_full_window_only: bool = False,
     ) -> Native:
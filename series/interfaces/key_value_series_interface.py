@@ -46,10 +46,18 @@ class KeyValueSeriesInterface(AnySeriesInterface, ABC):
     def value_series(self, set_closure: bool = False, name: Optional[str] = None) -> Native:
         pass
 
+    @abstractmethod
+    def get_key_position(self, key: Any) -> Optional[int]:
+        pass
+
     @abstractmethod
     def get_value_by_key(self, key: Any, default: Any = None):
         pass
 
+    @abstractmethod
+    def get_values_by_keys(self, keys: Iterable, default: Any = None) -> list:
+        pass
+
     @abstractmethod
     def get_keys(self) -> list:
         pass
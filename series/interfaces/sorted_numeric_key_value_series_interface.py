@@ -98,6 +98,23 @@ class SortedNumericKeyValueSeriesInterface(SortedKeyValueSeriesInterface, Numeri
     def get_linear_interpolated_value(self, key: NumericTypes, near_for_outside: bool = True) -> OptNumeric:
         pass
 
+    @abstractmethod
+    def get_spline_interpolated_values(self, keys: Iterable, default: OptNumeric = None) -> list:
+        pass
+
+    @abstractmethod
+    def get_linear_interpolated_values(self, keys: Iterable, near_for_outside: bool = True) -> list:
+        pass
+
+    @abstractmethod
+    def get_interpolated_values(
+            self,
+            keys: Iterable,
+            how: InterpolationType = InterpolationType.Linear,
+            *args, **kwargs
+    ) -> list:
+        pass
+
     @abstractmethod
     def get_interpolated_value(
             self,
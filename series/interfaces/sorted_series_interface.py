@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Callable, Union, Any
+from typing import Optional, Callable, Iterable, Union, Any
 
 try:  # Assume we're a submodule in a package.
     from functions.primary import dates as dt
@@ -37,6 +37,14 @@ class SortedSeriesInterface(AnySeriesInterface, ABC):
     def get_nearest_value(self, value: Any, distance_func: Callable) -> Any:
         pass
 
+    @abstractmethod
+    def get_nearest_values(self, values: Iterable, distance_func: Optional[Callable] = None) -> list:
+        pass
+
+    @abstractmethod
+    def get_neighbors(self, value: Any, including_left: bool = False) -> tuple:
+        pass
+
     @abstractmethod
     def get_two_nearest_values(self, value: Any) -> Optional[tuple]:
         pass
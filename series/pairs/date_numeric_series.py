@@ -3,9 +3,9 @@ from typing import Optional, Callable, Iterable, Generator, Union, NoReturn
 try:  # Assume we're a submodule in a package.
     from base.functions.arguments import get_value
     from utils.decorators import deprecated_with_alternative
-    from functions.primary import dates as dt
+    from functions.primary import numeric as nm, dates as dt, rolling as rl
     from functions.primary.numeric import plot
-    from functions.secondary.date_functions import round_date, date_range
+    from functions.secondary.date_functions import dates_to_int, round_date, date_range
     from functions.secondary.numeric_functions import lift
     from series.series_type import SeriesType
     from series.interfaces.key_value_series_interface import KeyValueSeriesInterface
@@ -21,9 +21,9 @@ try:  # Assume we're a submodule in a package.
 except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
     from ...base.functions.arguments import get_value
     from ...utils.decorators import deprecated_with_alternative
-    from ...functions.primary import dates as dt
+    from ...functions.primary import numeric as nm, dates as dt, rolling as rl
     from ...functions.primary.numeric import plot
-    from ...functions.secondary.date_functions import round_date, date_range
+    from ...functions.secondary.date_functions import dates_to_int, round_date, date_range
     from ...functions.secondary.numeric_functions import lift
     from ..series_type import SeriesType
     from ..interfaces.key_value_series_interface import KeyValueSeriesInterface
@@ -165,6 +165,21 @@ class DateNumericSeries(SortedNumericKeyValueSeries, DateSeries, DateNumericSeri
             interpolation_method = self.__getattribute__(method_name)
             return interpolation_method(date, *args, **kwargs)
 
+    def get_interpolated_values(
+            self,
+            dates: Iterable,
+            how: InterpolationType = InterpolationType.Linear,
+            *args, **kwargs
+    ) -> list:
+        dates = list(dates)
+        requires_numeric_keys = how in (InterpolationType.Linear, InterpolationType.Spline)
+        if requires_numeric_keys:
+            numeric_series = self.to_int(scale=DateScale.Day, inplace=False)
+            numeric_keys = dates_to_int(scale=DateScale.Day)(dates)
+            return numeric_series.get_interpolated_values(numeric_keys, how, *args, **kwargs)
+        else:
+            return [self.get_interpolated_value(d, how, *args, **kwargs) for d in dates]
+
     def interpolate(self, dates: Iterable, how: InterpolationType = InterpolationType.Linear, *args, **kwargs) -> Series:
         type_str = get_value(how)
         method_name = f'{type_str}_interpolation'
@@ -185,19 +200,23 @@ class DateNumericSeries(SortedNumericKeyValueSeries, DateSeries, DateNumericSeri
             internal: InterpolationType = InterpolationType.Linear,
     ) -> Series:
         assert isinstance(weight_benchmark, DateNumericSeriesInterface), f'got {weight_benchmark}'
-        list_dates = dates.get_dates() if isinstance(dates, DateNumericSeriesInterface) else dates
+        list_dates = dates.get_dates() if isinstance(dates, DateNumericSeriesInterface) else list(dates)
         border_dates = self.get_mutual_border_dates(weight_benchmark)
         result = self.make_new(save_meta=True)
         assert isinstance(result, DateNumericSeriesInterface), f'got {result}'
+        yearly_dates_by_date = {d: dt.get_yearly_dates(d, *border_dates) for d in list_dates}
+        all_yearly_dates = sorted({y for yearly_dates in yearly_dates_by_date.values() for y in yearly_dates})
+        # each series is interpolated once for all dates instead of once per target date
+        yearly_primary = dict(zip(all_yearly_dates, self.get_interpolated_values(all_yearly_dates, how=internal)))
+        yearly_benchmark = weight_benchmark.get_interpolated_values(all_yearly_dates, how=internal)
+        yearly_benchmark = dict(zip(all_yearly_dates, yearly_benchmark))
+        pre_interpolated_values = dict(zip(list_dates, self.get_interpolated_values(list_dates, how=internal)))
         for d in list_dates:
-            yearly_dates = dt.get_yearly_dates(d, *border_dates)
+            yearly_dates = yearly_dates_by_date[d]
             if yearly_dates:
-                yearly_primary = self.interpolate(yearly_dates, how=internal)
-                yearly_benchmark = weight_benchmark.interpolate(yearly_dates, how=internal)
-                norm_benchmark = yearly_benchmark.divide(yearly_primary)
-                weight = norm_benchmark.get_mean()
-                pre_interpolated_value = self.get_interpolated_value(d, how=internal)
-                weighted_value = pre_interpolated_value * weight
+                norm_benchmark = [nm.div(yearly_benchmark[y], yearly_primary[y]) for y in yearly_dates]
+                weight = nm.mean(norm_benchmark)
+                weighted_value = pre_interpolated_values[d] * weight
                 result.append_pair(d, weighted_value, inplace=True)
         return result
 
@@ -224,31 +243,53 @@ class DateNumericSeries(SortedNumericKeyValueSeries, DateSeries, DateNumericSeri
     def interpolate_to_months(self, how: InterpolationType = InterpolationType.Spline, *args, **kwargs) -> Series:
         return self.interpolate_to_scale(scale=DateScale.Month, how=how, *args, **kwargs)
 
+    @staticmethod
+    def _get_window_days(window_days_count: int) -> tuple:
+        half_window_days = window_days_count / 2
+        int_half_window_days = int(half_window_days)
+        window_days_is_even = half_window_days == int_half_window_days
+        left_days = int_half_window_days
+        right_days = int_half_window_days if window_days_is_even else int_half_window_days + 1
+        return left_days, right_days
+
+    def _get_window_spans(self, dates: Iterable, left_days: int, right_days: int) -> Generator:
+        keys = self.get_dates()
+        count = len(keys)
+        first, last = 0, 0
+        for center_date in dates:  # dates must be sorted, so both borders of window are only moving forward
+            first_date = dt.get_shifted_date(center_date, -left_days)
+            last_date = dt.get_shifted_date(center_date, right_days)
+            while first < count and keys[first] < first_date:
+                first += 1
+            last = max(first, last)
+            while last < count and keys[last] <= last_date:
+                last += 1
+            yield first, last
+
     def apply_window_series_function(
             self,
             window_days_count: int,
-            function: Callable,
+            function: Union[Callable, str],
             input_as_dict: bool = False,
             for_full_window_only: bool = False,
     ) -> Series:
-        half_window_days = window_days_count / 2
-        int_half_window_days = int(half_window_days)
-        window_days_is_even = half_window_days == int_half_window_days
-        left_days = int_half_window_days
-        right_days = int_half_window_days if window_days_is_even else int_half_window_days + 1
-        result = self.make_new(save_meta=True)
+        left_days, right_days = self._get_window_days(window_days_count)
         if for_full_window_only:
             dates = self.crop(left_days, right_days).get_dates()
         else:
             dates = self.get_dates()
-        for center_date in dates:
-            window = self.span(
-                dt.get_shifted_date(center_date, -left_days),
-                dt.get_shifted_date(center_date, right_days),
-            )
-            if input_as_dict:
-                window = window.get_dict()
-            result.append_pair(center_date, function(window), inplace=True)
+        spans = self._get_window_spans(dates, left_days, right_days)
+        if isinstance(function, str):
+            values = rl.rolling_by_spans(self.get_values(), spans, function)
+        else:
+            all_dates, all_values = self.get_dates(), self.get_values()
+            values = list()
+            for first, last in spans:
+                window = self.make_new(keys=all_dates[first:last], values=all_values[first:last], sort_items=False)
+                if input_as_dict:
+                    window = window.get_dict()
+                values.append(function(window))
+        result = self.make_new(keys=list(dates), values=values, sort_items=False, save_meta=True)
         return self._assume_native(result)
 
     def apply_interpolated_window_series_function(
@@ -258,22 +299,28 @@ class DateNumericSeries(SortedNumericKeyValueSeries, DateSeries, DateNumericSeri
             input_as_list: bool = False,
             for_full_window_only: bool = False,
     ):
-        result = self.make_new(save_meta=True)
-        left_days = min(window_days_list)
-        right_days = max(window_days_list)
+        window_days_list = sorted(window_days_list)
+        window_len = len(window_days_list)
+        left_days = window_days_list[0]
+        right_days = window_days_list[-1]
         if for_full_window_only:
             dates = self.crop(left_days, right_days).get_dates()
         else:
             dates = self.get_dates()
-        for d in dates:
-            window_dates = [dt.get_shifted_date(d, days) for days in window_days_list]
-            window = self.interpolate(window_dates)
-            window_values = window.get_values()
+        all_window_dates = [dt.get_shifted_date(d, days) for d in dates for days in window_days_list]
+        all_window_values = self.get_interpolated_values(all_window_dates)  # interpolating all windows at once
+        result_dates, result_values = list(), list()
+        for n, d in enumerate(dates):
+            window_dates = all_window_dates[n * window_len: (n + 1) * window_len]
+            window_values = all_window_values[n * window_len: (n + 1) * window_len]
             if None not in window_values or not for_full_window_only:
                 if input_as_list:
                     window = window_values
-                result.append_pair(d, function(window), inplace=True)
-        return result
+                else:
+                    window = self.make_new(keys=window_dates, values=window_values, sort_items=False)
+                result_dates.append(d)
+                result_values.append(function(window))
+        return self.make_new(keys=result_dates, values=result_values, sort_items=False, save_meta=True)
 
     def smooth_linear_by_days(self, window_days_list: Window = WINDOW_WEEKLY_DEFAULT) -> Native:
         result = self.apply_interpolated_window_series_function(
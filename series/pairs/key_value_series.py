@@ -19,6 +19,7 @@ Native = KeyValueSeriesInterface
 
 DATA_MEMBER_NAMES = '_keys', '_data'
 META_MEMBER_MAPPING = dict(_data='values')
+KEY_INDEX_MEMBER_NAME = '_key_index'  # cache, not a meta field
 
 
 class KeyValueSeries(AnySeries, KeyValueSeriesInterface):
@@ -32,6 +33,7 @@ class KeyValueSeries(AnySeries, KeyValueSeriesInterface):
             name: Optional[str] = None,
     ):
         self._keys = self._get_optional_copy(keys, role='keys', set_closure=set_closure)
+        self._key_index = None
         super().__init__(values=values, caption=caption, set_closure=set_closure, validate=validate, name=name)
 
     def get_errors(self) -> Generator:
@@ -52,6 +54,11 @@ class KeyValueSeries(AnySeries, KeyValueSeriesInterface):
         meta_member_mapping.update(META_MEMBER_MAPPING)
         return meta_member_mapping
 
+    def get_props(self, ex=None, check: bool = True) -> dict:
+        props = super().get_props(ex=ex, check=check)
+        props.pop(self._get_meta_field_by_member_name(KEY_INDEX_MEMBER_NAME), None)
+        return props
+
     @classmethod
     def from_items(cls, items: Iterable) -> Native:
         series = cls()
@@ -75,8 +82,31 @@ class KeyValueSeries(AnySeries, KeyValueSeriesInterface):
         series_class = SeriesType.AnySeries.get_class()
         return series_class(self.get_values(), set_closure=set_closure, validate=False, name=name)
 
+    def _get_key_index(self) -> dict:
+        keys = self.get_keys()
+        signature = id(keys), len(keys)  # detects replaced keys and appended pairs
+        if self._key_index is None or self._key_index[0] != signature:
+            index = {k: n for n, k in enumerate(keys)}  # the last one wins for duplicated keys, as in get_dict()
+            self._key_index = signature, index
+        return self._key_index[1]
+
+    def _reset_key_index(self) -> None:
+        self._key_index = None
+
+    def get_key_position(self, key: Any) -> Optional[int]:
+        return self._get_key_index().get(key)
+
     def get_value_by_key(self, key: Any, default: Any = None):
-        return self.get_dict().get(key, default)
+        pos = self.get_key_position(key)
+        if pos is None:
+            return default
+        else:
+            return self.get_values()[pos]
+
+    def get_values_by_keys(self, keys: Iterable, default: Any = None) -> list:
+        values = self.get_values()
+        positions = map(self.get_key_position, keys)
+        return [default if pos is None else values[pos] for pos in positions]
 
     def get_keys(self) -> list:
         return self._keys
@@ -85,6 +115,7 @@ class KeyValueSeries(AnySeries, KeyValueSeriesInterface):
         if inplace:
             keys = self._get_optional_copy(keys, role='keys', set_closure=set_closure)
             self._keys = keys
+            self._reset_key_index()
         else:
             result = self.make_new(keys=keys, values=self.get_values())
             return self._assume_native(result)
@@ -125,6 +156,7 @@ class KeyValueSeries(AnySeries, KeyValueSeriesInterface):
         values = self.get_values()
         keys[no] = key
         values[no] = value
+        self._reset_key_index()
         return self
 
     @staticmethod
@@ -1,4 +1,5 @@
 from typing import Optional, Callable, Iterable, Generator, Any
+from bisect import bisect_right
 
 try:  # Assume we're a submodule in a package.
     from functions.primary import numeric as nm, dates as dt
@@ -50,6 +51,15 @@ class SortedKeyValueSeries(KeyValueSeries, SortedSeries, SortedKeyValueSeriesInt
         series_class = SeriesType.SortedSeries.get_class()
         return series_class(self.get_keys(), set_closure=set_closure, validate=False, sort_items=False, name=name)
 
+    def get_key_position(self, key: Any) -> Optional[int]:
+        keys = self.get_keys()
+        try:
+            pos = bisect_right(keys, key) - 1  # the last one wins for duplicated keys, as in get_dict()
+        except TypeError:  # keys are not comparable with given key
+            return super().get_key_position(key)
+        if pos >= 0 and keys[pos] == key:
+            return pos
+
     def has_key_in_range(self, key: Any):
         return self.get_first_key() <= key <= self.get_last_key()
 
@@ -111,6 +121,7 @@ class SortedKeyValueSeries(KeyValueSeries, SortedSeries, SortedKeyValueSeriesInt
     def map_keys(self, function: Callable, sorting_changed: bool = True, inplace: bool = True) -> Native:
         key_series = self.key_series(set_closure=True).map(function, inplace=inplace, validate=False)
         if inplace:
+            self._reset_key_index()
             result = self
         else:
             result = self.set_keys(key_series, inplace=False)  # set_closure=True ?
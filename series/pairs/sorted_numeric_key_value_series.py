@@ -141,10 +141,7 @@ class SortedNumericKeyValueSeries(SortedKeyValueSeries, SortedNumericSeries, Sor
         if self.get_count() < 2:
             return None
         else:
-            distance_series = self.distance(key, take_abs=False)
-            date_a = distance_series.filter_values(lambda v: v < 0).get_arg_max()
-            date_b = distance_series.filter_values(lambda v: v >= 0).get_arg_min()
-            return date_a, date_b
+            return self.key_series(set_closure=True).get_two_nearest_values(key)
 
     def get_segment(self, key: NumericValue) -> Native:
         nearest_keys = [i for i in self.get_two_nearest_keys(key) if i]
@@ -197,6 +194,41 @@ class SortedNumericKeyValueSeries(SortedKeyValueSeries, SortedNumericSeries, Sor
             interpolated_value = value_a + (value_b - value_a) * distance_days / segment_days
             return interpolated_value
 
+    def get_spline_interpolated_values(self, keys: Iterable, default: OptNumeric = None) -> list:
+        keys = list(keys)
+        first_key, last_key = self.get_first_key(), self.get_last_key()
+        keys_in_range = [k for k in keys if first_key <= k <= last_key]
+        if keys_in_range:  # spline is fitted once and evaluated on all keys at once
+            spline_function = self.get_spline_function(from_cache=True, to_cache=True)
+            values_in_range = iter(spline_function(keys_in_range).tolist())
+        else:
+            values_in_range = iter([])
+        return [next(values_in_range) if first_key <= k <= last_key else default for k in keys]
+
+    def get_linear_interpolated_values(self, keys: Iterable, near_for_outside: bool = True) -> list:
+        keys = list(keys)
+        if not nm.np or self.get_count() < 2:
+            return [self.get_linear_interpolated_value(k, near_for_outside=near_for_outside) for k in keys]
+        values = nm.np.interp(
+            nm.np.array(keys, dtype=float),
+            nm.np.array(self.get_keys(), dtype=float),
+            nm.np.array(self.get_values(), dtype=float),
+        ).tolist()  # values outside the range are taken from the nearest border
+        if not near_for_outside:
+            first_key, last_key = self.get_first_key(), self.get_last_key()
+            values = [v if first_key <= k <= last_key else None for k, v in zip(keys, values)]
+        return values
+
+    def get_interpolated_values(
+            self,
+            keys: Iterable,
+            how: InterpolationType = InterpolationType.Linear,
+            *args, **kwargs
+    ) -> list:
+        method_name = 'get_{}_interpolated_values'.format(get_value(how))
+        interpolation_method = self.__getattribute__(method_name)
+        return interpolation_method(keys, *args, **kwargs)
+
     def get_interpolated_value(
             self,
             key: NumericValue,
@@ -213,16 +245,17 @@ class SortedNumericKeyValueSeries(SortedKeyValueSeries, SortedNumericSeries, Sor
         return interpolation_method(keys, *args, **kwargs)
 
     def linear_interpolation(self, keys: Iterable, near_for_outside: bool = True) -> Native:
-        result = self.make_new(save_meta=True)
-        for k in keys:
-            result.append_pair(k, self.get_linear_interpolated_value(k, near_for_outside), inplace=True)
+        keys = list(keys)
+        values = self.get_linear_interpolated_values(keys, near_for_outside=near_for_outside)
+        result = self.make_new(keys=keys, values=values, sort_items=False, save_meta=True)
         return self._assume_native(result)
 
     def spline_interpolation(self, keys: Iterable) -> Native:
+        keys = list(keys)
         spline_function = self.get_spline_function(from_cache=True, to_cache=True)
         result = self.make_new(
             keys=keys,
-            values=spline_function(list(keys)),
+            values=spline_function(keys).tolist(),
             save_meta=True,
         )
         return self._assume_native(result)
@@ -233,7 +266,7 @@ class SortedNumericKeyValueSeries(SortedKeyValueSeries, SortedNumericSeries, Sor
             interpolate: InterpolationType = InterpolationType.Linear,
             *args, **kwargs
     ) -> NumericValue:
-        value = self.get_dict().get(key)
+        value = super().get_value_by_key(key)
         if value is None:
             value = self.get_interpolated_value(key, how=interpolate, *args, **kwargs)
         return value
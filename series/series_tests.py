@@ -1,6 +1,10 @@
 try:  # Assume we're a submodule in a package.
+    from utils.external import np
+    from functions.primary import numeric as nm, dates as dt
     from series import series_classes as sc
 except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
+    from ..utils.external import np
+    from ..functions.primary import numeric as nm, dates as dt
     from . import series_classes as sc
 
 
@@ -16,6 +20,79 @@ def test_simple_smooth():
     assert received == expected
 
 
+def test_numeric_array():
+    if not np:
+        return None
+    data = [2, 5, None, 8, 5, 0]
+    list_series = sc.NumericSeries(data)
+    array_series = sc.NumericSeries(data).to_array()
+    assert array_series.is_array_backed() and not list_series.is_array_backed()
+    assert array_series.get_sum() == list_series.get_sum() == 20
+    assert array_series.get_mean() == list_series.get_mean() == 4
+    array = np.array([1.0, 2.0, 3.0])
+    assert sc.NumericSeries.from_array(array).get_values() is array, 'test case 0: from_array() must not copy'
+    assert sc.NumericSeries.from_array(array).get_array() is array, 'test case 1: get_array() must not copy'
+    list_series = sc.NumericSeries([2, 5, 3, 8, 5, 0])
+    array_series = list_series.to_array()
+    other = sc.NumericSeries([1, 2, 4, 4, None, 2])
+    cases = [
+        lambda s: s.norm(),
+        lambda s: s.divide(other, default=-1),
+        lambda s: s.subtract(other),
+        lambda s: s.shift_values(1),
+        lambda s: s.smooth_simple_linear(3),
+        lambda s: s.smooth_simple_linear(3, exclude_center=True),
+    ]
+    for n, c in enumerate(cases):
+        expected = c(list_series).get_list()
+        received_series = c(array_series)
+        assert received_series.is_array_backed(), f'test case {n}: result must be array-backed'
+        received = received_series.to_list().get_list()
+        assert received == expected, f'test case {n}: {received} vs {expected}'
+    received = sc.NumericSeries([1e17, 1, 2, 3, 4, 5]).smooth_simple_linear(3).get_list()
+    expected = [1e17, (1e17 + 3) / 3, 2, 3, 4, 5]
+    assert received == expected, f'test case large value: {received} vs {expected}'
+
+
+def test_rolling():
+    if not np:
+        return None
+    data = [2, 5, None, 8, 5, 0, 7, -3, None, None, 4]
+    series = sc.NumericSeries(data)
+    aggregates = dict(sum=nm.sum, mean=nm.mean, min=nm.min, max=nm.max, median=nm.median, std=np.std)
+    for window in [(-1, 0, 1), (-1, 0), (-2, -1, 0, 1, 2)]:
+        for extend in (True, False):
+            for name, function in aggregates.items():
+                expected = list()
+                for w in series.get_sliding_window(window, extend=extend, as_series=False):
+                    w = [v for v in w if v is not None]
+                    expected.append(float(function(w)) if w else None)
+                received = series.rolling(name, window=window, extend=extend).get_list()
+                assert approx(received) == approx(expected), f'{name}{window}: {received} vs {expected}'
+                received = series.to_array().rolling(name, window=window, extend=extend).to_list().get_list()
+                assert approx(received) == approx(expected), f'{name}{window} for array: {received} vs {expected}'
+    expected = series.apply_window_func(lambda s: nm.mean(s), as_series=False).get_list()
+    received = series.apply_window_func(nm.mean).get_list()
+    assert approx(received) == approx(expected), f'{received} vs {expected}'
+    expected = series.apply_window_func(lambda s: s.get_mean(), as_series=True).get_list()
+    received = series.smooth_linear().get_list()
+    assert approx(received) == approx(expected), f'{received} vs {expected}'
+    received = series.rolling('sum', window=(-1, 0, 1)).get_list()
+    assert all(isinstance(v, int) for v in received), f'integer sums expected, got {received}'
+    shifted = sc.NumericSeries([1e9 + n / 10 for n in range(1, 7)])
+    received = shifted.rolling('std', window=(-1, 0, 1), extend=False).get_list()
+    expected = [np.std([0.1, 0.2, 0.3])] * 4
+    assert approx(received, 6) == approx(expected, 6), f'std with large offset: {received} vs {expected}'
+    large = sc.NumericSeries([1e17, 1, 2, 3, 4, 5])
+    received = large.rolling('mean', window=(-1, 0, 1), extend=False).get_list()
+    expected = [(1e17 + 3) / 3, 2, 3, 4]
+    assert received == expected, f'mean after large value: {received} vs {expected}'
+
+
+def approx(values: list, ndigits: int = 9) -> list:
+    return [None if v is None else round(v, ndigits) for v in values]
+
+
 def test_get_nearest_date():
     data = {'2020-01-01': 10, '2021-01-01': 20}
     cases = ['2019-12-01', '2020-02-01', '2020-12-01', '2021-12-02']
@@ -24,6 +101,44 @@ def test_get_nearest_date():
     assert received == expected
 
 
+def test_get_nearest_values():
+    series = sc.SortedNumericSeries([1, 3, 5, 7, 7, 20])
+    cases = [25, -1, 2, 7, 4, 6.5, 13, 14]
+    expected = [20, 1, 3, 7, 5, 7, 7, 20]
+    received = [series.get_nearest_value(c) for c in cases]
+    assert received == expected, f'test case 0: {received} vs {expected}'
+    received = series.get_nearest_values(cases)
+    assert received == expected, f'test case 1: {received} vs {expected}'
+    received = series.get_nearest_values(sorted(cases))
+    assert received == sorted(expected), f'test case 2: {received} vs {sorted(expected)}'
+    received = [series.get_neighbors(c) for c in (0, 3, 4, 25)]
+    expected = [(None, 1), (1, 3), (3, 5), (20, None)]
+    assert received == expected, f'test case 3: {received} vs {expected}'
+    received = series.get_segment(6).get_list()
+    assert received == [5, 7], f'test case 4: {received}'
+
+
+def test_get_value_by_key():
+    series = sc.KeyValueSeries(['b', 'a', 'c', 'a'], [1, 2, 3, 4])
+    expected = series.get_dict()
+    received = {k: series.get_value_by_key(k) for k in 'abcd'}
+    assert received == dict(expected, d=None), f'test case 0: {received} vs {expected}'
+    series.append_pair('d', 5, inplace=True)
+    series.set_item_inplace(0, 'e', 6)
+    received = series.get_values_by_keys('abcde')
+    assert received == [4, None, 3, 5, 6], f'test case 1: {received}'
+    series.map_keys(str.upper, inplace=True)
+    received = series.get_values_by_keys('AE', default=0) + series.get_values_by_keys('ae', default=0)
+    assert received == [4, 6, 0, 0], f'test case 2: {received}'
+    sorted_series = sc.SortedNumericKeyValueSeries([1, 3, 3, 5], [10, 30, 35, 50])
+    received = [sorted_series.get_value_by_key(k) for k in (1, 3, 4, 5)]
+    assert received == [10, 35, 42.5, 50], f'test case 3: {received}'
+    sorted_series.map_keys(lambda k: k * 2, sorting_changed=False, inplace=True)
+    received = sorted_series.get_values_by_keys([2, 3, 6])
+    assert received == [10, None, 35], f'test case 4: {received}'
+    assert 'key_index' not in sorted_series.get_meta(), sorted_series.get_meta()
+
+
 def test_get_distance_for_nearest_date():
     data = {'2020-01-01': 10, '2021-01-01': 20}
     cases = ['2019-12-01', '2020-02-01', '2020-12-01', '2021-12-02']
@@ -69,6 +184,49 @@ def test_interpolate():
     assert expected == received
 
 
+def test_get_interpolated_values():
+    series = sc.SortedNumericKeyValueSeries([1, 3, 5, 7], [10, 30, 50, 80])
+    keys = [0, 1, 2, 3, 3.5, 6, 9]
+    for how in ('linear', 'spline'):
+        expected = [series.get_interpolated_value(k, how=how) for k in keys]
+        received = series.get_interpolated_values(keys, how=how)
+        assert approx(received) == approx(expected), f'{how}: {received} vs {expected}'
+    data = {'2020-01-01': 10, '2020-01-11': 20, '2020-02-10': 80}
+    dates = ['2020-01-06', '2020-01-11', '2020-01-26', '2020-03-01']
+    date_series = sc.DateNumericSeries.from_dict(data)
+    expected = [date_series.get_interpolated_value(d) for d in dates]
+    received = date_series.get_interpolated_values(dates)
+    assert received == expected == [15, 20, 50, 80], f'dates: {received} vs {expected}'
+
+
+def test_apply_window_series_function():
+    data = {
+        '2020-01-01': 1, '2020-01-02': 5, '2020-01-04': 2, '2020-01-05': None,
+        '2020-01-08': 7, '2020-01-09': 3, '2020-01-15': 4,
+    }
+    series = sc.DateNumericSeries.from_dict(data)
+    getters = dict(
+        sum=lambda s: nm.sum(s.get_values(), default=None),
+        mean=lambda s: nm.mean(s.get_values(), default=None),
+        count=lambda s: len([v for v in s.get_values() if v is not None]),
+        min=lambda s: nm.min(s.get_values(), default=None),
+        max=lambda s: nm.max(s.get_values(), default=None),
+    )
+    for window_days_count in (1, 3, 4, 7):
+        for name, getter in getters.items():
+            expected = series.apply_window_series_function(window_days_count, getter)
+            received = series.apply_window_series_function(window_days_count, name)
+            assert received.get_dates() == expected.get_dates() == list(data)
+            assert approx(received.get_values()) == approx(expected.get_values()), f'{name}, {window_days_count}'
+    received = series.apply_window_series_function(3, 'max').get_values()
+    assert received == [5, 5, 2, 2, 7, 7, 4], received
+    series = sc.DateNumericSeries.from_dict({k: v for k, v in data.items() if v is not None})
+    received = series.apply_interpolated_window_series_function([1, -1, 0], sum, input_as_list=True)
+    windows = [series.interpolate([dt.get_shifted_date(d, i) for i in (-1, 0, 1)]) for d in series.get_dates()]
+    expected = [sum(w.get_values()) for w in windows]
+    assert received.get_values() == expected, f'{received.get_values()} vs {expected}'
+
+
 def test_find_base_date():
     data = ['2019-01-01', '2019-06-01', '2020-01-01', '2021-01-01'], [1, 1, 1, 1]
     cases = [
@@ -85,11 +243,17 @@ def test_find_base_date():
 
 def main():
     test_simple_smooth()
+    test_numeric_array()
+    test_rolling()
     test_get_nearest_date()
+    test_get_nearest_values()
+    test_get_value_by_key()
     test_get_distance_for_nearest_date()
     test_get_segment_for_date()
     test_get_interpolated_value()
     test_interpolate()
+    test_get_interpolated_values()
+    test_apply_window_series_function()
     test_find_base_date()
 
 
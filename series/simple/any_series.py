@@ -45,8 +45,8 @@ class AnySeries(AbstractSeries, AnySeriesInterface):
 
     def get_errors(self) -> Generator:
         values = self.get_values()
-        if not isinstance(values, list):
-            yield 'Values must be a list, not {}'.format(type(values))
+        if not isinstance(values, nm.MUTABLE):
+            yield 'Values must be a list or ndarray, not {}'.format(type(values))
 
     def value_series(self) -> Native:
         return self
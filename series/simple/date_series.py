@@ -3,7 +3,7 @@ from typing import Optional, Callable, Iterable, Generator, Union
 try:  # Assume we're a submodule in a package.
     from utils.decorators import deprecated_with_alternative
     from functions.primary import dates as dt
-    from functions.secondary.date_functions import date_to_int, round_date, date_range
+    from functions.secondary.date_functions import dates_to_int, round_date, date_range
     from series.series_type import SeriesType
     from series.interfaces.sorted_numeric_series_interface import SortedNumericSeriesInterface
     from series.interfaces.date_series_interface import DateSeriesInterface, DateScale, Date, MAX_DAYS_IN_MONTH
@@ -12,7 +12,7 @@ try:  # Assume we're a submodule in a package.
 except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
     from ...utils.decorators import deprecated_with_alternative
     from ...functions.primary import dates as dt
-    from ...functions.secondary.date_functions import date_to_int, round_date, date_range
+    from ...functions.secondary.date_functions import dates_to_int, round_date, date_range
     from ..series_type import SeriesType
     from ..interfaces.sorted_numeric_series_interface import SortedNumericSeriesInterface
     from ..interfaces.date_series_interface import DateSeriesInterface, DateScale, Date, MAX_DAYS_IN_MONTH
@@ -105,7 +105,8 @@ class DateSeries(SortedSeries, DateSeriesInterface):
         )
 
     def to_int(self, scale: DateScale, inplace: bool = False) -> SortedNumericSeriesInterface:
-        series = self.map_dates(date_to_int(scale=scale), inplace=inplace) or self
+        int_dates = dates_to_int(scale=scale)(self.get_dates())
+        series = self.set_dates(int_dates, inplace=inplace) or self
         return self._assume_sorted_numeric(series.assume_numeric())
 
     @deprecated_with_alternative('to_int(scale=DateScale.Day)')
@@ -218,11 +219,12 @@ class DateSeries(SortedSeries, DateSeriesInterface):
             distance_series = self.distance_for_date(d, take_abs=take_abs)
         elif self._is_native(d):
             arg_date_series = self.make_new(d, validate=False, sort_items=False, set_closure=True)
-            self_date_series = self.date_series(inplace=inplace, set_closure=inplace)
-            func = arg_date_series.get_distance_for_nearest_date
-            distances = self_date_series.map(lambda i: func(i, take_abs), inplace=inplace) or self_date_series
+            dates = self.get_dates()
+            distance_func = self.get_distance_func()
+            nearest_dates = arg_date_series.get_nearest_dates(dates)
+            distances = [distance_func(i, n, take_abs) for i, n in zip(dates, nearest_dates)]
             if inplace:
-                distance_series = distances
+                distance_series = self.set_values(distances, inplace=True) or self
             else:
                 series_class = SeriesType.DateNumericSeries.get_class()
                 distance_series = series_class(self.get_dates(), distances, sort_items=False, validate=False)
@@ -250,16 +252,18 @@ class DateSeries(SortedSeries, DateSeriesInterface):
     def get_nearest_date(self, date: Date, distance_func: Optional[Callable] = None) -> Date:
         if distance_func is None:
             distance_func = self.get_distance_func()
-        return self.date_series().get_nearest_value(date, distance_func=distance_func)
+        return self.date_series(set_closure=True).get_nearest_value(date, distance_func=distance_func)
+
+    def get_nearest_dates(self, dates: Iterable, distance_func: Optional[Callable] = None) -> list:
+        if distance_func is None:
+            distance_func = self.get_distance_func()
+        return self.date_series(set_closure=True).get_nearest_values(dates, distance_func=distance_func)
 
     def get_two_nearest_dates(self, date: Date) -> Optional[tuple]:
         if self.get_count() < 2:
             return None
         else:
-            distance_series = self.date_series().distance(date, take_abs=False)
-            date_a = distance_series.filter_values(lambda v: v < 0).get_arg_max()
-            date_b = distance_series.filter_values(lambda v: v >= 0).get_arg_min()
-            return date_a, date_b
+            return self.date_series(set_closure=True).get_neighbors(date)
 
     def get_segment(self, date: Date, inplace: bool = False) -> Native:
         nearest_dates = [i for i in self.get_two_nearest_dates(date) if i]
@@ -1,7 +1,9 @@
-from typing import Optional, Callable, Iterable, Generator, Any
+from typing import Optional, Callable, Iterable, Generator, Union, Any
 
 try:  # Assume we're a submodule in a package.
+    from utils.external import np, raise_import_error
     from functions.primary.numeric import plot
+    from functions.primary import rolling as rl
     from functions.secondary import numeric_functions as fs
     from series.series_type import SeriesType
     from series.interfaces.numeric_series_interface import (
@@ -11,7 +13,9 @@ try:  # Assume we're a submodule in a package.
     )
     from series.simple.any_series import AnySeries
 except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
+    from ...utils.external import np, raise_import_error
     from ...functions.primary.numeric import plot
+    from ...functions.primary import rolling as rl
     from ...functions.secondary import numeric_functions as fs
     from ..series_type import SeriesType
     from ..interfaces.numeric_series_interface import (
@@ -40,6 +44,56 @@ class NumericSeries(AnySeries, NumericSeriesInterface):
     def get_series_type(self) -> SeriesType:
         return SeriesType.NumericSeries
 
+    @staticmethod
+    def _get_optional_copy(array: Iterable, set_closure: bool = False, role: str = 'array'):
+        if np and isinstance(array, np.ndarray) and not set_closure:
+            return array.copy()  # keep ndarray-storage
+        else:
+            return AnySeries._get_optional_copy(array, set_closure=set_closure, role=role)
+
+    @classmethod
+    def from_array(cls, array, **kwargs) -> Native:
+        if not np:
+            raise_import_error('numpy')
+        return cls(values=np.asarray(array), set_closure=True, **kwargs)  # zero-copy for ndarray
+
+    def is_array_backed(self) -> bool:
+        return bool(np) and isinstance(self.get_values(), np.ndarray)
+
+    def get_array(self):
+        if self.is_array_backed():
+            return self.get_values()  # zero-copy
+        elif np:
+            return np.array(self.get_values(), dtype=float)  # None becomes NaN
+        else:
+            raise_import_error('numpy')
+
+    def to_array(self, inplace: bool = False) -> Native:
+        return self.set_values(self.get_array(), set_closure=True, inplace=inplace) or self
+
+    def to_list(self, inplace: bool = False) -> Native:
+        if self.is_array_backed():
+            values = [None if v != v else v for v in self.get_values().tolist()]  # NaN becomes None
+            return self.set_values(values, set_closure=True, inplace=inplace) or self
+        else:
+            return self
+
+    def _set_array(self, array, inplace: bool) -> Native:
+        result = self.set_values(array, set_closure=True, inplace=inplace) or self
+        return self._assume_native(result)
+
+    def _get_other_array(self, series: Native):
+        if hasattr(series, 'get_array'):
+            return series.get_array()
+        else:
+            return np.array(series.get_values(), dtype=float)
+
+    def has_items(self) -> bool:
+        return self.get_count() > 0
+
+    def has_data(self) -> bool:
+        return self.has_items()
+
     @staticmethod
     def get_distance_func(constant=None, take_abs: bool = False, default=None) -> Callable:
         return fs.increment(constant, take_abs=take_abs, default=default)
@@ -50,6 +104,8 @@ class NumericSeries(AnySeries, NumericSeriesInterface):
             yield 'Values of {} must be numeric'.format(self.get_class_name())
 
     def has_valid_items(self) -> bool:
+        if self.is_array_backed():
+            return self.get_values().dtype.kind in 'biuf'
         for v in self.get_values():
             if not isinstance(v, (int, float)):
                 return False
@@ -62,22 +118,56 @@ class NumericSeries(AnySeries, NumericSeriesInterface):
             return DEFAULT_NUMERIC
 
     def get_sum(self) -> NumericValue:
+        if self.is_array_backed():
+            return np.nansum(self.get_values()).item()
         values = self.filter_values_defined().get_values()
         return sum(values)
 
     def get_mean(self, default: OptNumeric = None) -> OptNumeric:
+        if self.is_array_backed():
+            values = self.get_values()
+            values_defined = values[~np.isnan(values)]
+            return values_defined.mean().item() if values_defined.size else default
         values_defined = self.filter_values_defined().get_values()
         if values_defined:
             return sum(values_defined) / len(values_defined)
         else:
             return default
 
+    def shift_values(self, diff: NumericValue, inplace: bool = False) -> Native:
+        if self.is_array_backed():
+            return self._set_array(self.get_values() + diff, inplace=inplace)
+        else:
+            return super().shift_values(diff, inplace=inplace)
+
+    def append(self, value: Any, inplace: bool) -> Native:
+        if self.is_array_backed():
+            values = np.append(self.get_values(), np.nan if value is None else value)
+            return self._set_array(values, inplace=inplace)
+        else:
+            return super().append(value, inplace=inplace)
+
     def norm(self, rate: OptNumeric = None, default: OptNumeric = None, inplace: bool = False) -> Native:
         if rate is None:
             rate = self.get_mean()
+        if self.is_array_backed():
+            if rate:
+                values = self.get_values() / rate
+            else:
+                values = np.full(self.get_count(), np.nan if default is None else default)
+            return self._set_array(values, inplace=inplace)
         return self.map_values(lambda v: v / rate if rate else default, inplace=inplace) or self
 
+    def _can_vectorize_with(self, series: Native, extend: bool = False) -> bool:
+        return self.is_array_backed() and series.get_count() == self.get_count() and not extend
+
     def divide(self, series: Native, default: OptNumeric = None, extend: bool = False, inplace: bool = False) -> Native:
+        if self._can_vectorize_with(series, extend=extend):
+            x, y = np.nan_to_num(self.get_values()), self._get_other_array(series)  # undefined x is used as 0
+            is_defined = (y != 0) & ~np.isnan(y)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                values = np.where(is_defined, x / y, np.nan if default is None else default)
+            return self._set_array(values, inplace=inplace)
         result = self.map_optionally_extend_zip_values(
             fs.div(default=default),
             series,
@@ -87,6 +177,11 @@ class NumericSeries(AnySeries, NumericSeriesInterface):
         return self._assume_native(result)
 
     def subtract(self, series: Native, default: Any = None, extend: bool = False, inplace: bool = False) -> Native:
+        if self._can_vectorize_with(series, extend=extend):
+            values = self.get_values() - self._get_other_array(series)
+            if default is not None:
+                values = np.where(np.isnan(values), default, values)
+            return self._set_array(values, inplace=inplace)
         result = self.map_optionally_extend_zip_values(
             fs.diff(default=default),
             series,
@@ -122,28 +217,50 @@ class NumericSeries(AnySeries, NumericSeriesInterface):
             default: bool = None,
             as_series: bool = True,
     ) -> Generator:
+        value_series = self.value_series()
+        values = value_series.get_values()
+        count = len(values)
         if extend:
             n_min = 0
-            n_max = self.get_count()
+            n_max = count
         else:
             n_min = - min(window)
-            n_max = self.get_count() - max(window)
+            n_max = count - max(window)
         for center in range(n_min, n_max):
-            sliding_window = [center + n for n in window]
+            window_values = [values[center + n] if 0 <= center + n < count else default for n in window]
             if as_series:
-                yield self.value_series().items_no(sliding_window, extend=extend, default=default)
+                yield value_series.set_items(window_values, inplace=False)
             else:
-                yield self.value_series().get_items_no(sliding_window, extend=extend, default=default)
+                yield window_values
+
+    def rolling(
+            self,
+            function: Union[Callable, str] = 'mean',
+            window: Window = WINDOW_DEFAULT,
+            extend: bool = True,
+            inplace: bool = False,
+    ) -> Native:
+        values = rl.rolling(self.get_values(), function, window=window, extend=extend)
+        result = self.set_values(values, set_closure=True, inplace=inplace) or self
+        return self._assume_native(result)
+
+    def _can_apply_rolling(self, function: Union[Callable, str], window: Window, default: Any = None) -> bool:
+        if default is None and rl.get_window_borders(window):
+            return rl.get_rolling_function(function) is not None
+        else:
+            return False
 
     def apply_window_func(
             self,
-            function: Callable,
+            function: Union[Callable, str],
             window: Window = WINDOW_DEFAULT,
             extend: bool = True,
             default: Any = None,
             as_series: bool = False,
             inplace: bool = False,
     ) -> Native:
+        if self._can_apply_rolling(function, window=window, default=default):
+            return self.rolling(function, window=window, extend=extend, inplace=inplace)
         values = map(function, self.get_sliding_window(window, extend=extend, default=default, as_series=as_series))
         result = self.set_values(values, inplace=inplace)
         return self._assume_native(result) or self
@@ -181,6 +298,11 @@ class NumericSeries(AnySeries, NumericSeriesInterface):
     def smooth_simple_linear(self, window_len: int = 3, exclude_center: bool = False) -> Native:
         center = int((window_len - 1) / 2)
         count = self.get_count()
+        if self.is_array_backed():
+            return self._smooth_simple_linear_array(center, exclude_center=exclude_center)
+        elif np and self.has_valid_items():
+            series = self.to_array()._smooth_simple_linear_array(center, exclude_center=exclude_center)
+            return series.to_list()
         result = self._assume_native(self.make_new())
         for n in self.get_range_numbers():
             is_edge = n < center or n >= count - center
@@ -193,6 +315,16 @@ class NumericSeries(AnySeries, NumericSeriesInterface):
                 result.append(sub_series.get_mean(), inplace=True)
         return self._assume_native(result)
 
+    def _smooth_simple_linear_array(self, center: int, exclude_center: bool = False) -> Native:
+        values = self.get_values().astype(float)
+        count = values.size
+        result = values.copy()
+        if count > 2 * center:
+            window_len = 2 * center + 1
+            skip_position = center if exclude_center else None
+            result[center: count - center] = rl.get_window_means(values, window_len, skip_position=skip_position)
+        return self._set_array(result, inplace=False)
+
     def smooth(self, how: str = 'linear', *args, **kwargs) -> Native:
         method_name = 'smooth_{}'.format(how)
         smooth_method = self.__getattribute__(method_name)
@@ -205,6 +337,8 @@ class NumericSeries(AnySeries, NumericSeriesInterface):
         return series
 
     def smooth_linear(self, window: Window = WINDOW_DEFAULT, inplace: bool = False) -> Native:
+        if self._can_apply_rolling('mean', window=window):
+            return self.rolling('mean', window=window, extend=True, inplace=inplace)
         return self.apply_window_func(
             lambda s: s.get_mean(),
             window=window, extend=True, default=None,
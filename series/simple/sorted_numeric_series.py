@@ -68,8 +68,11 @@ class SortedNumericSeries(SortedSeries, NumericSeries, SortedNumericSeriesInterf
         if got_one_value:
             return self.distance_for_value(v, take_abs=take_abs, inplace=inplace)
         else:
-            v_series = self.make_new(v, validate=False, sort_items=True)
-            distances = self.value_series().map(lambda i: v_series.get_distance_for_nearest_value(i, take_abs))
+            v_series = self.make_new(sorted(v), validate=False)
+            values = self.get_values()
+            nearest_values = v_series.get_nearest_values(values)
+            distance_func = self.get_distance_func(take_abs=take_abs)
+            distances = [distance_func(i, n) for i, n in zip(values, nearest_values)]
             series_class = SeriesType.SortedNumericKeyValueSeries.get_class()
             result = series_class(self.get_values(), distances, sort_items=False, validate=False)
             if inplace:
@@ -94,6 +97,13 @@ class SortedNumericSeries(SortedSeries, NumericSeries, SortedNumericSeriesInterf
         distance_func = distance_func or self.get_distance_func()
         return super().get_nearest_value(value, distance_func)
 
+    def get_two_nearest_values(self, value: NumericValue) -> Optional[tuple]:
+        if self.get_count() < 2:
+            return None
+        else:  # greater value goes first, equal value goes to lower neighbor
+            lower, greater = self.get_neighbors(value, including_left=True)
+            return greater, lower
+
     @staticmethod
     def _assume_sorted(series) -> SortedSeries:
         return series
@@ -1,4 +1,5 @@
 from typing import Optional, Callable, Iterable, Generator, Any
+from bisect import bisect_left, bisect_right
 
 try:  # Assume we're a submodule in a package.
     from series.series_type import SeriesType
@@ -86,38 +87,71 @@ class SortedSeries(AnySeries, SortedSeriesInterface):
                     prev = item
             return self._assume_native(series)
 
+    @staticmethod
+    def _get_nearest_from_position(values: list, pos: int, value: Any, distance_func: Callable) -> Any:
+        count = len(values)
+        if pos < count and values[pos] == value:
+            return values[pos]
+        elif pos == 0:
+            return values[0]
+        elif pos == count:
+            return values[-1]
+        else:
+            left, right = values[pos - 1], values[pos]
+            if abs(distance_func(right, value)) > abs(distance_func(left, value)):
+                return left
+            else:  # right value wins when distances are equal
+                return right
+
     def get_nearest_value(self, value: Any, distance_func: Callable) -> Any:
         if self.get_count() == 0:
             return None
         elif self.get_count() == 1:
             return self.get_first_value()
         else:
-            cur_value = None
-            prev_value = None
-            prev_distance = None
-            for cur_value in self.get_values():
-                if cur_value == value:
-                    return cur_value
-                else:
-                    cur_distance = abs(distance_func(cur_value, value))
-                    if prev_distance is not None:
-                        if cur_distance > prev_distance:
-                            return prev_value
-                    prev_value = cur_value
-                    prev_distance = cur_distance
-            return cur_value
+            values = self.get_values()
+            pos = bisect_left(values, value)
+            return self._get_nearest_from_position(values, pos, value, distance_func=distance_func)
+
+    def get_nearest_values(self, values: Iterable, distance_func: Optional[Callable] = None) -> list:
+        if distance_func is None:
+            distance_func = self.get_distance_func()
+        own_values = self.get_values()
+        own_count = len(own_values)
+        values = list(values)
+        if own_count == 0:
+            return [None] * len(values)
+        is_sorted = all(a <= b for a, b in zip(values, values[1:]))
+        order = range(len(values)) if is_sorted else sorted(range(len(values)), key=values.__getitem__)
+        result = [None] * len(values)
+        pos = 0
+        for n in order:  # merge-style pass over both sorted sequences
+            value = values[n]
+            while pos < own_count and own_values[pos] < value:
+                pos += 1
+            result[n] = self._get_nearest_from_position(own_values, pos, value, distance_func=distance_func)
+        return result
+
+    def get_neighbors(self, value: Any, including_left: bool = False) -> tuple:
+        values = self.get_values()
+        if including_left:  # left value is less than or equal to the given one
+            pos = bisect_right(values, value)
+        else:  # right value is greater than or equal to the given one
+            pos = bisect_left(values, value)
+        left = values[pos - 1] if pos > 0 else None
+        right = values[pos] if pos < len(values) else None
+        return left, right
 
     def get_two_nearest_values(self, value: Any) -> Optional[tuple]:
         if self.get_count() < 2:
             return None
-        elif hasattr(self, 'distance'):  # isinstance(self, (DateSeries, SortedNumericSeries)):
-            distance_series = self.distance(value, take_abs=False)
-            date_a = distance_series.filter_values(lambda v: v < 0).get_arg_max()
-            date_b = distance_series.filter_values(lambda v: v >= 0).get_arg_min()
-            return date_a, date_b
         else:
-            msg = 'get_two_nearest_values() method available for DateSeries, SortedNumericSeries only, got {}'
-            raise TypeError(msg.format(self))
+            return self.get_neighbors(value)
+
+    def get_segment(self, value: Any, inplace: bool = False) -> Native:
+        values = [v for v in self.get_neighbors(value) if v is not None]
+        result = self.set_values(values, inplace=inplace) or self
+        return self._assume_native(result)
 
     def get_first_value(self) -> Any:
         if self.get_count():
@@ -9,6 +9,7 @@ try:  # Assume we're a submodule in a package.
     )
     from base.mixin.iter_data_mixin import IterDataMixin, IterableInterface
     from functions.secondary import item_functions as fs
+    from loggers.profiler import Profiler, get_stage, SOURCE_OPERATOR_NAME
     from streams.abstract.abstract_stream import AbstractStream
 except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
     from ...interfaces import (
@@ -18,6 +19,7 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
     )
     from ...base.mixin.iter_data_mixin import IterDataMixin, IterableInterface
     from ...functions.secondary import item_functions as fs
+    from ...loggers.profiler import Profiler, get_stage, SOURCE_OPERATOR_NAME
     from .abstract_stream import AbstractStream
 
 Native = Union[AbstractStream, IterDataMixin, IterableInterface]
@@ -276,6 +278,25 @@ class IterableStream(AbstractStream, IterDataMixin):
         stream = self.stream(items_with_logger)
         return self._assume_native(stream)
 
+    def get_profiler(self) -> Optional[Profiler]:
+        context = self.get_context()
+        if hasattr(context, 'get_profiler'):
+            profiler = context.get_profiler(create_if_not_yet=False)
+            if profiler and profiler.is_enabled():
+                return profiler
+        stage = get_stage(self.get_stream_data())
+        if stage:
+            return stage.get_profiler()
+
+    def profile(self, trace_memory: bool = False, profiler: Optional[Profiler] = None) -> Native:
+        if profiler is None:
+            profiler = self.get_profiler() or Profiler()
+        profiler.enable(trace_memory=trace_memory)
+        data = self.get_stream_data()
+        stage = profiler.add_stage(SOURCE_OPERATOR_NAME, stream_name=self.get_name(), parent=get_stage(data))
+        stream = self.set_data(profiler.wrap(data, stage), inplace=False, reset_dynamic_meta=False)
+        return self._assume_native(stream)
+
     def get_selection_logger(self) -> SelectionLogger:
         context = self.get_context()
         if context:
@@ -1,4 +1,5 @@
 from typing import Optional, Callable, Iterable, Union
+from itertools import chain, islice
 
 try:  # Assume we're a submodule in a package.
     from interfaces import (
@@ -10,6 +11,9 @@ try:  # Assume we're a submodule in a package.
     from functions.secondary import basic_functions as bf, item_functions as fs
     from utils import algo
     from utils.decorators import deprecated_with_alternative
+    from utils.memory import MemoryBudget, get_default_budget, get_item_size, DEFAULT_SAMPLE_SIZE
+    from utils.json_codecs import STDLIB_CODEC
+    from loggers.profiler import profiled, get_list
     from streams.abstract.abstract_stream import DEFAULT_EXAMPLE_COUNT
     from streams.abstract.iterable_stream import IterableStream, MAX_ITEMS_IN_MEMORY
     from streams import stream_classes as sm
@@ -23,12 +27,19 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
     from ...functions.secondary import basic_functions as bf, item_functions as fs
     from ...utils import algo
     from ...utils.decorators import deprecated_with_alternative
+    from ...utils.memory import MemoryBudget, get_default_budget, get_item_size, DEFAULT_SAMPLE_SIZE
+    from ...utils.json_codecs import STDLIB_CODEC
+    from ...loggers.profiler import profiled, get_list
     from .abstract_stream import DEFAULT_EXAMPLE_COUNT
     from .iterable_stream import IterableStream, MAX_ITEMS_IN_MEMORY
     from .. import stream_classes as sm
 
 Native = LocalStreamInterface
 
+MIN_ITEMS_IN_MEMORY = 1000  # memory budget never forces parts (i.e. for disk sort) smaller than this
+ITEM_SIZE_MEMBER_NAME = '_item_size'  # cache, not a meta field
+SPILL_JSON_CODEC = STDLIB_CODEC  # fast codecs (i.e. orjson) write NaN and Infinity as null, stdlib keeps them
+
 
 class LocalStream(IterableStream, LocalStreamInterface):
     def __init__(
@@ -49,6 +60,7 @@ class LocalStream(IterableStream, LocalStreamInterface):
             if less_than is None:
                 less_than = count
         self._tmp_files = None
+        self._item_size = None
         super().__init__(
             data=data, check=check,
             name=name, caption=caption,
@@ -61,7 +73,52 @@ class LocalStream(IterableStream, LocalStreamInterface):
         self._tmp_files = tmp_files
 
     def get_limit_items_in_memory(self) -> int:
-        return self.max_items_in_memory
+        limit = self.max_items_in_memory
+        items_by_budget = self.get_memory_budget().get_items_count(self.get_item_size())
+        if items_by_budget is not None:
+            limit = min(limit, max(items_by_budget, MIN_ITEMS_IN_MEMORY))
+        return limit
+
+    def get_memory_budget(self) -> MemoryBudget:
+        context = self.get_context()
+        if hasattr(context, 'get_memory_budget'):
+            return context.get_memory_budget()
+        else:
+            return get_default_budget()
+
+    def get_props(self, ex: OptionalFields = None, check: bool = True) -> dict:
+        props = super().get_props(ex=ex, check=check)
+        props.pop(self._get_meta_field_by_member_name(ITEM_SIZE_MEMBER_NAME), None)
+        return props
+
+    def get_item_size(self, sample_size: Optional[int] = None) -> Optional[int]:
+        """Estimates memory size of one item by sampled items.
+        Estimation by default sample size is cached while data of stream is not replaced.
+        """
+        if self.is_file():  # reading file for estimation is not worth it
+            return None
+        use_cache = sample_size is None
+        if use_cache:
+            sample_size = DEFAULT_SAMPLE_SIZE
+            if self._item_size is not None and self._item_size[0] is self.get_data():
+                return self._item_size[1]
+        if self.is_in_memory():
+            sample_items = self.get_data()
+        else:
+            sample_items = self._get_sample_items(sample_size)
+        item_size = get_item_size(sample_items, sample_size=sample_size)
+        if use_cache:
+            self._item_size = self.get_data(), item_size
+        return item_size
+
+    def _get_sample_items(self, count: int) -> list:
+        data = self.get_stream_data()
+        if hasattr(data, 'get_sample'):  # i.e. ProfiledIterator, its stage is kept
+            return data.get_sample(count)
+        iterator = iter(data)
+        sample = list(islice(iterator, count))
+        self.set_data(chain(sample, iterator), inplace=True, reset_dynamic_meta=False)
+        return sample
 
     def set_limit_items_in_memory(self, count: Count, inplace: bool) -> Optional[Native]:
         if inplace:
@@ -79,8 +136,10 @@ class LocalStream(IterableStream, LocalStreamInterface):
 
     def get_list(self, inplace: bool = True) -> list:
         if inplace:
-            data = list(self.get_data())
-            self.set_data(data, inplace=True)
+            data = self.get_data()
+            if not isinstance(data, list):  # already collected list is kept as is
+                data = get_list(data)
+                self.set_data(data, inplace=True)
         else:
             data = list(self.get_items())
         return data
@@ -107,9 +166,11 @@ class LocalStream(IterableStream, LocalStreamInterface):
         return result
 
     def can_be_in_memory(self, step: Count = None) -> bool:
+        if self.is_in_memory():
+            return True
         if step is None:
             step = self.get_limit_items_in_memory()
-        if self.is_in_memory() or step is None:
+        if step is None:
             return True
         else:
             count = self.get_estimated_count()
@@ -203,6 +264,7 @@ class LocalStream(IterableStream, LocalStreamInterface):
             stream = stream.to_memory()
         return stream
 
+    @profiled('map')
     def map(self, function: Callable, inplace: bool = False) -> Native:
         stream = super().map(function, inplace=inplace) or self
         if self.is_in_memory() and hasattr(stream, 'to_memory'):
@@ -227,10 +289,15 @@ class LocalStream(IterableStream, LocalStreamInterface):
 
     def memory_sort(self, key: UniKey = fs.same(), reverse: bool = False, verbose: Optional[bool] = False) -> Native:
         key_function = fs.composite_key(key)
-        list_to_sort = self.get_list()
-        count = len(list_to_sort)
-        self.log(f'Sorting {count} items in memory...', end='\r', verbose=verbose)
-        sorted_items = sorted(list_to_sort, key=key_function, reverse=reverse)
+        if self.is_in_memory():
+            reserved_size = 0  # items are already in memory
+        else:
+            reserved_size = (self.get_estimated_count() or 0) * (self.get_item_size() or 0)
+        with self.get_memory_budget().reserved(reserved_size):  # while items are collected and sorted
+            list_to_sort = self.get_list()
+            count = len(list_to_sort)
+            self.log(f'Sorting {count} items in memory...', end='\r', verbose=verbose)
+            sorted_items = sorted(list_to_sort, key=key_function, reverse=reverse)
         self.log(f'Sorting {count} items has been finished.', end='\r', verbose=verbose)
         self._count = len(sorted_items)
         stream = self.stream(sorted_items)
@@ -246,7 +313,11 @@ class LocalStream(IterableStream, LocalStreamInterface):
         if step is None:
             step = self.get_limit_items_in_memory()
         key_function = fs.composite_key(key)
-        stream_parts = self.split_to_disk_by_step(step, sort_each_by=key_function, reverse=reverse, verbose=verbose)
+        item_size = self.get_item_size() or 0
+        with self.get_memory_budget().reserved(step * item_size):  # one part is sorted in memory at a time
+            stream_parts = self.split_to_disk_by_step(
+                step, sort_each_by=key_function, reverse=reverse, verbose=verbose,
+            )
         assert stream_parts, 'streams must be non-empty'
         iterables = [f.get_iter() for f in stream_parts]
         parts_count = len(iterables)
@@ -366,10 +437,10 @@ class LocalStream(IterableStream, LocalStreamInterface):
                 )
             if not is_single_part:
                 self.log('Writing {part_fn} ...', end='\r', verbose=verbose)
-                sm_part = sm_part.to_json().write_to(
+                sm_part = sm_part.to_json(codec=SPILL_JSON_CODEC).write_to(
                     file_part,
                 ).map_to_type(
-                    fs.json_loads(),
+                    fs.json_loads(codec=SPILL_JSON_CODEC),
                     item_type=item_type,
                 )
             result_parts.append(sm_part)
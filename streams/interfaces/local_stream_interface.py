@@ -41,6 +41,14 @@ class LocalStreamInterface(IterableStreamInterface, ABC):
     def to_iter(self) -> Native:
         pass
 
+    @abstractmethod
+    def get_memory_budget(self):
+        pass
+
+    @abstractmethod
+    def get_item_size(self, sample_size: Optional[int] = None) -> Optional[int]:
+        pass
+
     @abstractmethod
     def can_be_in_memory(self, step: Count = None) -> bool:
         pass
@@ -73,6 +73,10 @@ class RegularStreamInterface(IterableStreamInterface, ABC):
     def add_column(self, name: Field, values: Iterable, ignore_errors: bool = False, inplace: bool = False) -> Native:
         pass
 
+    @abstractmethod
+    def to_batches(self, batch_size: int, as_arrays: bool = True) -> Native:
+        pass
+
     @abstractmethod
     def get_one_column_values(self, column: Field, as_list: bool = False) -> Iterable:
         pass
@@ -152,12 +156,36 @@ class RegularStreamInterface(IterableStreamInterface, ABC):
         pass
 
     @abstractmethod
-    def get_dataframe(self, columns: Optional[Iterable] = None) -> DataFrame:
+    def get_dataframe(self, columns: Optional[Iterable] = None, chunk_size: Optional[int] = None) -> DataFrame:
         """Converts full stream data to Pandas DataFrame.
         Can use subset of columns and define order of columns (if columns-argument provided).
         Pandas must be installed, otherwise raise exception.
+        Column arrays are pre-allocated with dtypes of struct fields and filled by chunks of items.
 
         :param columns: list of required fields (columns) or None (take all columns in arbitrary orders).
+        :param chunk_size: count of items converted at once.
         :returns: Pandas DataFrame
         """
         pass
+
+    @abstractmethod
+    def iter_dataframes(self, chunk_size: Optional[int] = None, columns: Optional[Iterable] = None) -> Iterable:
+        """Converts stream data to Pandas DataFrames with chunk_size rows each (the last one can be shorter).
+        Dtypes of columns are derived from struct fields.
+        Records without struct are converted by DataFrame(), so every chunk has columns of its own records.
+
+        :param chunk_size: count of rows in every DataFrame.
+        :param columns: list of required fields (columns) or None (take all columns of struct).
+        :returns: generator of Pandas DataFrames
+        """
+        pass
+
+    @abstractmethod
+    def get_profile(self) -> Native:
+        """Returns table of operator profiles (items in/out, wall time, peak memory delta)
+        collected for the stages which produced this stream.
+        Profiling must be enabled by stream.profile() or by profiler of context before applying operators.
+
+        :returns: stream of records, one record per profiled operator
+        """
+        pass
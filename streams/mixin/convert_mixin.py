@@ -1,5 +1,6 @@
 from abc import ABC
-from typing import Optional, Callable, Iterable, Iterator, Union
+from typing import Optional, Callable, Iterable, Iterator, Generator, Union
+from itertools import islice
 
 try:  # Assume we're a submodule in a package.
     from interfaces import (
@@ -15,7 +16,7 @@ try:  # Assume we're a submodule in a package.
     from content.items.simple_items import FULL_ITEM_FIELD, MutableRecord, MutableRow, ImmutableRow, SimpleRow
     from content.struct.flat_struct import FlatStruct
     from functions.secondary import all_secondary_functions as fs
-    from utils.external import pd, DataFrame
+    from utils.external import np, pd, DataFrame
     from utils.decorators import deprecated_with_alternative
     from streams.stream_builder import StreamBuilder
     from streams.interfaces.regular_stream_interface import RegularStreamInterface
@@ -35,7 +36,7 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
     from ...content.items.simple_items import FULL_ITEM_FIELD, MutableRecord, MutableRow, ImmutableRow, SimpleRow
     from ...content.struct.flat_struct import FlatStruct
     from ...functions.secondary import all_secondary_functions as fs
-    from ...utils.external import pd, DataFrame
+    from ...utils.external import np, pd, DataFrame
     from ...utils.decorators import deprecated_with_alternative
     from ..stream_builder import StreamBuilder
     from ..interfaces.regular_stream_interface import RegularStreamInterface
@@ -52,6 +53,37 @@ DEFAULT_COL_DELIMITER = TAB_CHAR
 DEFAULT_COL_MASK = 'column{n:02}'
 STRUCTURED_ITEM_TYPES = ItemType.Record, ItemType.Row
 UNSTRUCTURED_ITEM_TYPES = ItemType.Line, ItemType.Any, ItemType.Auto
+DEFAULT_CHUNK_SIZE = 100000
+NUMERIC_DTYPE_KINDS = 'biuf'
+
+
+def _get_chunk_array(values: list, dtype):
+    if dtype.kind in NUMERIC_DTYPE_KINDS:
+        if dtype.kind != 'b':  # missing numbers are stored as NaN like in pandas
+            values = [np.nan if v is None else v for v in values]
+        chunk = np.array(values)
+        if chunk.ndim == 1 and chunk.dtype.kind in NUMERIC_DTYPE_KINDS:
+            return chunk
+    return np.fromiter(values, dtype=object, count=len(values))  # keeps nested lists and mixed values as is
+
+
+def _get_widened_dtype(dtype, chunk_dtype):
+    if np.can_cast(chunk_dtype, dtype, casting='same_kind'):
+        return dtype
+    elif dtype.kind in NUMERIC_DTYPE_KINDS and chunk_dtype.kind in NUMERIC_DTYPE_KINDS:
+        return np.result_type(dtype, chunk_dtype)
+    else:
+        return np.dtype(object)
+
+
+def _set_column_chunk(array, start: int, values: list):
+    """Writes values into pre-allocated array, widens dtype of array if values do not fit into it."""
+    chunk = _get_chunk_array(values, array.dtype)
+    dtype = _get_widened_dtype(array.dtype, chunk.dtype)
+    if dtype != array.dtype:
+        array = array.astype(dtype)
+    array[start:start + len(chunk)] = chunk
+    return array
 
 
 class ConvertMixin(IterableStream, ValidateMixin, ABC):
@@ -271,7 +303,18 @@ class ConvertMixin(IterableStream, ValidateMixin, ABC):
             stream = stream.collect()
         return stream
 
-    def get_dataframe(self, columns: Columns = None) -> DataFrame:
+    def get_dataframe(self, columns: Columns = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> DataFrame:
+        if np and pd:
+            columns, dtypes, rows = self._get_dataframe_source(columns)
+            if columns is not None:
+                count = self.get_count() if self.is_in_memory() else None
+                if count is None:
+                    frames = list(self._get_dataframes(columns, dtypes, rows, chunk_size=chunk_size))
+                    if len(frames) == 1:
+                        return frames[0]
+                    elif frames:
+                        return pd.concat(frames, ignore_index=True)
+                return self._get_typed_dataframe(columns, dtypes, rows, count=count or 0, chunk_size=chunk_size)
         if columns and hasattr(self, 'select'):
             data = self.select(*columns).get_data()
         else:
@@ -279,6 +322,75 @@ class ConvertMixin(IterableStream, ValidateMixin, ABC):
         if DataFrame:
             return DataFrame(data)
 
+    def iter_dataframes(self, chunk_size: int = DEFAULT_CHUNK_SIZE, columns: Columns = None) -> Generator:
+        if not (np and pd):
+            raise ImportError('iter_dataframes() requires numpy and pandas')
+        columns, dtypes, rows = self._get_dataframe_source(columns)
+        if columns is not None:
+            yield from self._get_dataframes(columns, dtypes, rows, chunk_size=chunk_size)
+        elif self.get_item_type() == ItemType.Record:  # keys of records without struct can differ from item to item
+            records = iter(self.get_items())
+            while True:
+                chunk = list(islice(records, chunk_size))
+                if not chunk:
+                    break
+                yield DataFrame(chunk)
+        else:
+            msg = f'iter_dataframes(): columns must be defined by struct or records, got {self.get_item_type()}'
+            raise ValueError(msg)
+
+    def _get_dataframe_source(self, columns: Columns = None) -> tuple:
+        item_type = self.get_item_type()
+        struct = self.get_struct() if hasattr(self, 'get_struct') else None
+        struct_columns = struct.get_columns() if struct else None
+        if columns:
+            columns = get_names(columns, or_callable=False)
+        elif struct_columns:
+            columns = struct_columns
+        else:  # records without struct are converted by DataFrame(), so it takes union of their keys
+            return None, None, None
+        if item_type == ItemType.Record:
+            rows = self._get_mapped_items(lambda r: [r.get(c) for c in columns])
+        elif item_type == ItemType.Row and struct_columns:
+            if columns == struct_columns:
+                rows = self.get_items()
+            else:
+                positions = [struct_columns.index(c) for c in columns]
+                rows = self._get_mapped_items(lambda r: [r[n] for n in positions])
+        else:
+            return None, None, None
+        types = struct.get_types_dict() if struct else dict()
+        dtypes = list()
+        for c in columns:
+            value_type = types.get(c)
+            dtype = value_type.get_numpy_dtype() if hasattr(value_type, 'get_numpy_dtype') else object
+            dtypes.append(np.dtype(dtype))
+        return columns, dtypes, iter(rows)
+
+    @staticmethod
+    def _get_dataframes(columns: list, dtypes: list, rows: Iterator, chunk_size: int) -> Generator:
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            arrays = [np.empty(len(chunk), dtype=t) for t in dtypes]
+            for n, values in enumerate(zip(*chunk)):
+                arrays[n] = _set_column_chunk(arrays[n], 0, list(values))
+            yield DataFrame(dict(zip(columns, arrays)), copy=False).infer_objects()
+
+    @staticmethod
+    def _get_typed_dataframe(columns: list, dtypes: list, rows: Iterator, count: int, chunk_size: int) -> DataFrame:
+        arrays = [np.empty(count, dtype=t) for t in dtypes]
+        start = 0
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            for n, values in enumerate(zip(*chunk)):
+                arrays[n] = _set_column_chunk(arrays[n], start, list(values))
+            start += len(chunk)
+        return DataFrame(dict(zip(columns, arrays)), copy=False).infer_objects()
+
     def _get_columns(self, columns: StructOrColumns = None) -> Optional[list]:
         struct = self._get_struct(columns)
         if isinstance(struct, StructInterface) or hasattr(struct, 'get_columns'):
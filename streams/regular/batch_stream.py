@@ -0,0 +1,182 @@
+from typing import Optional, Callable, Iterable, Generator, Union
+
+try:  # Assume we're a submodule in a package.
+    from interfaces import (
+        StructInterface, Context, Source, TmpFiles, ItemType,
+        Count, Struct, Columns, Name,
+    )
+    from base.constants.chars import EMPTY
+    from base.functions.arguments import get_name, get_names
+    from functions.primary import batches as bt
+    from content.struct.flat_struct import FlatStruct
+    from streams.abstract.local_stream import LocalStream
+    from streams.stream_builder import StreamBuilder
+except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
+    from ...interfaces import (
+        StructInterface, Context, Source, TmpFiles, ItemType,
+        Count, Struct, Columns, Name,
+    )
+    from ...base.constants.chars import EMPTY
+    from ...base.functions.arguments import get_name, get_names
+    from ...functions.primary import batches as bt
+    from ...content.struct.flat_struct import FlatStruct
+    from ..abstract.local_stream import LocalStream
+    from ..stream_builder import StreamBuilder
+
+Native = LocalStream
+Batch = bt.Batch
+
+DEFAULT_BATCH_SIZE = bt.DEFAULT_BATCH_SIZE
+
+
+class BatchStream(LocalStream):
+    """Stream of fixed-size column batches: every item is a dict of lists (or NumPy arrays) keyed by column name.
+
+    Operators work with whole columns instead of separate rows,
+    rows and records are built only by sinks (get_records(), get_rows(), to_records(), to_rows()).
+    """
+
+    def __init__(
+            self,
+            data: Iterable[Batch],
+            name: Optional[Name] = None,
+            caption: str = EMPTY,
+            struct: Struct = None,
+            batch_size: int = DEFAULT_BATCH_SIZE,
+            source: Source = None,
+            context: Context = None,
+            count: Count = None,
+            less_than: Count = None,
+            max_items_in_memory: Count = None,
+            tmp_files: TmpFiles = None,
+            check: bool = False,
+    ):
+        if struct and not isinstance(struct, (FlatStruct, StructInterface)):
+            struct = FlatStruct(struct)
+        self._struct = struct
+        self._batch_size = batch_size
+        super().__init__(
+            data=data, check=check,
+            name=name, caption=caption,
+            source=source, context=context,
+            count=count, less_than=less_than,
+            max_items_in_memory=max_items_in_memory,
+            tmp_files=tmp_files,
+        )
+
+    @classmethod
+    def from_rows(
+            cls,
+            rows: Iterable,
+            columns: Columns,
+            batch_size: int = DEFAULT_BATCH_SIZE,
+            as_arrays: bool = True,
+            **kwargs
+    ) -> Native:
+        columns = get_names(columns)
+        batches = bt.get_batches_from_rows(rows, columns, batch_size=batch_size, as_arrays=as_arrays)
+        kwargs.setdefault('struct', columns)
+        return cls(batches, batch_size=batch_size, **kwargs)
+
+    @classmethod
+    def from_records(
+            cls,
+            records: Iterable,
+            columns: Columns,
+            batch_size: int = DEFAULT_BATCH_SIZE,
+            as_arrays: bool = True,
+            **kwargs
+    ) -> Native:
+        columns = get_names(columns)
+        batches = bt.get_batches_from_records(records, columns, batch_size=batch_size, as_arrays=as_arrays)
+        kwargs.setdefault('struct', columns)
+        return cls(batches, batch_size=batch_size, **kwargs)
+
+    def get_struct(self) -> Struct:
+        return self._struct
+
+    def get_batch_size(self) -> int:
+        return self._batch_size
+
+    def get_columns(self) -> list:
+        struct = self.get_struct()
+        if struct:
+            return list(struct.get_columns())
+        batch = self.get_one_item()
+        return list(batch) if batch else list()
+
+    def get_batches(self) -> Iterable:
+        return self.get_items()
+
+    def get_row_count(self) -> int:
+        return sum(map(bt.get_batch_len, self.get_batches()))
+
+    def _get_batch_stream(self, batches: Iterable, columns: Optional[list] = None) -> Native:
+        if columns is None:
+            struct = self.get_struct()
+        elif columns == self.get_columns():
+            struct = self.get_struct()
+        else:
+            struct = FlatStruct(columns)
+        stream = self.stream(batches, struct=struct, count=None, less_than=None)
+        if self.is_in_memory():
+            stream = stream.to_memory()
+        return self._assume_native(stream)
+
+    def select(self, *columns, **renames) -> Native:
+        """Selects columns without copying values, renames is target=source_column."""
+        columns = get_names(columns)
+        renames = {target: get_name(source) for target, source in renames.items()}
+        batches = self._get_mapped_items(lambda b: bt.select_columns(b, columns, renames))
+        return self._get_batch_stream(batches, columns=columns + list(renames))
+
+    def filter(self, **conditions) -> Native:
+        """Keeps rows where every column matches condition: expected value or function of value."""
+        batches = self._get_mapped_items(lambda b: bt.get_filtered_batch(b, **conditions))
+        return self._get_batch_stream(batches)
+
+    def map_column(self, column: Union[Name, Callable], function: Callable, target: Optional[Name] = None) -> Native:
+        """Applies function to every value of column, known functions (abs, round, math.sqrt...) and NumPy ufuncs
+        are applied to whole NumPy array at once.
+        """
+        column = get_name(column)
+        target = get_name(target) if target else column
+        batches = self._get_mapped_items(lambda b: bt.map_column(b, column, function, target=target))
+        columns = self.get_columns()
+        if target not in columns:
+            columns = columns + [target]
+        return self._get_batch_stream(batches, columns=columns)
+
+    def aggregate(self, column: Name, function: str = 'sum'):
+        return bt.aggregate_batches(self.get_batches(), get_name(column), function)
+
+    def get_aggregates(self, **aggregates) -> dict:
+        """Calculates several aggregates, i.e. total=('sum', 'price'), iterable batches are collected once."""
+        if not self.is_in_memory():
+            self.to_memory()
+        return {k: self.aggregate(c, f) for k, (f, c) in aggregates.items()}
+
+    def get_rows(self, columns: Columns = None) -> Generator:
+        columns = get_names(columns) if columns else self.get_columns()
+        for batch in self.get_batches():
+            yield from bt.get_rows_from_batch(batch, columns)
+
+    def get_records(self, columns: Columns = None) -> Generator:
+        columns = get_names(columns) if columns else self.get_columns()
+        for batch in self.get_batches():
+            yield from bt.get_records_from_batch(batch, columns)
+
+    def _get_regular_stream(self, items: Iterable, item_type: ItemType, columns: Columns = None):
+        stream = StreamBuilder.stream(
+            items, item_type=item_type, struct=columns or self.get_struct(),
+            name=self.get_name(), source=self.get_source(), context=self.get_context(),
+        )
+        if self.is_in_memory():
+            stream = stream.collect()
+        return stream
+
+    def to_records(self, columns: Columns = None):
+        return self._get_regular_stream(self.get_records(columns), item_type=ItemType.Record, columns=columns)
+
+    def to_rows(self, columns: Columns = None):
+        return self._get_regular_stream(self.get_rows(columns), item_type=ItemType.Row, columns=columns)
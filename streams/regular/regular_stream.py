@@ -13,6 +13,7 @@ try:  # Assume we're a submodule in a package.
     from base.functions.arguments import get_name, get_names, get_str_from_args_kwargs
     from base.functions.errors import get_type_err_msg
     from utils.decorators import deprecated_with_alternative
+    from loggers.profiler import profiled, get_stage
     from functions.primary.items import set_to_item, merge_two_items, unfold_structs_to_fields
     from functions.secondary import all_secondary_functions as fs
     from content.items.item_getters import get_filter_function
@@ -20,9 +21,10 @@ try:  # Assume we're a submodule in a package.
     from content.struct.struct_mixin import StructMixin
     from content.struct.flat_struct import FlatStruct
     from streams.abstract.local_stream import LocalStream
+    from streams.regular.batch_stream import BatchStream, DEFAULT_BATCH_SIZE
     from streams.interfaces.abstract_stream_interface import DEFAULT_EXAMPLE_COUNT
     from streams.interfaces.regular_stream_interface import RegularStreamInterface, DEFAULT_ANALYZE_COUNT
-    from streams.mixin.convert_mixin import ConvertMixin
+    from streams.mixin.convert_mixin import ConvertMixin, DEFAULT_COL_MASK
     from streams.stream_builder import StreamBuilder
 except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
     from ...interfaces import (
@@ -36,6 +38,7 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
     from ...base.functions.arguments import get_name, get_names, get_str_from_args_kwargs
     from ...base.functions.errors import get_type_err_msg
     from ...utils.decorators import deprecated_with_alternative
+    from ...loggers.profiler import profiled, get_stage
     from ...functions.primary.items import set_to_item, merge_two_items, unfold_structs_to_fields
     from ...functions.secondary import all_secondary_functions as fs
     from ...content.items.item_getters import get_filter_function
@@ -43,9 +46,10 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
     from ...content.struct.struct_mixin import StructMixin
     from ...content.struct.flat_struct import FlatStruct
     from ..abstract.local_stream import LocalStream
+    from .batch_stream import BatchStream, DEFAULT_BATCH_SIZE
     from ..interfaces.abstract_stream_interface import DEFAULT_EXAMPLE_COUNT
     from ..interfaces.regular_stream_interface import RegularStreamInterface, DEFAULT_ANALYZE_COUNT
-    from ..mixin.convert_mixin import ConvertMixin
+    from ..mixin.convert_mixin import ConvertMixin, DEFAULT_COL_MASK
     from ..stream_builder import StreamBuilder
 
 Native = Union[LocalStream, RegularStreamInterface]
@@ -349,6 +353,7 @@ class RegularStream(LocalStream, ConvertMixin, StructMixin, RegularStreamInterfa
             stream.set_struct(struct, check=False, inplace=True)
         return stream
 
+    @profiled('filter')
     def filter(self, *fields, skip_errors: bool = True, inplace: bool = False, **expressions) -> Native:
         item_type = self.get_item_type()
         filter_function = get_filter_function(*fields, **expressions, item_type=item_type, skip_errors=skip_errors)
@@ -358,6 +363,7 @@ class RegularStream(LocalStream, ConvertMixin, StructMixin, RegularStreamInterfa
             stream.set_struct(struct, check=False, inplace=True)
         return self._assume_native(stream)
 
+    @profiled('select')
     def select(self, *columns, use_extended_method: Optional[bool] = None, **expressions) -> Native:
         if use_extended_method is None:
             use_extended_method = self.get_item_type() == ItemType.Row
@@ -373,6 +379,7 @@ class RegularStream(LocalStream, ConvertMixin, StructMixin, RegularStreamInterfa
         stream = self.map_to_type(function=select_function, item_type=target_item_type, struct=target_struct)
         return self._assume_native(stream)
 
+    @profiled('flat_map')
     def flat_map(self, function: Callable, to: ItemType = ItemType.Auto) -> Stream:
         items = self._get_mapped_items(function=function, flat=True)
         return self.stream(items, item_type=to, save_count=False)
@@ -430,6 +437,31 @@ class RegularStream(LocalStream, ConvertMixin, StructMixin, RegularStreamInterfa
         item_type = self.get_item_type()
         return item_type.get_key_function(*functions, struct=self.get_struct(), take_hash=take_hash)
 
+    def _get_batch_columns(self) -> list:
+        struct = self.get_struct()
+        if struct:
+            return list(struct.get_columns())
+        elif self.is_in_memory():
+            return self.get_columns()
+        example = self.get_one_item()  # via tee, so iterable items are not lost
+        if not example:
+            return list()
+        elif self.get_item_type() == ItemType.Record:
+            return list(example)
+        else:
+            return [DEFAULT_COL_MASK.format(n=n + 1) for n in range(len(example))]
+
+    def to_batches(self, batch_size: int = DEFAULT_BATCH_SIZE, as_arrays: bool = True) -> BatchStream:
+        columns = self._get_batch_columns()
+        meta = dict(struct=self.get_struct() or columns, name=self.get_name(), context=self.get_context())
+        if self.get_item_type() == ItemType.Row:
+            stream = BatchStream.from_rows(self.get_items(), columns, batch_size, as_arrays=as_arrays, **meta)
+        else:
+            stream = BatchStream.from_records(self.get_records(), columns, batch_size, as_arrays=as_arrays, **meta)
+        if self.is_in_memory():
+            stream = stream.to_memory()
+        return stream
+
     def get_one_column_values(self, column: Field, as_list: bool = False) -> Iterable:
         column_getter = self.get_item_type().get_key_function(column, struct=self.get_struct(), take_hash=False)
         values = map(column_getter, self.get_items())
@@ -438,6 +470,7 @@ class RegularStream(LocalStream, ConvertMixin, StructMixin, RegularStreamInterfa
         else:
             return values
 
+    @profiled('sort')
     def sort(self, *keys, reverse: bool = False, step: Count = None, verbose: bool = True) -> Native:
         if step is None:
             step = self.get_limit_items_in_memory()
@@ -452,6 +485,7 @@ class RegularStream(LocalStream, ConvertMixin, StructMixin, RegularStreamInterfa
         self._assume_native(stream).set_struct(self.get_struct(), check=False, inplace=True)
         return self._assume_native(stream)
 
+    @profiled('join')
     def join(
             self,
             right: Native,
@@ -587,11 +621,16 @@ class RegularStream(LocalStream, ConvertMixin, StructMixin, RegularStreamInterfa
             skip_missing: bool = False,
             verbose: bool = True,
     ) -> Stream:
+        """Groups items by keys after sorting them.
+        Items not fitting into memory budget are sorted by parts of step items spilled to disk, then merged.
+        """
         keys = unfold_structs_to_fields(keys)
         if as_pairs:
             key_for_sort = keys
         else:
             key_for_sort = self._get_key_function(keys, take_hash=take_hash)
+        if step is None:
+            step = self.get_limit_items_in_memory()  # by available memory budget and estimated item size
         return self.sort(
             key_for_sort,
             step=step,
@@ -656,6 +695,14 @@ class RegularStream(LocalStream, ConvertMixin, StructMixin, RegularStreamInterfa
         else:
             return super(RegularStream, self).get_dict(key=key_func, value=value_func)
 
+    def get_profile(self) -> Stream:
+        profiler = self.get_profiler()
+        if profiler:
+            records = profiler.get_records(get_stage(self.get_stream_data()))
+        else:
+            records = list()
+        return StreamBuilder.stream(records, item_type=ItemType.Record)
+
     def get_validation_message(self, skip_disconnected: bool = True) -> str:
         validation_errors = self._get_validation_errors()
         if validation_errors:
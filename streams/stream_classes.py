@@ -19,6 +19,7 @@ try:  # Assume we're a submodule in a package.
     from streams.mixin.columnar_mixin import ColumnarMixin
     from streams.mixin.convert_mixin import ConvertMixin
     from streams.regular.regular_stream import RegularStream
+    from streams.regular.batch_stream import BatchStream
     from streams.wrappers.pandas_stream import PandasStream
     from streams.wrappers.sql_stream import SqlStream
     from streams.stream_builder import StreamBuilder
@@ -40,6 +41,7 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
     from .mixin.columnar_mixin import ColumnarMixin
     from .mixin.convert_mixin import ConvertMixin
     from .regular.regular_stream import RegularStream
+    from .regular.batch_stream import BatchStream
     from .wrappers.pandas_stream import PandasStream
     from .wrappers.sql_stream import SqlStream
     from .stream_builder import StreamBuilder
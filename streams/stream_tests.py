@@ -1,9 +1,18 @@
+from typing import Callable
+import math
+
 try:  # Assume we're a submodule in a package.
     from functions.secondary import all_secondary_functions as fs
     from streams import stream_classes as sm
+    from content.format.text_format import JsonFormat
+    from utils import json_codecs as jc
+    from loggers import profiler as pf
 except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
     from ..functions.secondary import all_secondary_functions as fs
     from . import stream_classes as sm
+    from ..content.format.text_format import JsonFormat
+    from ..utils import json_codecs as jc
+    from ..loggers import profiler as pf
 
 
 EXAMPLE_FILENAME = 'test_file.tmp'
@@ -138,6 +147,44 @@ def test_map_filter_take():
     assert received == expected, f'{received} vs {expected}'
 
 
+class UnprofiledStream(sm.RegularStream):
+    def get_profiler(self):
+        raise AssertionError('operators must not look for profiler while profiling is disabled')
+
+
+def test_profile():
+    stream = sm.RegularStream(
+        EXAMPLE_INT_SEQUENCE,  # in-memory source, so sort() stays in memory
+    ).profile(
+        trace_memory=True,
+    ).map(
+        lambda i: -i,
+    ).filter(
+        lambda i: i % 2,
+    ).sort()
+    received = stream.get_list()
+    expected = [-9, -7, -5, -3, -1]
+    assert received == expected, f'{received} vs {expected}'
+    profile = stream.get_profile().get_list()
+    received = [(r['operator'], r['items_in'], r['items_out']) for r in profile]
+    expected = [('source', None, 9), ('map', 9, 9), ('filter', 9, 5), ('sort', 5, 5)]
+    assert received == expected, f'{received} vs {expected}'
+    assert all(r['time_sec'] >= r['self_time_sec'] >= 0 for r in profile)
+    assert all(r['peak_memory_kb'] is not None for r in profile)
+    profiler = stream.get_profiler()
+    for _ in range(pf.MAX_STAGES_COUNT):
+        profiler.add_stage('test')
+    stages = profiler.get_stages()
+    assert len(stages) == pf.MAX_STAGES_COUNT, 'stages of profiler must be bounded'
+    assert stages[-1].get_number() == pf.MAX_STAGES_COUNT + len(profile) - 1
+    profiler.disable().reset()
+    received = UnprofiledStream(EXAMPLE_INT_SEQUENCE).map(lambda i: -i).get_list()
+    assert received == [-i for i in EXAMPLE_INT_SEQUENCE]
+    not_profiled = sm.RegularStream(EXAMPLE_INT_SEQUENCE).map(lambda i: -i)
+    assert not_profiled.get_profiler() is None
+    assert not_profiled.get_profile().get_list() == []
+
+
 def test_any_select():
     example = ['12', '123', '1234']
     expected_1 = [
@@ -361,7 +408,12 @@ def test_disk_sort_by_key():
         fs.first(),  # KEY
         step=5,
     ).get_list()
-    assert received == expected, f'{received} vs {expected}'
+    assert received == expected, f'test case 0: {received} vs {expected}'
+    records = [dict(k=k, v=float('nan') if k % 3 == 0 else float(k)) for k in range(30)]
+    received = sm.RegularStream(records, item_type=sm.ItemType.Record).disk_sort('k', step=5).get_list()
+    assert [r['k'] for r in received] == list(range(30)), 'test case 1'
+    nan_count = len([r for r in received if isinstance(r['v'], float) and math.isnan(r['v'])])
+    assert nan_count == 10, f'test case 2: NaN must be kept in spill files, got {nan_count} NaN values'
 
 
 def test_sort():
@@ -396,6 +448,195 @@ def test_sort():
     assert received_2 == expected_2, f'test case 2: {received_2} vs {expected_2}'
 
 
+def test_memory_budget():
+    records = [dict(key=k, value=str(k) * k) for k in range(1, 10)]
+    stream = sm.RegularStream(iter(records), item_type=sm.ItemType.Record)
+    item_size = stream.get_item_size()
+    assert item_size > 0, f'{item_size}'
+    budget = stream.get_memory_budget()
+    initial_total = budget.get_total_bytes()
+    try:
+        budget.set_total_bytes(item_size * 5000)
+        received_0 = stream.get_limit_items_in_memory()
+        assert 4000 < received_0 <= 5000, f'test case 0: {received_0}'
+        with budget.reserved(item_size * 2000) as reserved:
+            assert reserved == item_size * 2000, f'test case 1: {reserved}'
+            received_2 = stream.get_limit_items_in_memory()
+            assert received_2 < received_0, f'test case 2: {received_2} vs {received_0}'
+        received_3 = stream.get_limit_items_in_memory()
+        assert received_3 == received_0, f'test case 3: {received_3} vs {received_0}'
+    finally:
+        budget.set_total_bytes(initial_total)
+    received_4 = stream.get_list()
+    assert received_4 == records, f'test case 4: {received_4} vs {records}'
+    stream = sm.RegularStream(iter(records), item_type=sm.ItemType.Record)
+    assert stream.get_item_size() == item_size
+    data = stream.get_data()
+    assert stream.get_item_size() == item_size and stream.get_data() is data, 'test case 5: item size must be cached'
+    assert 'item_size' not in stream.get_meta(), 'test case 6: cached item size is not a meta field'
+    profiled = sm.RegularStream(iter(records), item_type=sm.ItemType.Record).profile()
+    assert profiled.get_item_size() == item_size
+    assert profiled.get_list() == records, 'test case 7'
+    received_8 = [(r['operator'], r['items_out']) for r in profiled.get_profile().get_list()]
+    assert received_8 == [('source', 9)], f'test case 8: sampling must keep profiled stage, got {received_8}'
+    profiled.get_profiler().disable().reset()
+    records = [dict(key=k % 7, value=k) for k in range(2500)]
+    stream = sm.RegularStream(iter(records), item_type=sm.ItemType.Record, count=len(records))
+    try:
+        budget.set_total_bytes(1)
+        assert not stream.can_be_in_memory(), 'test case 9: group_by() must spill parts to disk'
+        received_9 = stream.group_by('key', values=['value']).get_list()
+    finally:
+        budget.set_total_bytes(initial_total)
+    expected_9 = [dict(key=k, value=[r['value'] for r in records if r['key'] == k]) for k in range(7)]
+    received_9 = [dict(key=r['key'], value=sorted(r['value'])) for r in received_9]
+    assert received_9 == expected_9, 'test case 9'
+
+
+def test_batches():
+    records = [dict(key=k % 3, value=float(k), name=str(k)) for k in range(10)]
+    stream = sm.RegularStream(records, item_type=sm.ItemType.Record, struct=['key', 'value', 'name']).to_batches(4)
+    received_0 = [len(b['key']) for b in stream.get_batches()]
+    expected_0 = [4, 4, 2]
+    assert received_0 == expected_0, f'test case 0: {received_0} vs {expected_0}'
+    expected_1 = [dict(key=1, value=-1.0, source=1.0), dict(key=1, value=-4.0, source=4.0)]
+    received_1 = stream.filter(
+        key=1,
+        value=lambda v: v < 7,
+    ).map_column(
+        'value', lambda v: -v, target='negative',
+    ).select(
+        'key', value='negative', source='value',
+    ).to_records().get_list()
+    assert received_1 == expected_1, f'test case 1: {received_1} vs {expected_1}'
+    expected_2 = dict(total=45.0, count=10, max_key=2)
+    received_2 = stream.get_aggregates(total=('sum', 'value'), count=('count', 'name'), max_key=('max', 'key'))
+    assert received_2 == expected_2, f'test case 2: {received_2} vs {expected_2}'
+    received_3 = sm.RegularStream(iter(records), item_type=sm.ItemType.Record).to_batches(3).to_records().get_list()
+    assert received_3 == records, f'test case 3: {received_3} vs {records}'
+    records = [dict(mixed=1, large=2 ** 60 + 1, huge=2 ** 70), dict(mixed=2.5, large=3, huge=1)]
+    received_4 = sm.RegularStream(records, item_type=sm.ItemType.Record).to_batches(2).to_records().get_list()
+    received_4 = [{k: (v, type(v)) for k, v in r.items()} for r in received_4]
+    expected_4 = [{k: (v, type(v)) for k, v in r.items()} for r in records]
+    assert received_4 == expected_4, f'test case 4: {received_4} vs {expected_4}'
+
+
+def _get_result_or_error(function: Callable, *args):
+    try:
+        return [(v if v == v else 'NaN', isinstance(v, int)) for v in function(*args)]
+    except (ValueError, OverflowError) as e:
+        return e.__class__.__name__
+
+
+def test_vectorized_functions():
+    functions = abs, float, int, round, math.floor, math.ceil, math.sqrt, math.log, math.exp
+    examples = [[1.5, 2.5, -3.5, 4.0], [0.0, 1.0, 4.0], [-1.0, 4.0], [1.0, float('nan')], [1, 4, 9], [-2, 3]]
+    for function in functions:
+        for values in examples:
+            records = [dict(v=v) for v in values]
+            expected = _get_result_or_error(lambda: [function(v) for v in values])
+            batch_stream = sm.BatchStream.from_records(records, ['v'])
+            received = _get_result_or_error(lambda: [i for i, in batch_stream.map_column('v', function).get_rows()])
+            assert received == expected, f'test case batch {function}({values}): {received} vs {expected}'
+            pandas_stream = sm.PandasStream(records)
+            received = _get_result_or_error(lambda: [i for i, in pandas_stream.select(v=('v', function)).get_rows()])
+            assert received == expected, f'test case pandas {function}({values}): {received} vs {expected}'
+
+
+def test_get_dataframe():
+    records = [dict(id=k, score=k / 2 if k != 3 else None, name=str(k)) for k in range(7)]
+    stream = sm.RegularStream(records, item_type=sm.ItemType.Record, struct=['id', 'score', 'name'])
+    dataframe = stream.get_dataframe(chunk_size=3)
+    expected_0 = ['int64', 'float64']
+    received_0 = [str(dataframe[c].dtype) for c in ('id', 'score')]
+    assert received_0 == expected_0, f'test case 0: {received_0} vs {expected_0}'
+    expected_1 = [0.0, 0.5, 1.0, None, 2.0, 2.5, 3.0]
+    received_1 = [None if v != v else v for v in dataframe['score'].tolist()]
+    assert received_1 == expected_1, f'test case 1: {received_1} vs {expected_1}'
+    expected_2 = [4, 3]
+    received_2 = [len(df) for df in sm.RegularStream(iter(records), item_type=sm.ItemType.Record).iter_dataframes(4)]
+    assert received_2 == expected_2, f'test case 2: {received_2} vs {expected_2}'
+    records = [dict(a=1), dict(a=2, b='x')]
+    received_3 = list(sm.RegularStream(iter(records), item_type=sm.ItemType.Record).get_dataframe().columns)
+    assert received_3 == ['a', 'b'], f'test case 3: keys of all records expected, got {received_3}'
+
+
+def test_class_meta():
+    stream = sm.RegularStream(EXAMPLE_INT_SEQUENCE, item_type=sm.ItemType.Any, caption='example')
+    class_meta = stream._get_class_meta()
+    assert stream._get_class_meta() is class_meta, 'test case 0: class meta must be calculated once'
+    assert class_meta.get_init_args()[:3] == ('self', 'data', 'name'), 'test case 1'
+    assert stream._get_init_defaults()['caption'] == '', 'test case 2'
+
+    class ChildStream(sm.RegularStream):
+        def __init__(self, data, name=None, caption='child', item_type=sm.ItemType.Any, extra=None):
+            self._extra = extra
+            super().__init__(data, name=name, caption=caption, item_type=item_type)
+
+    assert ChildStream._get_class_meta() is not class_meta, 'test case 3: subclass must have its own class meta'
+    assert 'extra' in ChildStream._get_init_args() and 'extra' not in stream._get_init_args(), 'test case 4'
+    child = ChildStream(EXAMPLE_INT_SEQUENCE, extra=1)
+    new = child.make_new(EXAMPLE_INT_SEQUENCE[:2])
+    assert new.get_meta()['extra'] == 1 and new.get_caption() == 'child', 'test case 5'
+    assert 'count' not in new.get_static_meta(), 'test case 6'
+
+
+def test_json_codecs():
+    lines = ['{"a": 1, "b": [1, 2]}', '[3, 4]', '"text"', '{"a": null}']
+    expected = [dict(a=1, b=[1, 2]), [3, 4], 'text', dict(a=None)]
+    broken_lines = lines[:2] + ['{broken'] + lines[2:]
+    for name in jc.get_json_codec_names() + [jc.FASTEST_CODEC]:
+        codec = jc.get_json_codec(name)
+        received = codec.loads_batch(lines)
+        assert received == expected, f'test case {name} batch: {received} vs {expected}'
+        received = [codec.loads(i) for i in lines]
+        assert received == expected, f'test case {name} lines: {received} vs {expected}'
+        received = codec.loads_batch(broken_lines, skip_errors=True)
+        expected_skipped = expected[:2] + [None] + expected[2:]
+        assert received == expected_skipped, f'test case {name} skip: {received} vs {expected_skipped}'
+        received = codec.loads_batch(broken_lines, default=dict(_err='JSONDecodeError'))
+        assert received[2] == dict(_err='JSONDecodeError'), f'test case {name} default: {received}'
+        try:
+            codec.loads_batch(broken_lines)
+            raise AssertionError(f'test case {name}: JSONDecodeError expected')
+        except jc.json.JSONDecodeError:
+            pass
+        split_lines = ['[1', '2]', '3,4']
+        received = codec.loads_batch(split_lines, skip_errors=True)
+        assert received == [None, None, None], f'test case {name} split document: {received}'
+        received = codec.loads(codec.dumps(expected[0]))
+        assert received == expected[0], f'test case {name} dumps: {received} vs {expected[0]}'
+        received = [fs.json_loads(codec=name)(fs.json_dumps(codec=name)(i)) for i in expected]
+        assert received == expected, f'test case {name} functions: {received} vs {expected}'
+    default_codec = jc.get_default_json_codec()
+    try:
+        jc.set_default_json_codec(jc.FASTEST_CODEC)
+        json_format = JsonFormat()
+        received = list(json_format.get_items_from_lines(lines, item_type=sm.ItemType.Record, batch_size=3))
+        expected_records = [expected[0], dict(item=[3, 4]), 'text', expected[3]]
+        assert received == expected_records, f'test case format: {received} vs {expected_records}'
+    finally:
+        jc.set_default_json_codec(default_codec)
+
+
+def test_pandas_stream():
+    records = [dict(a=1, b=-2.0, c='x'), dict(a=3, b=4.0, c='y'), dict(a=5, b=-9.0, c='z')]
+    stream = sm.PandasStream(records)
+    received_0 = list(stream.get_items())
+    assert received_0 == records, f'test case 0: {received_0} vs {records}'
+    expected_1 = [dict(a=1, d=2.0, e=2, f=-1.0), dict(a=5, d=9.0, e=10, f=-4.0)]
+    received_1 = stream.filter(
+        b=lambda v: v < 0,
+    ).select(
+        'a', d=('b', abs), e='a * 2', f=('a', 'b', lambda x, y: x + y),
+    ).get_records()
+    received_1 = list(received_1)
+    assert received_1 == expected_1, f'test case 1: {received_1} vs {expected_1}'
+    expected_2 = [['y'], ['z']]
+    received_2 = list(stream.filter('a > 1').get_rows(['c']))
+    assert received_2 == expected_2, f'test case 2: {received_2} vs {expected_2}'
+
+
 def test_sorted_group_by_key():
     example = [
         (1, 11), (1, 12),
@@ -663,6 +904,7 @@ def main():
     test_take()
     test_skip()
     test_map_filter_take()
+    test_profile()
     test_any_select()
     test_records_select()
     test_enumerated()
@@ -675,6 +917,13 @@ def main():
     test_memory_sort()
     test_disk_sort_by_key()
     test_sort()
+    test_memory_budget()
+    test_batches()
+    test_vectorized_functions()
+    test_get_dataframe()
+    test_class_meta()
+    test_json_codecs()
+    test_pandas_stream()
     test_sorted_group_by_key()
     test_group_by()
     test_any_join()
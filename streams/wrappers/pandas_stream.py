@@ -1,21 +1,30 @@
-from typing import Optional, Iterable, Union
+from typing import Optional, Callable, Iterable, Generator, Union
 
 try:  # Assume we're a submodule in a package.
-    from base.functions.arguments import get_name
-    from interfaces import StreamInterface, ColumnarInterface, Field, Columns
-    from utils.external import pd, DataFrame
+    from base.constants.chars import ALL
+    from base.functions.arguments import get_name, get_names
+    from interfaces import StreamInterface, ColumnarInterface, ItemType, Field, Columns
+    from utils.external import np, pd, DataFrame, LazyAttribute
+    from functions.primary.batches import get_vectorized_column
+    from content.selection.selection_functions import process_description, topologically_sorted
+    from streams.stream_builder import StreamBuilder
     from streams.abstract.wrapper_stream import WrapperStream
     from streams.mixin.columnar_mixin import ColumnarMixin
     from streams.mixin.convert_mixin import ConvertMixin
 except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
-    from ...base.functions.arguments import get_name
-    from ...interfaces import StreamInterface, ColumnarInterface, Field, Columns
-    from ...utils.external import pd, DataFrame
+    from ...base.constants.chars import ALL
+    from ...base.functions.arguments import get_name, get_names
+    from ...interfaces import StreamInterface, ColumnarInterface, ItemType, Field, Columns
+    from ...utils.external import np, pd, DataFrame, LazyAttribute
+    from ...functions.primary.batches import get_vectorized_column
+    from ...content.selection.selection_functions import process_description, topologically_sorted
+    from ..stream_builder import StreamBuilder
     from ..abstract.wrapper_stream import WrapperStream
     from ..mixin.columnar_mixin import ColumnarMixin
     from ..mixin.convert_mixin import ConvertMixin
 
 Native = Union[StreamInterface, ColumnarInterface]
+Series = LazyAttribute(pd, 'Series', default=list)
 
 
 class PandasStream(WrapperStream, ColumnarMixin, ConvertMixin):
@@ -44,12 +53,12 @@ class PandasStream(WrapperStream, ColumnarMixin, ConvertMixin):
         return super().get_data()
 
     @staticmethod
-    def get_item_type():
-        return pd.Series
+    def get_item_type() -> ItemType:
+        return ItemType.Record
 
     @classmethod
     def _is_valid_item(cls, item) -> bool:
-        return isinstance(item, pd.Series)
+        return isinstance(item, dict)
 
     def is_in_memory(self) -> bool:
         return True
@@ -58,7 +67,7 @@ class PandasStream(WrapperStream, ColumnarMixin, ConvertMixin):
         data = self.get_data()
         assert isinstance(data, DataFrame)
         if columns:
-            data = data[columns]
+            data = data[get_names(columns)]
         return data
 
     def get_count(self, final: bool = False) -> Optional[int]:
@@ -67,23 +76,41 @@ class PandasStream(WrapperStream, ColumnarMixin, ConvertMixin):
         return data.shape[0]
 
     def get_items(self) -> Iterable:
-        yield from self.get_dataframe().iterrows()
+        return self.get_records()
 
-    def _select_columns(self, columns: Columns) -> Native:
-        if columns:
-            return self.select(*columns)
-        else:
-            return self
+    def get_records(self, columns: Columns = None) -> Generator:
+        dataframe = self.get_dataframe(columns)
+        names = list(dataframe.columns)
+        for values in dataframe.itertuples(index=False, name=None):  # plain tuples, without Series per row
+            yield dict(zip(names, values))
 
-    def get_records(self, columns: Columns = None) -> Iterable:
-        stream = self._select_columns(columns)
-        assert isinstance(stream, PandasStream)
-        return stream._get_mapped_items(lambda i: i[1].to_dict())
+    def get_rows(self, columns: Columns = None) -> Generator:
+        for values in self.get_dataframe(columns).itertuples(index=False, name=None):
+            yield list(values)
+
+    def stream(self, data, ex: Optional[Iterable] = None, **kwargs) -> Native:
+        if isinstance(data, DataFrame):  # results of vectorized operations stay in pandas
+            meta = dict(name=self.get_name(), source=self.get_source())
+            meta.update(kwargs)
+            return self.__class__(data, context=self.get_context(), **meta)
+        else:
+            return super().stream(data, ex=ex, **kwargs)
 
-    def get_rows(self, columns: Columns = None):
-        stream = self._select_columns(columns)
-        assert isinstance(stream, PandasStream)
-        return stream._get_mapped_items(lambda i: i[1].to_list())
+    def to_stream(self, item_type: ItemType = ItemType.Record, **kwargs) -> StreamInterface:
+        if item_type in (ItemType.Auto, None):
+            item_type = ItemType.Record
+        if item_type == ItemType.Record:
+            items = self.get_records()
+        elif item_type == ItemType.Row:
+            items = self.get_rows()
+        else:
+            raise ValueError(f'PandasStream.to_stream(): expected Record or Row item type, got {item_type}')
+        stream = StreamBuilder.stream(
+            list(items), item_type=item_type,
+            name=self.get_name(), source=self.get_source(), context=self.get_context(),
+            **kwargs
+        )
+        return stream
 
     def get_columns(self) -> Iterable:
         return self.get_dataframe().columns
@@ -141,21 +168,88 @@ class PandasStream(WrapperStream, ColumnarMixin, ConvertMixin):
         else:
             raise TypeError(f'data must be DataFrame, Stream or Iterable, got {data}')
 
+    def _get_column_or_expression(self, description: str, computed: Optional[dict] = None) -> Series:
+        if computed and description in computed:
+            return computed[description]
+        dataframe = self.get_dataframe()
+        if description in dataframe.columns:
+            return dataframe[description]
+        else:  # i.e. 'price * count' or 'price > 0'
+            if computed:
+                dataframe = dataframe.assign(**computed)
+            return dataframe.eval(description)
+
+    def _get_series(self, description, computed: Optional[dict] = None) -> Series:
+        """Translates field description (name, expression string or tuple of fields and function)
+        into pandas Series, known functions (abs, round, math.sqrt, NumPy ufuncs...) are applied to whole columns.
+        """
+        if isinstance(description, str):
+            return self._get_column_or_expression(description, computed=computed)
+        dataframe = self.get_dataframe()
+        if isinstance(description, Callable):  # function of record
+            values = [description(r) for r in self.get_records()]
+            return pd.Series(values, index=dataframe.index)
+        function, inputs = process_description(description)
+        columns = [self._get_column_or_expression(c, computed=computed) for c in inputs]
+        if isinstance(description, (list, tuple)):
+            has_function = isinstance(description[0], Callable) or isinstance(description[-1], Callable)
+        else:  # field object
+            has_function = False
+        if not has_function and len(columns) == 1:
+            return columns[0]
+        if len(columns) == 1:
+            return self._apply_to_column(function, columns[0])
+        values = [function(*v) for v in zip(*[c.tolist() for c in columns])]  # loop by values, without rows
+        return pd.Series(values, index=dataframe.index)
+
+    @staticmethod
+    def _apply_to_column(function: Callable, column: Series) -> Series:
+        if np:
+            mapped = get_vectorized_column(column.to_numpy(), function)
+            if mapped is not None:
+                return pd.Series(mapped, index=column.index, name=column.name)
+        return column.map(function)  # loop by values, without Series per row
+
     def select(self, *fields, **expressions) -> Native:
-        assert not expressions, 'custom expressions are not implemented yet'
-        dataframe = self.get_dataframe(columns=fields)
-        return self.stream(dataframe)
+        dataframe = self.get_dataframe()
+        columns = list()
+        computed = dict()
+        for f in fields:
+            if f == ALL:
+                columns += [c for c in dataframe.columns if c not in columns]
+            elif isinstance(f, str) and f in dataframe.columns:
+                columns.append(f)
+            elif hasattr(f, 'get_name') and f.get_name() in dataframe.columns:
+                columns.append(f.get_name())
+            else:
+                raise ValueError(f'PandasStream.select(): expected column name or *, got {f}')
+        for target, description in topologically_sorted(expressions):
+            computed[target] = self._get_series(description, computed=computed)
+        selected = dataframe[[c for c in columns if c not in computed]].assign(**computed)
+        output_columns = columns + [c for c in expressions if c not in columns]
+        return self.stream(selected[output_columns])
 
-    def filter(self, *filters, **expressions) -> Native:
-        assert not filters, 'custom filters are not implemented yet'
-        pandas_filter = None
-        for k, v in expressions.items():
-            one_filter = self.get_one_column_values(k) == v
-            if pandas_filter:
-                pandas_filter = pandas_filter & one_filter
+    def _get_mask(self, *filters, **expressions) -> Optional[Series]:
+        masks = list()
+        for f in filters:
+            masks.append(self._get_series(f))
+        for column, condition in expressions.items():
+            values = self._get_column_or_expression(column)
+            if isinstance(condition, Callable):
+                masks.append(self._apply_to_column(condition, values))
+            elif isinstance(condition, (list, tuple)):
+                masks.append(self._get_series([column, *condition]))
             else:
-                pandas_filter = one_filter
-        if pandas_filter:
+                masks.append(values == condition)
+        pandas_filter = None
+        for mask in masks:
+            mask = mask.astype(bool)
+            pandas_filter = mask if pandas_filter is None else pandas_filter & mask
+        return pandas_filter
+
+    def filter(self, *filters, **expressions) -> Native:
+        pandas_filter = self._get_mask(*filters, **expressions)
+        if pandas_filter is not None:
             data = self.get_data()[pandas_filter]
             return self.stream(data)
         else:
@@ -163,7 +257,7 @@ class PandasStream(WrapperStream, ColumnarMixin, ConvertMixin):
 
     def sort(self, *keys, reverse: bool = False) -> Native:
         dataframe = self.get_dataframe().sort_values(
-            by=keys,
+            by=get_names(keys),
             ascending=not reverse,
         )
         return self.stream(dataframe)
@@ -1,11 +1,17 @@
 from enum import Enum
 from typing import Optional, Callable, Iterable, Iterator, Generator, Sequence, Union
+from hashlib import sha256
+import pickle
+import math
+import os
+import time
 
 try:  # Assume we're a submodule in a package.
     from interfaces import (
         LeafConnectorInterface, StructInterface, Stream, RegularStream,
         ConnType, LoggingLevel, ItemType, StreamType, JoinType,
-        Context, Item, Name, FieldName, FieldNo, Links, Columns, OptionalFields, Array, ARRAY_TYPES,
+        Context, Item, Name, FieldName, FieldNo, Links, Columns, OptionalFields, Array,
+        ValueType, ARRAY_TYPES,
     )
     from base.functions.arguments import (
         get_names, get_name, get_generated_name,
@@ -13,12 +19,13 @@ try:  # Assume we're a submodule in a package.
     )
     from base.functions.errors import get_type_err_msg
     from base.constants.chars import EMPTY, ALL, CROP_SUFFIX, ITEMS_DELIMITER, SQL_INDENT
+    from base.constants.text import DEFAULT_ENCODING
     from utils.decorators import deprecated
     from functions.primary.text import remove_extra_spaces
     from content.fields.any_field import AnyField
     from content.selection.abstract_expression import (
         AbstractDescription,
-        SQL_FUNC_NAMES_DICT, SQL_TYPE_NAMES_DICT, CODE_HTML_STYLE,
+        SQL_FUNC_NAMES_DICT, SQL_TYPE_NAMES_DICT, CODE_HTML_STYLE, ALIAS_FUNCTION,
     )
     from content.selection.concrete_expression import AliasDescription
     from content.struct.flat_struct import FlatStruct
@@ -30,7 +37,8 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
     from ...interfaces import (
         LeafConnectorInterface, StructInterface, Stream, RegularStream,
         ConnType, LoggingLevel, ItemType, StreamType, JoinType,
-        Context, Item, Name, FieldName, FieldNo, Links, Columns, OptionalFields, Array, ARRAY_TYPES,
+        Context, Item, Name, FieldName, FieldNo, Links, Columns, OptionalFields, Array,
+        ValueType, ARRAY_TYPES,
     )
     from ...base.functions.arguments import (
         get_names, get_name, get_generated_name,
@@ -38,12 +46,13 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
     )
     from ...base.functions.errors import get_type_err_msg
     from ...base.constants.chars import EMPTY, ALL, CROP_SUFFIX, ITEMS_DELIMITER, SQL_INDENT
+    from ...base.constants.text import DEFAULT_ENCODING
     from ...utils.decorators import deprecated
     from ...functions.primary.text import remove_extra_spaces
     from ...content.fields.any_field import AnyField
     from ...content.selection.abstract_expression import (
         AbstractDescription,
-        SQL_FUNC_NAMES_DICT, SQL_TYPE_NAMES_DICT, CODE_HTML_STYLE,
+        SQL_FUNC_NAMES_DICT, SQL_TYPE_NAMES_DICT, CODE_HTML_STYLE, ALIAS_FUNCTION,
     )
     from ...content.selection.concrete_expression import AliasDescription
     from ...content.struct.flat_struct import FlatStruct
@@ -61,6 +70,11 @@ QUERY_SHEET_COLUMNS = ('no', LINE_NO_LEN), ('query', QUERY_LINE_LEN)
 IS_DEFINED = '{field} <> 0 and {field} NOT NULL'
 MSG_NOT_IMPL = '{method}() operation is not defined for SqlStream, try to use .to_record_stream().{method}() instead'
 MONOSPACE_HTML_STYLE = 'font-family: monospace'
+DEFAULT_CACHE_FOLDER = 'tmp'
+CACHE_FILE_TEMPLATE = 'sql_cache_{}.pickle'
+CACHE_TMP_SUFFIX = '.partial'
+SQL_QUOTE, SQL_ESCAPED_QUOTE = "'", "''"
+SQL_UNSAFE_CHARS = '\\'  # escaped differently in SQL dialects, strings with backslashes are filtered locally
 
 OUTPUT_STRUCT_COMPARISON_TAGS = dict(
     this_only='OUTPUT_ONLY', other_only='SOURCE_ONLY',
@@ -93,12 +107,18 @@ class SqlStream(WrapperStream):
             caption: str = EMPTY,
             source: TableOrQuery = None,
             context: Context = None,
+            use_cache: bool = False,
+            cache_ttl: Optional[float] = None,
+            cache_token: Optional[str] = None,
     ):
         if data is None:
             data = dict()
         if name is None:
             name = self._get_generated_name()
         self._count = None
+        self._use_cache = use_cache
+        self._cache_ttl = cache_ttl
+        self._cache_token = cache_token
         super().__init__(
             data=data, check=False,
             name=name, caption=caption,
@@ -135,9 +155,106 @@ class SqlStream(WrapperStream):
         return self.get_database().close()
 
     def execute_query(self, verbose: Optional[bool] = None) -> Iterable:
+        if self.is_cached():
+            cache_path = self.get_cache_path()
+            if self.has_actual_cache(cache_path):
+                return self._get_cached_rows(cache_path)
+            else:
+                rows = self._execute_query(verbose=verbose)
+                return self._get_caching_rows(rows, cache_path)
+        else:
+            return self._execute_query(verbose=verbose)
+
+    def _execute_query(self, verbose: Optional[bool] = None) -> Iterable:
         db = self.get_database()
         return db.execute(self.get_query(), get_data=True, verbose=verbose)
 
+    def cache(self, ttl: Optional[float] = None, token: Optional[str] = None) -> Native:
+        stream = self.copy()
+        assert isinstance(stream, SqlStream), get_type_err_msg(stream, expected=SqlStream, arg='stream')
+        stream._use_cache = True
+        stream._cache_ttl = ttl
+        stream._cache_token = token
+        return stream
+
+    def is_cached(self) -> bool:
+        return self._use_cache
+
+    def get_cache_ttl(self) -> Optional[float]:
+        return self._cache_ttl
+
+    def get_cache_token(self) -> Optional[str]:
+        return self._cache_token
+
+    def _get_connection_repr(self) -> str:
+        db = self.get_database()
+        db_class = db.__class__.__name__
+        host = getattr(db, 'host', EMPTY)
+        port = getattr(db, 'port', EMPTY)
+        db_name = getattr(db, 'db', get_name(db))
+        return f'{db_class}://{host}:{port}/{db_name}'
+
+    def get_cache_key(self) -> str:
+        token = self.get_cache_token()
+        key_parts = self._get_connection_repr(), self.get_one_line_query(), EMPTY if token is None else str(token)
+        key_str = '\n'.join(key_parts)
+        return sha256(key_str.encode(DEFAULT_ENCODING)).hexdigest()
+
+    def get_cache_path(self) -> str:
+        context = self.get_context()
+        if context:
+            folder_path = context.get_tmp_folder().get_path()
+        else:
+            folder_path = DEFAULT_CACHE_FOLDER
+        file_name = CACHE_FILE_TEMPLATE.format(self.get_cache_key())
+        return os.path.join(folder_path, file_name) if folder_path else file_name
+
+    def has_actual_cache(self, cache_path: Optional[str] = None) -> bool:
+        if cache_path is None:
+            cache_path = self.get_cache_path()
+        if not os.path.exists(cache_path):
+            return False
+        ttl = self.get_cache_ttl()
+        if ttl is None:
+            return True
+        else:
+            return time.time() - os.path.getmtime(cache_path) < ttl
+
+    def clear_cache(self) -> int:
+        cache_path = self.get_cache_path()
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+            return 1
+        else:
+            return 0
+
+    @staticmethod
+    def _get_cached_rows(cache_path: str) -> Generator:
+        with open(cache_path, 'rb') as f:
+            while True:
+                try:
+                    yield pickle.load(f)
+                except EOFError:
+                    break
+
+    @staticmethod
+    def _get_caching_rows(rows: Iterable, cache_path: str) -> Generator:
+        folder_path = os.path.dirname(cache_path)
+        if folder_path and not os.path.exists(folder_path):
+            os.makedirs(folder_path)
+        tmp_path = cache_path + CACHE_TMP_SUFFIX
+        is_finished = False
+        try:
+            with open(tmp_path, 'wb') as f:
+                for row in rows:
+                    pickle.dump(row, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    yield row
+            is_finished = True
+            os.replace(tmp_path, cache_path)  # only completely received results are published into cache
+        finally:
+            if not is_finished and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     def get_expressions_for(self, section: SqlSection) -> list:
         if section == SqlSection.From:
             return [self.get_source()]
@@ -233,7 +350,7 @@ class SqlStream(WrapperStream):
                 if len(expression) == 1:
                     value = expression[0]
                     if isinstance(value, FieldName):
-                        yield "{} = '{}'".format(target_field, value)
+                        yield "{} = '{}'".format(target_field, value.replace(SQL_QUOTE, SQL_ESCAPED_QUOTE))
                     elif isinstance(value, Callable):
                         func = value
                         if hasattr(func, 'get_sql_expr'):
@@ -342,7 +459,7 @@ class SqlStream(WrapperStream):
         query_lines = list()
         for section in SECTIONS_ORDER:
             lines = self.get_section_lines(section)
-            query_lines = list(self._format_section_lines(section, lines))
+            query_lines += list(self._format_section_lines(section, lines))
         if finish:
             query_lines += ';'
         return query_lines
@@ -388,6 +505,8 @@ class SqlStream(WrapperStream):
     def new(self, **kwargs):
         if 'source' not in kwargs:
             kwargs['source'] = self
+        if 'use_cache' not in kwargs:
+            kwargs.update(use_cache=self.is_cached(), cache_ttl=self.get_cache_ttl(), cache_token=self.get_cache_token())
         return self.__class__(**kwargs)
 
     def copy(self) -> Native:
@@ -395,32 +514,167 @@ class SqlStream(WrapperStream):
         stream = self.make_new(data)
         return self._assume_native(stream)
 
+    @staticmethod
+    def _is_sql_function(function: Callable, fields_count: int = 1) -> bool:
+        if hasattr(function, 'get_sql_expr'):
+            return True
+        elif fields_count == 1:
+            function_name = getattr(function, '__name__', None)
+            return function_name in SQL_TYPE_NAMES_DICT or function_name in SQL_FUNC_NAMES_DICT
+        else:
+            return False
+
+    @staticmethod
+    def _is_field(field) -> bool:
+        return isinstance(field, (FieldName, AnyField))
+
+    def is_sql_compatible(self, expression, section: SqlSection = SqlSection.Select) -> bool:
+        if self._is_field(expression):
+            return True
+        elif isinstance(expression, AliasDescription):
+            return self._is_field(expression.get_source_field())
+        elif isinstance(expression, AbstractDescription):
+            input_fields = list(expression.get_input_fields())
+            if not input_fields or not min([self._is_field(f) for f in input_fields]):
+                return False
+            function = expression.get_function()
+            if getattr(function, '__name__', None) == ALIAS_FUNCTION:
+                return len(input_fields) == 1
+            return self._is_sql_function(function, fields_count=len(input_fields))
+        elif isinstance(expression, ARRAY_TYPES) and len(expression) > 1:
+            target_field, *expression = expression
+            if not self._is_field(target_field):
+                return False
+            if section == SqlSection.Where:
+                if len(expression) == 1:
+                    value = expression[0]
+                    if isinstance(value, Callable):
+                        return hasattr(value, 'get_sql_expr')
+                    else:
+                        return self._is_sql_literal(target_field, value)
+                else:
+                    return False
+            elif len(expression) == 1:
+                return self._is_field(expression[0])
+            elif isinstance(expression[0], Callable):
+                function, *fields = expression
+            elif isinstance(expression[-1], Callable):
+                *fields, function = expression
+            else:
+                return False
+            if min([self._is_field(f) for f in fields]):
+                return self._is_sql_function(function, fields_count=len(fields))
+        return False
+
+    def _get_input_value_type(self, field) -> Optional[ValueType]:
+        input_struct = self.get_input_struct(skip_missing=True)
+        if input_struct:
+            return input_struct.get_types_dict().get(get_name(field))
+
+    def _is_sql_literal(self, field, value) -> bool:
+        """Checks that SQL compares value with field as local filter does, so this condition can be pushed down.
+        Values are compared only with fields of known compatible type, strings with backslashes are not pushed down.
+        """
+        value_type = self._get_input_value_type(field)
+        if value_type in (None, ValueType.Any) or not ValueType(value_type).isinstance(value):
+            return False
+        elif isinstance(value, str):
+            return not any(c in value for c in SQL_UNSAFE_CHARS)
+        elif isinstance(value, float):
+            return math.isfinite(value)
+        else:
+            return isinstance(value, (int, bool))
+
+    def _get_expressions_list(self, *fields, **expressions) -> list:
+        list_expressions = list(fields)
+        for target, source in expressions.items():
+            if isinstance(source, ARRAY_TYPES):
+                list_expressions.append((target, *source))
+            else:
+                list_expressions.append((target, source))
+        return list_expressions
+
+    def _get_input_field_names(self, expression) -> Optional[list]:
+        if self._is_field(expression):
+            return [get_name(expression)]
+        elif isinstance(expression, AbstractDescription):
+            input_fields = list(expression.get_input_fields())
+            if input_fields and min([self._is_field(f) for f in input_fields]):
+                return get_names(input_fields)
+        elif isinstance(expression, ARRAY_TYPES) and len(expression) > 1:
+            fields = [f for f in expression[1:] if not isinstance(f, Callable)]
+            if fields and min([self._is_field(f) for f in fields]):
+                return get_names(fields)
+        return None
+
+    @staticmethod
+    def _get_output_field_name(expression) -> Name:
+        if isinstance(expression, AbstractDescription):
+            return expression.get_target_field_name()
+        elif isinstance(expression, ARRAY_TYPES):
+            return get_name(expression[0])
+        else:
+            return get_name(expression)
+
     def select(self, *fields, **expressions) -> Native:
+        list_expressions = self._get_expressions_list(*fields, **expressions)
+        local_expressions = [e for e in list_expressions if not self.is_sql_compatible(e, SqlSection.Select)]
+        if local_expressions:
+            return self._select_with_pushdown(list_expressions)
         select_section = self.get_expressions_for(SqlSection.Select)
         if select_section:
-            return self.new().select(*fields, **expressions)
+            return self.new().select(*list_expressions)
         else:
             stream = self.copy()
             assert isinstance(stream, SqlStream) or hasattr(stream, 'add_expression_for'), f'got {stream}'
-            list_expressions = list(fields)
-            for target, source in expressions.items():
-                if isinstance(source, ARRAY_TYPES):
-                    list_expressions.append((target, *source))
-                else:
-                    list_expressions.append((target, source))
             for expression in list_expressions:
                 stream.add_expression_for(SqlSection.Select, expression)
             return stream
 
+    def _select_with_pushdown(self, list_expressions: list) -> RegularStream:
+        sql_expressions, local_expressions = list(), list()
+        for expression in list_expressions:
+            if self.is_sql_compatible(expression, SqlSection.Select):
+                sql_expressions.append(expression)
+                if expression == ALL:
+                    local_expressions.append(ALL)
+                else:
+                    local_expressions.append(self._get_output_field_name(expression))
+            else:
+                local_expressions.append(expression)
+        if ALL not in sql_expressions:
+            sql_output_fields = [self._get_output_field_name(e) for e in sql_expressions]
+            for expression in list_expressions:
+                if not self.is_sql_compatible(expression, SqlSection.Select):
+                    input_fields = self._get_input_field_names(expression)
+                    if input_fields is None:  # expression needs the whole item, can not prune any columns
+                        sql_expressions, local_expressions = list(), list_expressions
+                        break
+                    for field in input_fields:
+                        if field not in sql_output_fields:
+                            sql_expressions.append(field)
+                            sql_output_fields.append(field)
+        stream = self.select(*sql_expressions) if sql_expressions else self
+        return stream.to_records().select(*local_expressions)
+
     def filter(self, *fields, **expressions) -> Native:
-        if self.has_any_section():
-            return self.new().filter(*fields, **expressions)
+        list_expressions = list(fields) + [(field, value) for field, value in expressions.items()]
+        sql_expressions, local_expressions = list(), list()
+        for expression in list_expressions:
+            if self.is_sql_compatible(expression, SqlSection.Where):
+                sql_expressions.append(expression)
+            else:
+                local_expressions.append(expression)
+        if local_expressions:
+            stream = self.filter(*sql_expressions) if sql_expressions else self
+            return stream.to_records().filter(*local_expressions)
+        elif self.has_any_section():
+            return self.new().filter(*list_expressions)
         else:
             stream = self.copy()
             assert isinstance(stream, SqlStream) or hasattr(stream, 'add_expression_for'), f'got {stream}'
-            list_expressions = list(fields) + [(field, value) for field, value in expressions.items()]
-            for expressions in list_expressions:
-                stream.add_expression_for(SqlSection.Where, expressions)
+            for expression in list_expressions:
+                stream.add_expression_for(SqlSection.Where, expression)
             return stream
 
     def group_by(self, *fields, values: Optional[list] = None) -> Native:
@@ -586,6 +840,8 @@ class SqlStream(WrapperStream):
             stream_class = StreamBuilder.get_default_stream_class()
             meta = self.get_compatible_meta(stream_class, ex=ex)
             meta.update(kwargs)
+            if 'item_type' not in meta and isinstance(item_type, ItemType):
+                meta['item_type'] = item_type
             if 'count' not in meta:
                 meta['count'] = self.get_count()
             if 'source' not in meta:
@@ -5,6 +5,7 @@ try:  # Assume we're a submodule in a package.
     from functions import func_tests
     from series import series_tests
     from streams import stream_tests
+    from utils import utils_tests
 except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
     from .entities import entities_tests
     from .content import content_tests
@@ -12,6 +13,7 @@ except ImportError:  # Apparently no higher-level package has been imported, fal
     from .functions import func_tests
     from .series import series_tests
     from .streams import stream_tests
+    from .utils import utils_tests
 
 
 def main():
@@ -21,6 +23,7 @@ def main():
     func_tests.main()
     series_tests.main()
     stream_tests.main()
+    utils_tests.main()
 
 
 if __name__ == '__main__':
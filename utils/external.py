@@ -1,52 +1,122 @@
-from typing import NoReturn
+from typing import NoReturn, Any
+from importlib import import_module
+from importlib.util import find_spec
 import warnings
 
-try:  # Assume NumPy installed
+try:  # Assume NumPy installed (it is light and used for module-level types, so it is imported eagerly)
     import numpy as np
 except ImportError:
     np = None
 
-try:  # Assume SciPy installed
-    import scipy as sp
-    from scipy import stats
-    from scipy import interpolate
-except ImportError:
-    sp = None
-    stats = None
-    interpolate = None
-
-try:  # Assume Pandas installed
-    import pandas as pd
-except ImportError:
-    pd = None
 
-try:  # Assume MatPlotLib installed
-    from matplotlib import (
-        pyplot as plt,
-        patches as mp,
-    )
-except ImportError:
-    plt = None
-    mp = None
-
-try:  # Assume psycopg2 installed
-    import psycopg2
-    import psycopg2.extras
-except ImportError:
-    psycopg2 = None
-
-try:  # Assume boto3 installed
-    import boto3
-    import botocore.client as boto_core_client
-except ImportError:
-    boto3 = None
-    boto_core_client = None
-
-
-try:  # Assume IPython installed
-    from IPython.core.display import display, clear_output, Markdown, HTML
-except ImportError:
-    display, clear_output, Markdown, HTML = print, None, None, None
+def is_installed(module_name: str) -> bool:
+    """Checks availability of module without importing it (only top-level package is located)."""
+    try:
+        return find_spec(module_name.split('.')[0]) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyModule:
+    """Proxy of optional heavy library, imports it on first access to its attributes (not on import of snakee).
+
+    Proxy is falsy when library is not installed, so checks like "if pd:" work without importing it.
+    """
+
+    def __init__(self, module_name: str, *submodules: str):
+        self._module_name = module_name
+        self._submodules = submodules
+        self._module = None
+        self._is_installed = None
+
+    def get_module_name(self) -> str:
+        return self._module_name
+
+    def is_installed(self) -> bool:
+        if self._is_installed is None:
+            self._is_installed = is_installed(self.get_module_name())
+        return self._is_installed
+
+    def is_loaded(self) -> bool:
+        return self._module is not None
+
+    def get_module(self):
+        if self._module is None:
+            if not self.is_installed():
+                raise_import_error(self.get_module_name())
+            module = import_module(self.get_module_name())
+            for submodule in self._submodules:
+                import_module(submodule)
+            self._module = module
+        return self._module
+
+    def __getattr__(self, name: str):
+        if name.startswith('__'):  # i.e. __wrapped__ or __func__ requested by inspect
+            raise AttributeError(name)
+        return getattr(self.get_module(), name)
+
+    def __bool__(self) -> bool:
+        return self.is_installed()
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({repr(self.get_module_name())})'
+
+
+class LazyAttribute:
+    """Proxy of class or function from optional library, can be called or used in isinstance()."""
+
+    def __init__(self, module: LazyModule, name: str, default: Any = None):
+        self._lazy_module = module
+        self._name = name
+        self._default = default
+        self._object = None
+
+    def get_object(self):
+        if self._object is None:
+            if self._lazy_module.is_installed():
+                self._object = getattr(self._lazy_module.get_module(), self._name)
+            else:
+                return self._default
+        return self._object
+
+    def __call__(self, *args, **kwargs):
+        obj = self.get_object()
+        if obj is None:
+            raise_import_error(self._lazy_module.get_module_name())
+        return obj(*args, **kwargs)
+
+    def __instancecheck__(self, instance) -> bool:
+        obj = self.get_object()
+        return obj is not None and isinstance(instance, obj)
+
+    def __getattr__(self, name: str):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.get_object(), name)
+
+    def __bool__(self) -> bool:
+        return self._lazy_module.is_installed() or bool(self._default)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({repr(self._lazy_module.get_module_name())}, {repr(self._name)})'
+
+
+sp = LazyModule('scipy')
+stats = LazyModule('scipy.stats')
+interpolate = LazyModule('scipy.interpolate')
+pd = LazyModule('pandas')
+plt = LazyModule('matplotlib.pyplot')
+mp = LazyModule('matplotlib.patches')
+psycopg2 = LazyModule('psycopg2', 'psycopg2.extras')
+boto3 = LazyModule('boto3')
+boto_core_client = LazyModule('botocore.client')
+requests = LazyModule('requests')
+
+_ipython_display = LazyModule('IPython.core.display')
+display = LazyAttribute(_ipython_display, 'display', default=print)
+clear_output = LazyAttribute(_ipython_display, 'clear_output')
+Markdown = LazyAttribute(_ipython_display, 'Markdown')
+HTML = LazyAttribute(_ipython_display, 'HTML')
 
 
 class FallbackFake:
@@ -63,7 +133,8 @@ class FallbackDataframe(FallbackFake):
 
 
 _use_objects_for_output = True
-DataFrame = pd.DataFrame if pd else FallbackDataframe  # will be reset in set_use_objects_for_output()
+PandasDataFrame = LazyAttribute(pd, 'DataFrame')
+DataFrame = PandasDataFrame if pd else FallbackDataframe  # will be reset in set_use_objects_for_output()
 
 
 def get_use_objects_for_output() -> bool:
@@ -76,7 +147,7 @@ def set_use_objects_for_output(use_objects_for_output: bool):
     global DataFrame
     _use_objects_for_output = use_objects_for_output
     if pd and use_objects_for_output:
-        DataFrame = pd.DataFrame
+        DataFrame = PandasDataFrame
     else:
         DataFrame = FallbackDataframe
 
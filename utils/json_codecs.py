@@ -0,0 +1,148 @@
+from typing import Callable, Iterable, Union, Any
+import json
+
+try:  # Assume orjson installed
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # Assume ujson installed
+    import ujson
+except ImportError:
+    ujson = None
+
+STDLIB_CODEC = 'json'
+FASTEST_CODEC = 'fastest'  # alias of the fastest installed codec
+FAST_CODECS_PRIORITY = 'orjson', 'ujson'
+DEFAULT_BATCH_SIZE = 1000
+
+Line = Union[str, bytes]
+
+
+class JsonCodec:
+    """Pair of JSON functions with common error semantics.
+
+    Decode errors of any library are converted to json.JSONDecodeError,
+    so callers can catch the same exception whichever codec is used.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            loads: Callable,
+            dumps: Callable,
+            decode_errors: tuple = (ValueError, ),
+            dumps_to_bytes: bool = False,
+    ):
+        self._name = name
+        self._loads = loads
+        self._dumps = dumps
+        self._decode_errors = decode_errors
+        self._dumps_to_bytes = dumps_to_bytes
+
+    def get_name(self) -> str:
+        return self._name
+
+    def dumps(self, obj: Any, *args, **kwargs) -> str:
+        if args or kwargs:  # options of json.dumps() are supported by stdlib only
+            return json.dumps(obj, *args, **kwargs)
+        try:
+            dumped = self._dumps(obj)
+        except TypeError:  # i.e. integer out of 64-bit range, stdlib raises the same error for unsupported types
+            return json.dumps(obj)
+        if self._dumps_to_bytes:
+            dumped = dumped.decode()
+        return dumped
+
+    def _raise_decode_error(self, err: Exception, line: Line):
+        if isinstance(err, json.JSONDecodeError):
+            raise json.JSONDecodeError(err.msg, err.doc, err.pos)
+        else:
+            doc = line.decode() if isinstance(line, bytes) else str(line)
+            raise json.JSONDecodeError(f'{self.get_name()}: {err}', doc, 0)
+
+    def loads(self, line: Line, default: Any = None, skip_errors: bool = False) -> Any:
+        """Parses one JSON-document, on error returns default (if defined), None (if skip_errors) or raises."""
+        try:
+            return self._loads(line)
+        except self._decode_errors as err:
+            if default is not None:
+                return default
+            elif not skip_errors:
+                self._raise_decode_error(err, line)
+
+    def loads_batch(self, lines: Iterable[Line], default: Any = None, skip_errors: bool = False) -> list:
+        """Parses every line as separate JSON-document, result and errors are the same as from loads() for every line.
+
+        Lines are not joined into one JSON-array: document broken across lines (i.e. '[1' and '2]')
+        would be parsed as valid array, so every line is parsed separately.
+        """
+        loads, decode_errors = self._loads, self._decode_errors
+        parsed = list()
+        for line in lines:
+            try:
+                parsed.append(loads(line))
+            except decode_errors:
+                parsed.append(self.loads(line, default=default, skip_errors=skip_errors))
+        return parsed
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({repr(self.get_name())})'
+
+
+_codecs = dict()
+_default_codec_name = STDLIB_CODEC
+
+
+def register_json_codec(codec: JsonCodec) -> JsonCodec:
+    _codecs[codec.get_name()] = codec
+    return codec
+
+
+def get_json_codec_names() -> list:
+    return list(_codecs)
+
+
+def get_fastest_json_codec() -> JsonCodec:
+    for name in FAST_CODECS_PRIORITY:
+        if name in _codecs:
+            return _codecs[name]
+    return _codecs[STDLIB_CODEC]
+
+
+def get_json_codec(name: Union[str, JsonCodec, None] = None) -> JsonCodec:
+    if isinstance(name, JsonCodec):
+        return name
+    if name is None:
+        name = _default_codec_name
+    if name == FASTEST_CODEC:
+        return get_fastest_json_codec()
+    if name not in _codecs:
+        raise ValueError(f'get_json_codec(): expected one of {get_json_codec_names()}, got {name}')
+    return _codecs[name]
+
+
+def get_default_json_codec() -> JsonCodec:
+    return get_json_codec()
+
+
+def set_default_json_codec(name: Union[str, JsonCodec]) -> JsonCodec:
+    """Sets codec used by JsonFormat and json-functions, i.e. set_default_json_codec('fastest')."""
+    global _default_codec_name
+    codec = get_json_codec(name)
+    if codec.get_name() not in _codecs:
+        register_json_codec(codec)
+    _default_codec_name = codec.get_name()
+    return codec
+
+
+register_json_codec(JsonCodec(STDLIB_CODEC, loads=json.loads, dumps=json.dumps))
+if orjson:
+    register_json_codec(JsonCodec(
+        'orjson',
+        loads=orjson.loads,
+        dumps=lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+        dumps_to_bytes=True,
+    ))
+if ujson:
+    register_json_codec(JsonCodec('ujson', loads=ujson.loads, dumps=ujson.dumps))
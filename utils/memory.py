@@ -0,0 +1,151 @@
+from typing import Optional, Iterable, Sequence
+from itertools import islice
+from threading import Lock
+import sys
+import os
+
+BYTES_IN_MB = 1024 * 1024
+DEFAULT_MEMORY_BUDGET_BYTES = 1024 * BYTES_IN_MB  # used when size of physical memory is unknown
+DEFAULT_MEMORY_SHARE = 0.25  # part of physical memory available for in-memory operations
+DEFAULT_SAMPLE_SIZE = 100
+MAX_DEPTH = 8
+ATOMIC_TYPES = str, bytes, bytearray, int, float, bool, type(None)
+
+
+def get_deep_size(obj, max_depth: int = MAX_DEPTH, _seen: Optional[set] = None) -> int:
+    """Estimates memory size of object in bytes, including sizes of nested containers and their items.
+
+    Objects shared between items are counted once.
+    """
+    if _seen is None:
+        _seen = set()
+    obj_id = id(obj)
+    if obj_id in _seen:
+        return 0
+    _seen.add(obj_id)
+    size = sys.getsizeof(obj)
+    if max_depth <= 0 or isinstance(obj, ATOMIC_TYPES):
+        return size
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            size += get_deep_size(k, max_depth - 1, _seen) + get_deep_size(v, max_depth - 1, _seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for i in obj:
+            size += get_deep_size(i, max_depth - 1, _seen)
+    elif hasattr(obj, '__dict__'):
+        size += get_deep_size(obj.__dict__, max_depth - 1, _seen)
+    elif hasattr(obj, '__slots__'):
+        for slot in obj.__slots__:
+            if hasattr(obj, slot):
+                size += get_deep_size(getattr(obj, slot), max_depth - 1, _seen)
+    return size
+
+
+def get_sample(items: Iterable, sample_size: int = DEFAULT_SAMPLE_SIZE) -> list:
+    if isinstance(items, Sequence):  # evenly spaced items of list give better estimation than the first ones
+        count = len(items)
+        if count <= sample_size:
+            return list(items)
+        step = count / sample_size
+        return [items[int(n * step)] for n in range(sample_size)]
+    else:
+        return list(islice(items, sample_size))
+
+
+def get_item_size(items: Iterable, sample_size: int = DEFAULT_SAMPLE_SIZE) -> Optional[int]:
+    """Estimates mean memory size of one item (in bytes) by deep size of sampled items."""
+    sample = get_sample(items, sample_size=sample_size)
+    if sample:
+        total_size = sum(get_deep_size(i) for i in sample)
+        return max(round(total_size / len(sample)), 1)
+
+
+def get_physical_memory() -> Optional[int]:
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+    except (AttributeError, ValueError, OSError):  # not available on Windows
+        return None
+
+
+def get_default_budget_bytes() -> int:
+    physical_memory = get_physical_memory()
+    if physical_memory:
+        return int(physical_memory * DEFAULT_MEMORY_SHARE)
+    else:
+        return DEFAULT_MEMORY_BUDGET_BYTES
+
+
+class MemoryBudget:
+    """Shared limit of memory (in bytes) for in-memory operations (sort, join, collect).
+
+    Concurrent operations reserve parts of budget and release them after finish,
+    so every operation gets only the memory not used by others.
+    """
+
+    def __init__(self, total_bytes: Optional[int] = None):
+        if total_bytes is None:
+            total_bytes = get_default_budget_bytes()
+        self._total_bytes = total_bytes
+        self._reserved = dict()
+        self._lock = Lock()
+
+    def get_total_bytes(self) -> int:
+        return self._total_bytes
+
+    def set_total_bytes(self, total_bytes: int) -> None:
+        self._total_bytes = total_bytes
+
+    def get_reserved_bytes(self) -> int:
+        return sum(self._reserved.values())
+
+    def get_available_bytes(self) -> int:
+        return max(self.get_total_bytes() - self.get_reserved_bytes(), 0)
+
+    def get_items_count(self, item_size: Optional[int]) -> Optional[int]:
+        if item_size:
+            return self.get_available_bytes() // item_size
+
+    def reserve(self, size: int, key=None):
+        """Reserves up to size bytes from available budget, returns key for release() and reserved size."""
+        with self._lock:
+            size = min(size, self.get_available_bytes())
+            if key is None:
+                key = object()
+            self._reserved[key] = self._reserved.get(key, 0) + size
+        return key, size
+
+    def release(self, key) -> int:
+        with self._lock:
+            return self._reserved.pop(key, 0)
+
+    def reserved(self, size: int):
+        return _Reservation(self, size)
+
+    def __repr__(self):
+        total_mb = round(self.get_total_bytes() / BYTES_IN_MB)
+        available_mb = round(self.get_available_bytes() / BYTES_IN_MB)
+        return f'{self.__class__.__name__}(available={available_mb}MB, total={total_mb}MB)'
+
+
+class _Reservation:
+    def __init__(self, budget: MemoryBudget, size: int):
+        self._budget = budget
+        self._size = size
+        self._key = None
+
+    def __enter__(self) -> int:
+        self._key, size = self._budget.reserve(self._size)
+        return size
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._budget.release(self._key)
+
+
+_default_budget = None
+
+
+def get_default_budget() -> MemoryBudget:
+    global _default_budget
+    if _default_budget is None:
+        _default_budget = MemoryBudget()
+    return _default_budget
@@ -0,0 +1,133 @@
+from typing import Optional, Callable, Iterable, Iterator, Generator
+from threading import Thread, Event
+from queue import Queue, Empty, Full
+import codecs
+import io
+
+DEFAULT_BLOCK_SIZE = 1024 * 1024
+DEFAULT_QUEUE_DEPTH = 4
+PUT_TIMEOUT_SEC = 0.1  # producer checks stop-flag between attempts to put block into full queue
+JOIN_TIMEOUT_SEC = 5.0
+END_OF_BLOCKS = object()
+
+
+class ReadaheadBlocks:
+    """Iterator over blocks (i.e. bytes) produced by background thread while consumer processes previous blocks.
+
+    Queue is bounded by queue_depth blocks, so producer never reads far ahead of consumer.
+    Errors of producer are raised in consumer thread.
+    Thread is stopped and source is closed by close() (also called by context manager and after the last block).
+    """
+
+    def __init__(self, get_blocks: Callable, queue_depth: int = DEFAULT_QUEUE_DEPTH, name: Optional[str] = None):
+        self._get_blocks = get_blocks
+        self._queue = Queue(maxsize=max(queue_depth, 1))
+        self._stopped = Event()
+        self._error = None
+        self._finished = False
+        self._thread = Thread(target=self._produce, name=name, daemon=True)
+        self._thread.start()
+
+    def _put(self, item) -> bool:
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=PUT_TIMEOUT_SEC)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _produce(self) -> None:
+        blocks = None
+        try:
+            blocks = self._get_blocks()
+            for block in blocks:
+                if not self._put(block):
+                    break
+        except BaseException as e:  # re-raised in consumer thread
+            self._error = e
+        finally:
+            if hasattr(blocks, 'close'):
+                blocks.close()
+            self._put(END_OF_BLOCKS)
+
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._finished:
+            raise StopIteration
+        block = self._queue.get()
+        if block is END_OF_BLOCKS:
+            self.close()
+            if self._error is not None:
+                raise self._error
+            raise StopIteration
+        return block
+
+    def close(self) -> None:
+        self._finished = True
+        self._stopped.set()
+        while True:  # releases producer blocked on full queue
+            try:
+                self._queue.get_nowait()
+            except Empty:
+                break
+        self._thread.join(timeout=JOIN_TIMEOUT_SEC)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        if not self._finished:
+            self.close()
+
+
+def get_file_blocks(fileholder, block_size: int = DEFAULT_BLOCK_SIZE) -> Generator:
+    """Reads binary file (also gzip.GzipFile, so decompression is done by reading thread) and closes it after all."""
+    try:
+        yield from iter(lambda: fileholder.read(block_size), b'')
+    finally:
+        fileholder.close()
+
+
+def get_lines_from_blocks(blocks: Iterable[bytes], encoding: str = 'utf8', universal_newlines: bool = True) -> Generator:
+    """Splits decoded blocks into lines (without line endings), multibyte chars and line endings can cross blocks.
+
+    Undecodable bytes raise UnicodeDecodeError, as reading of text file without readahead does.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors='strict')
+    if universal_newlines:
+        decoder = io.IncrementalNewlineDecoder(decoder, translate=True)
+    tail = ''
+    for block in blocks:
+        lines = (tail + decoder.decode(block)).split('\n')
+        tail = lines.pop()
+        yield from lines
+    tail += decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+def get_readahead_lines(
+        get_blocks: Callable,
+        queue_depth: int = DEFAULT_QUEUE_DEPTH,
+        encoding: str = 'utf8',
+        universal_newlines: bool = True,
+        name: Optional[str] = None,
+) -> Iterator[str]:
+    """Yields lines from blocks read in background thread.
+
+    Reading is stopped when generator is closed (i.e. consumer stopped after take() or stream was closed).
+    """
+    blocks = ReadaheadBlocks(get_blocks, queue_depth=queue_depth, name=name)
+    try:
+        yield from get_lines_from_blocks(blocks, encoding=encoding, universal_newlines=universal_newlines)
+    finally:
+        blocks.close()
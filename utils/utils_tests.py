@@ -0,0 +1,62 @@
+import os
+import sys
+import subprocess
+
+try:  # Assume we're a submodule in a package.
+    from utils import external
+except ImportError:  # Apparently no higher-level package has been imported, fall back to a local import.
+    from . import external
+
+PACKAGE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENTRY_POINTS = 'context', 'interfaces', 'streams.stream_classes', 'connectors.connector_classes'
+HEAVY_MODULES = 'pandas', 'scipy', 'matplotlib', 'boto3', 'botocore', 'psycopg2', 'IPython', 'requests'
+MAX_IMPORT_TIME_SEC = 3.0  # generous limit for slow CI machines, imports take about 0.5 sec
+
+
+def _get_import_times(entry_point: str) -> dict:
+    if __package__ and '.' in __package__:  # imported as submodule of package, i.e. snakee.utils.utils_tests
+        package_name = __package__.split('.')[0]
+        cwd, module = os.path.dirname(PACKAGE_PATH), f'{package_name}.{entry_point}'
+    else:
+        cwd, module = PACKAGE_PATH, entry_point
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=cwd, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    import_times = dict()
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, name = line.split('|')
+            if cumulative.strip().isdigit():
+                import_times[name.strip()] = int(cumulative) / 1e6
+    return import_times
+
+
+def test_lazy_external():
+    pd = external.LazyModule('pandas')
+    assert not pd.is_loaded(), 'test case 0: module must not be imported before use'
+    assert bool(pd) == external.is_installed('pandas'), 'test case 1'
+    missing = external.LazyModule('snakee_missing_module')
+    assert not missing, 'test case 2: proxy of missing module must be falsy'
+    default_display = external.LazyAttribute(missing, 'display', default=print)
+    assert default_display.get_object() is print, 'test case 3'
+    assert not isinstance(1, external.LazyAttribute(missing, 'DataFrame')), 'test case 4'
+
+
+def test_import_time():
+    for entry_point in ENTRY_POINTS:
+        import_times = _get_import_times(entry_point)
+        heavy_modules = [m for m in import_times if m.split('.')[0] in HEAVY_MODULES]
+        assert not heavy_modules, f'{entry_point} imports heavy modules eagerly: {heavy_modules}'
+        total_time = max(import_times.values())
+        assert total_time < MAX_IMPORT_TIME_SEC, f'import of {entry_point} takes {total_time:.3f} sec'
+
+
+def main():
+    test_lazy_external()
+    test_import_time()
+
+
+if __name__ == '__main__':
+    main()